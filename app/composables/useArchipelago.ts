@@ -1,6 +1,6 @@
 import type { Client, Item } from 'archipelago.js';
 import { clientStatuses, itemsHandlingFlags } from 'archipelago.js';
-import { useArchipelagoItems, AP_LOCATIONS } from './useArchipelagoItems';
+import { useArchipelagoItems, applySlotTables, AP_LOCATIONS } from './useArchipelagoItems';
 import type { ConnectionStatus, MessageLogEntry } from '~/utils/types';
 import { DEATH_LINK_COOLDOWN_MS, MAX_MESSAGE_LOG_ENTRIES } from '~/utils/constants';
 
@@ -224,8 +224,11 @@ export function useArchipelago() {
       // Store slot data for use by items composable
       slotData.value = receivedSlotData as Record<string, any>;
 
-      // Apply slot data settings if needed
-      // TODO: Add Blockudoku-specific slot data handling here
+      // Milestone and location tables for this slot (cached by content hash)
+      const tables = applySlotTables(slotData.value.tables);
+      if (tables) {
+        console.log('[AP → Client] Slot tables', tables.hash, 'with', tables.locations.size, 'locations');
+      }
 
       status.value = 'connected';
       lastMessage.value = 'Connected!';
@@ -298,8 +301,8 @@ export function useArchipelago() {
     }
   }
 
-  function handleItemReceived(itemId: number): string | null {
-    const result = items.receiveItem(itemId);
+  function handleItemReceived(itemId: number, log = true): string | null {
+    const result = items.receiveItem(itemId, log);
     if (result) {
       const itemName = items.getItemName(itemId);
       lastMessage.value = `Received item: ${itemName}`;
@@ -393,7 +396,7 @@ export function useArchipelago() {
 
   // Debug function to simulate receiving an item (for testing)
   function debugReceiveItem(itemId: number) {
-    const itemName = handleItemReceived(itemId);
+    const itemName = handleItemReceived(itemId, false);
     if (itemName) {
       addLogMessage(`[DEBUG] Received: ${itemName}`, 'item');
     }
@@ -432,8 +435,8 @@ export function useArchipelago() {
           localStorage.setItem('blockupelago_ap_highestItemIndex', i.toString());
         }
 
-        // Process the item
-        const itemName = handleItemReceived(item.id);
+        // Process the item; a resync replays old receipts, so keep them out of the item log
+        const itemName = handleItemReceived(item.id, false);
         if (itemName) {
           addLogMessage(`Resynced: ${itemName}`, 'item');
         }
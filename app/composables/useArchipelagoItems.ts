@@ -10,6 +10,7 @@ import { usePersistentRef } from './usePersistence';
 // ============================================
 // ITEM IDS - Must match APWorld Items.py
 // ============================================
+// @generated items begin - edit apworld/generate_data.py, then run it
 export const AP_ITEMS = {
   // Piece Types (8000xxx)
   SINGLE_BLOCK: 8000001,
@@ -43,6 +44,11 @@ export const AP_ITEMS = {
   MIRROR_ABILITY: 8003005,
   SHRINK_ABILITY: 8003006,
 
+  // Permanent Abilities (80031xx)
+  PERMANENT_FREE_ROTATE: 8003101,
+  PERMANENT_FREE_MIRROR: 8003102,
+  PERMANENT_FREE_HOLD: 8003103,
+
   // Score Multipliers (8004xxx)
   SCORE_MULT_10: 8004001,
   SCORE_MULT_25: 8004002,
@@ -80,10 +86,14 @@ export const ITEM_NAME_TO_ID: Record<string, number> = {
   'Hold Ability': AP_ITEMS.HOLD_ABILITY,
   'Mirror Ability': AP_ITEMS.MIRROR_ABILITY,
   'Shrink Ability': AP_ITEMS.SHRINK_ABILITY,
+  'Permanent Free Rotate': AP_ITEMS.PERMANENT_FREE_ROTATE,
+  'Permanent Free Mirror': AP_ITEMS.PERMANENT_FREE_MIRROR,
+  'Permanent Free Hold': AP_ITEMS.PERMANENT_FREE_HOLD,
   'Score Multiplier +10%': AP_ITEMS.SCORE_MULT_10,
   'Score Multiplier +25%': AP_ITEMS.SCORE_MULT_25,
   'Score Multiplier +50%': AP_ITEMS.SCORE_MULT_50,
 };
+// @generated items end
 
 // Reverse mapping: item ID to item name
 export const ITEM_ID_TO_NAME: Record<number, string> = Object.fromEntries(Object.entries(ITEM_NAME_TO_ID).map(([name, id]) => [id, name]));
@@ -96,12 +106,13 @@ export function getItemName(itemId: number): string {
 // ============================================
 // LOCATION IDS - Must match APWorld Locations.py
 // ============================================
+// @generated locations begin - edit apworld/generate_data.py, then run it
 export const AP_LOCATIONS = {
   SCORE_BASE: 9000000, // +1-20
   LINE_CLEAR_BASE: 9001000, // +1-30
   BOX_CLEAR_BASE: 9002000, // +1-20
   PIECES_BASE: 9004000, // +1-25
-  GEM_BASE: 9005000, // +1-100 (individual gems)
+  GEM_BASE: 9005000, // +1-100
 } as const;
 
 // Milestone arrays
@@ -121,32 +132,132 @@ export const PIECE_MILESTONES = [
 
 // Max individual gem checks (each gem collected = 1 check)
 export const MAX_GEM_CHECKS = 100;
+// @generated locations end
+
+// ============================================
+// SLOT DATA TABLES - Must match APWorld SlotData.py
+// ============================================
+export const SLOT_TABLES_VERSION = 1;
+const SLOT_TABLES_CACHE_KEY = 'blockupelago_ap_slotTables';
+
+// slot_data.tables as sent by the APWorld (see SlotData.py for the encoding)
+export interface EncodedSlotTables {
+  v: number;
+  hash: string;
+  milestones: Record<string, number[]>;
+  locations: number[];
+  items: number[];
+}
+
+export interface SlotTables {
+  hash: string;
+  milestones: Record<string, number[]>;
+  locations: Set<number>;
+  items: number[];
+}
+
+// [first, count, ...] runs of consecutive IDs
+function decodeRuns(runs: number[]): number[] {
+  const ids: number[] = [];
+  for (let i = 0; i + 1 < runs.length; i += 2) {
+    for (let offset = 0; offset < runs[i + 1]!; offset++) ids.push(runs[i]! + offset);
+  }
+  return ids;
+}
+
+// [delta, repeat, ...] run-length encoded threshold deltas
+function decodeDeltas(encoded: number[]): number[] {
+  const thresholds: number[] = [];
+  let value = 0;
+  for (let i = 0; i + 1 < encoded.length; i += 2) {
+    for (let r = 0; r < encoded[i + 1]!; r++) {
+      value += encoded[i]!;
+      thresholds.push(value);
+    }
+  }
+  return thresholds;
+}
+
+export function decodeSlotTables(encoded: EncodedSlotTables): SlotTables | null {
+  if (encoded?.v !== SLOT_TABLES_VERSION) return null;
+  const milestones: Record<string, number[]> = {};
+  for (const [category, values] of Object.entries(encoded.milestones)) {
+    milestones[category] = decodeDeltas(values);
+  }
+  return { hash: encoded.hash, milestones, locations: new Set(decodeRuns(encoded.locations)), items: decodeRuns(encoded.items) };
+}
+
+// Tables of the connected slot; null when not connected or the world sent none,
+// in which case the constants above are used and every location is active
+let activeTables: SlotTables | null = null;
+
+function loadCachedTables(hash: string): SlotTables | null {
+  if (!import.meta.client) return null;
+  try {
+    const cached = JSON.parse(localStorage.getItem(SLOT_TABLES_CACHE_KEY) || 'null');
+    if (cached?.hash !== hash) return null;
+    return { ...cached, locations: new Set(cached.locations) };
+  } catch {
+    return null;
+  }
+}
+
+function storeCachedTables(tables: SlotTables) {
+  if (!import.meta.client) return;
+  localStorage.setItem(SLOT_TABLES_CACHE_KEY, JSON.stringify({ ...tables, locations: Array.from(tables.locations) }));
+}
+
+// Use slot_data.tables for milestone lookups; decoded tables are cached by hash,
+// so reconnecting to the same slot skips decoding
+export function applySlotTables(encoded: EncodedSlotTables | undefined): SlotTables | null {
+  if (!encoded) {
+    activeTables = null;
+    return null;
+  }
+  let tables = loadCachedTables(encoded.hash);
+  if (!tables) {
+    tables = decodeSlotTables(encoded);
+    if (tables) storeCachedTables(tables);
+  }
+  activeTables = tables;
+  return tables;
+}
+
+// Whether a location exists for this slot (milestone pruning can leave some out)
+export function isLocationActive(locationId: number): boolean {
+  return !activeTables || activeTables.locations.has(locationId);
+}
+
+function milestoneLocationId(category: string, fallback: number[], base: number, value: number): number | null {
+  const thresholds = activeTables?.milestones[category] ?? fallback;
+  const idx = thresholds.indexOf(value);
+  if (idx < 0) return null;
+  const locationId = base + idx + 1;
+  return isLocationActive(locationId) ? locationId : null;
+}
 
 // Helper to get location ID for a milestone
 export function getScoreLocationId(score: number): number | null {
-  const idx = SCORE_MILESTONES.indexOf(score);
-  return idx >= 0 ? AP_LOCATIONS.SCORE_BASE + idx + 1 : null;
+  return milestoneLocationId('score', SCORE_MILESTONES, AP_LOCATIONS.SCORE_BASE, score);
 }
 
 export function getLineClearLocationId(clears: number): number | null {
-  const idx = LINE_CLEAR_MILESTONES.indexOf(clears);
-  return idx >= 0 ? AP_LOCATIONS.LINE_CLEAR_BASE + idx + 1 : null;
+  return milestoneLocationId('line_clear', LINE_CLEAR_MILESTONES, AP_LOCATIONS.LINE_CLEAR_BASE, clears);
 }
 
 export function getBoxClearLocationId(clears: number): number | null {
-  const idx = BOX_CLEAR_MILESTONES.indexOf(clears);
-  return idx >= 0 ? AP_LOCATIONS.BOX_CLEAR_BASE + idx + 1 : null;
+  return milestoneLocationId('box_clear', BOX_CLEAR_MILESTONES, AP_LOCATIONS.BOX_CLEAR_BASE, clears);
 }
 
 export function getPieceLocationId(pieces: number): number | null {
-  const idx = PIECE_MILESTONES.indexOf(pieces);
-  return idx >= 0 ? AP_LOCATIONS.PIECES_BASE + idx + 1 : null;
+  return milestoneLocationId('piece', PIECE_MILESTONES, AP_LOCATIONS.PIECES_BASE, pieces);
 }
 
 export function getGemLocationId(gemNumber: number): number | null {
   // Each gem gets its own check, up to MAX_GEM_CHECKS
   if (gemNumber >= 1 && gemNumber <= MAX_GEM_CHECKS) {
-    return AP_LOCATIONS.GEM_BASE + gemNumber;
+    const locationId = AP_LOCATIONS.GEM_BASE + gemNumber;
+    return isLocationActive(locationId) ? locationId : null;
   }
   return null;
 }
@@ -159,6 +270,9 @@ export function useArchipelagoItems() {
   const completedChecks = usePersistentRef<Set<number>>('blockudoku_ap_checks', new Set());
   // Don't persist receivedItems - let Archipelago re-send on refresh
   const receivedItems = ref<number[]>([]);
+  // [id, epoch ms] of every new check and received item, for exported save states
+  const checkLog = usePersistentRef<[number, number][]>('blockudoku_ap_check_log', []);
+  const itemLog = usePersistentRef<[number, number][]>('blockudoku_ap_item_log', []);
 
   // Ensure completedChecks is a Set
   function ensureChecksIsSet() {
@@ -175,6 +289,7 @@ export function useArchipelagoItems() {
       return false;
     }
     completedChecks.value.add(locationId);
+    checkLog.value = [...checkLog.value, [locationId, Date.now()]];
     return true;
   }
 
@@ -196,6 +311,8 @@ export function useArchipelagoItems() {
     archipelagoMode.value = false;
     completedChecks.value = new Set();
     receivedItems.value = [];
+    checkLog.value = [];
+    itemLog.value = [];
 
     // Clear Archipelago-specific state
     if (import.meta.client) {
@@ -214,9 +331,13 @@ export function useArchipelagoItems() {
   }
 
   // Receive an item from Archipelago (add to non-persistent list)
-  function receiveItem(itemId: number): boolean {
+  // Debug grants pass log = false so exported saves only hold real receipts
+  function receiveItem(itemId: number, log = true): boolean {
     // Always add the item (duplicates indicate multiple copies)
     receivedItems.value = [...receivedItems.value, itemId];
+    if (log) {
+      itemLog.value = [...itemLog.value, [itemId, Date.now()]];
+    }
     return true;
   }
 
@@ -254,6 +375,7 @@ export function useArchipelagoItems() {
     MAX_GEM_CHECKS,
 
     // Export helpers
+    isLocationActive,
     getScoreLocationId,
     getLineClearLocationId,
     getBoxClearLocationId,
@@ -164,6 +164,39 @@ export function clearAllPersistence() {
   }
 }
 
+/**
+ * Snapshot every persisted key as one JSON-ready save state, for
+ * apworld/analyze_saves.py. Values are parsed; keys keep their prefix.
+ */
+export function exportSaveState() {
+  const state: Record<string, any> = {};
+  if (!import.meta.server) {
+    for (const key of Object.keys(localStorage).filter((key) => key.startsWith(STORAGE_PREFIX))) {
+      const stored = localStorage.getItem(key);
+      try {
+        state[key] = stored === null ? null : JSON.parse(stored);
+      } catch {
+        state[key] = stored;
+      }
+    }
+  }
+  return { format: 'blockupelago-save', version: 1, exportedAt: Date.now(), state };
+}
+
+/**
+ * Download exportSaveState() as a .json file
+ */
+export function downloadSaveState() {
+  if (import.meta.server) return;
+  const save = exportSaveState();
+  const url = URL.createObjectURL(new Blob([JSON.stringify(save)], { type: 'application/json' }));
+  const link = document.createElement('a');
+  link.href = url;
+  link.download = `blockupelago-save-${save.exportedAt}.json`;
+  link.click();
+  URL.revokeObjectURL(url);
+}
+
 /**
  * Clear specific persistence key
  */
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Analyze exported Blockupelago save states.
+
+Usage:
+    python analyze_saves.py saves/
+    python analyze_saves.py saves.zip more_saves.tar.gz --workers 8
+    python analyze_saves.py sessions.jsonl --category score line_clear --out save_report.json
+
+Reads save states exported from the client (Debug > Export Save State, or a
+raw dump of its blockupelago_* localStorage keys) from folders, .json and
+.jsonl files (optionally gzipped) and .zip/.tar archives. Saves are streamed
+one at a time and folded into fixed-size counters, so memory stays constant
+however large the corpus; with --workers > 1 batches of --chunk saves are
+parsed in worker processes, at most two batches per worker in flight.
+
+Reports checks per minute of active play (gaps of more than --idle-minutes
+between logged checks and items count as breaks), how often each milestone
+in Locations.py is reached by the game in progress in the save (its stat
+totals, which the client resets with every new game, so earlier games of a
+session are not counted; free-play saves count too), how often it was
+checked in Archipelago saves and the median active minutes into the session
+when it was, and which received items unblock stalled play: how often an item arrived --stall-minutes or more
+after the last check (but before a break) and the next check followed
+within --unblock-minutes. Timing needs the check and item logs the client
+has written since save export was added; older saves only count toward the
+hit rates.
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import tarfile
+import zipfile
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from benchmarks.harness import install_stand_in_if_missing
+
+# Data only needs the core's base types; the stand-in provides them when no
+# Archipelago core is importable
+install_stand_in_if_missing()
+from blockupelago.Data import ITEMS, MILESTONES  # noqa: E402
+
+SAVE_FORMAT = "blockupelago-save"
+STORAGE_PREFIXES = ("blockupelago_", "blockudoku_")
+# Current-game total in the save behind each milestone category
+CATEGORY_COUNTERS = {"score": "total_score", "line_clear": "lines_cleared", "box_clear": "boxes_cleared",
+                     "piece": "pieces_placed", "gem": "gems_collected"}
+# Upper edges of the histogram buckets; the last bucket is open-ended
+MINUTE_EDGES = (1, 2, 5, 10, 15, 20, 30, 45, 60, 90, 120, 180, 240, 360, 480, 720, 1440)
+RATE_EDGES = (0.1, 0.25, 0.5, 0.75, 1, 1.5, 2, 3, 5, 10)
+
+# location id -> (category, milestone index)
+LOCATION_MILESTONES = {code: (category, index) for category, rows in MILESTONES.items()
+                       for index, (_, _, code) in enumerate(rows)}
+ITEM_NAMES = {code: name for name, code, _, _ in ITEMS}
+
+
+def bucket(edges: Sequence[float], value: float) -> int:
+    return bisect_left(edges, value)
+
+
+def histogram_quantile(counts: Counter, edges: Sequence[float], fraction: float) -> Optional[str]:
+    """The bucket holding the quantile, as "<=edge" (">last edge" for the open bucket)."""
+    total = sum(counts.values())
+    if not total:
+        return None
+    seen = 0
+    for index in sorted(counts):
+        seen += counts[index]
+        if seen >= fraction * total:
+            break
+    return f"<={edges[index]:g}" if index < len(edges) else f">{edges[-1]:g}"
+
+
+def read_log(entries: Any) -> List[Tuple[int, float]]:
+    """A check or item log as (id, epoch ms) pairs; TypeError or ValueError if it is malformed."""
+    return [(int(code), float(time)) for code, time in entries or ()]
+
+
+class Settings:
+    def __init__(self, idle_minutes: float, stall_minutes: float, unblock_minutes: float):
+        self.idle = idle_minutes * 60000
+        self.stall = stall_minutes * 60000
+        self.unblock = unblock_minutes * 60000
+
+
+class Aggregate:
+    """Mergeable counters over any number of saves."""
+
+    def __init__(self):
+        self.saves = 0
+        self.archipelago = 0
+        self.unreadable = 0
+        self.timed = 0
+        self.checks_timed = 0
+        self.active_ms = 0.0
+        # per-save checks per active minute
+        self.rates: Counter = Counter()
+        # (category, milestones reached per the current game's total)
+        self.reached_in_game: Counter = Counter()
+        self.checked: Counter = Counter()
+        # location id -> Counter of MINUTE_EDGES buckets, in active minutes from the first event
+        self.check_minutes: Dict[int, Counter] = {}
+        self.received: Counter = Counter()
+        self.mid_stall: Counter = Counter()
+        self.unblocked: Counter = Counter()
+
+    def merge(self, other: "Aggregate") -> "Aggregate":
+        for name in ("saves", "archipelago", "unreadable", "timed", "checks_timed", "active_ms"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for name in ("rates", "reached_in_game", "checked", "received", "mid_stall", "unblocked"):
+            getattr(self, name).update(getattr(other, name))
+        for code, counts in other.check_minutes.items():
+            self.check_minutes.setdefault(code, Counter()).update(counts)
+        return self
+
+    def add(self, state: Dict[str, Any], settings: Settings) -> None:
+        """Count one save; a malformed one raises TypeError or ValueError before anything is counted."""
+        archipelago = bool(state.get("ap_mode"))
+        if archipelago:
+            checks = state.get("ap_checks")
+            if isinstance(checks, dict):
+                checks = checks.get("data")
+            checked = [code for code in set(checks or ()) if code in LOCATION_MILESTONES]
+            check_log, item_log = read_log(state.get("ap_check_log")), read_log(state.get("ap_item_log"))
+        self.saves += 1
+        for category, counter in CATEGORY_COUNTERS.items():
+            value = state.get(counter)
+            if isinstance(value, (int, float)):
+                thresholds = [threshold for threshold, _, _ in MILESTONES[category]]
+                self.reached_in_game[category, bisect_right(thresholds, value)] += 1
+        if not archipelago:
+            return
+        self.archipelago += 1
+        self.checked.update(checked)
+        self.add_timeline(check_log, item_log, settings)
+
+    def add_timeline(self, check_log: List[Tuple[int, float]], item_log: List[Tuple[int, float]],
+                     settings: Settings) -> None:
+        checks = sorted(time for _, time in check_log)
+        if len(checks) < 2:
+            return
+        # Active time up to each event; gaps longer than idle are breaks
+        events = sorted([(time, 0, code) for code, time in check_log] + [(time, 1, code) for code, time in item_log])
+        active, previous = 0.0, events[0][0]
+        for time, kind, code in events:
+            gap = time - previous
+            if gap <= settings.idle:
+                active += gap
+            previous = time
+            if kind == 0 and code in LOCATION_MILESTONES:
+                self.check_minutes.setdefault(code, Counter())[bucket(MINUTE_EDGES, active / 60000)] += 1
+        self.timed += 1
+        self.checks_timed += len(checks)
+        self.active_ms += active
+        if active:
+            self.rates[bucket(RATE_EDGES, len(checks) / (active / 60000))] += 1
+
+        for code, time in item_log:
+            self.received[code] += 1
+            index = bisect_left(checks, time)
+            if index == 0 or index == len(checks):
+                continue
+            since_check = time - checks[index - 1]
+            if settings.stall <= since_check <= settings.idle:
+                self.mid_stall[code] += 1
+                if checks[index] - time <= settings.unblock:
+                    self.unblocked[code] += 1
+
+    def report(self, categories: Sequence[str], min_samples: int) -> Dict[str, Any]:
+        rates = [histogram_quantile(self.rates, RATE_EDGES, fraction) for fraction in (0.25, 0.5, 0.75)]
+        milestones = {}
+        for category in categories:
+            reached = {count: n for (name, count), n in self.reached_in_game.items() if name == category}
+            rows = []
+            for index, (threshold, name, code) in enumerate(MILESTONES[category]):
+                hits = sum(n for count, n in reached.items() if count > index)
+                minutes = self.check_minutes.get(code, Counter())
+                rows.append({"name": name, "threshold": threshold,
+                             "reached_in_game": hits / self.saves if self.saves else 0.0,
+                             "checked": self.checked[code] / self.archipelago if self.archipelago else 0.0,
+                             "median_minutes": histogram_quantile(minutes, MINUTE_EDGES, 0.5)})
+            milestones[category] = rows
+        items = sorted(({"name": ITEM_NAMES.get(code, str(code)), "received": self.received[code],
+                         "mid_stall": self.mid_stall[code], "unblocked": self.unblocked[code],
+                         "unblock_rate": self.unblocked[code] / self.mid_stall[code]}
+                        for code in self.mid_stall if self.mid_stall[code] >= min_samples),
+                       key=lambda row: (-row["unblock_rate"], -row["mid_stall"]))
+        return {"saves": self.saves, "archipelago": self.archipelago, "unreadable": self.unreadable,
+                "timed": self.timed,
+                "checks_per_minute": self.checks_timed / (self.active_ms / 60000) if self.active_ms else None,
+                "active_hours": self.active_ms / 3600000,
+                "checks_per_minute_quartiles": rates, "milestones": milestones, "gating_items": items}
+
+
+def parse_save(raw: bytes) -> Dict[str, Any]:
+    """A save's state with the storage prefixes stripped and values parsed."""
+    data = json.loads(raw)
+    if isinstance(data, dict) and data.get("format") == SAVE_FORMAT:
+        data = data["state"]
+    if not isinstance(data, dict):
+        raise ValueError("save state is not a JSON object")
+    state = {}
+    for key, value in data.items():
+        for prefix in STORAGE_PREFIXES:
+            if key.startswith(prefix):
+                key = key[len(prefix):]
+        if isinstance(value, str):
+            # Raw localStorage dumps keep every value JSON-encoded
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        state[key] = value
+    return state
+
+
+def analyze_chunk(chunk: List[bytes], settings: Settings) -> Aggregate:
+    aggregate = Aggregate()
+    for raw in chunk:
+        try:
+            aggregate.add(parse_save(raw), settings)
+        except (TypeError, ValueError, KeyError):
+            aggregate.unreadable += 1
+    return aggregate
+
+
+def split_lines(name: str, handle: Any) -> Iterator[bytes]:
+    if name.endswith(".jsonl"):
+        yield from (line for line in handle if line.strip())
+    else:
+        yield handle.read()
+
+
+def read_file(name: str, handle: Any) -> Iterator[bytes]:
+    """Saves in one file or archive member, by name."""
+    if name.endswith(".gz") and not name.endswith(".tar.gz"):
+        with gzip.open(handle) as inner:
+            yield from split_lines(name[:-3], inner)
+    elif name.endswith((".json", ".jsonl")):
+        yield from split_lines(name, handle)
+
+
+def iter_saves(path: Path) -> Iterator[bytes]:
+    """Every raw save under a path, one at a time."""
+    if path.is_dir():
+        for file in sorted(path.rglob("*")):
+            if file.is_file():
+                yield from iter_saves(file)
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.infolist():
+                if not member.is_dir():
+                    with archive.open(member) as handle:
+                        yield from read_file(member.filename, handle)
+    elif path.name.endswith((".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")):
+        # Streaming mode: members are read in archive order, never seeked
+        with tarfile.open(path, "r|*") as archive:
+            for member in archive:
+                if member.isfile():
+                    yield from read_file(member.name, archive.extractfile(member))
+    else:
+        with open(path, "rb") as handle:
+            yield from read_file(path.name, handle)
+
+
+def iter_chunks(paths: List[Path], size: int) -> Iterator[List[bytes]]:
+    chunk = []
+    for path in paths:
+        for raw in iter_saves(path):
+            chunk.append(raw)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def analyze(paths: List[Path], settings: Settings, workers: int = 1, chunk: int = 256) -> Aggregate:
+    total = Aggregate()
+    if workers <= 1:
+        for saves in iter_chunks(paths, chunk):
+            total.merge(analyze_chunk(saves, settings))
+        return total
+    with ProcessPoolExecutor(workers, initializer=install_stand_in_if_missing) as pool:
+        pending = deque()
+        for saves in iter_chunks(paths, chunk):
+            pending.append(pool.submit(analyze_chunk, saves, settings))
+            if len(pending) >= 2 * workers:
+                total.merge(pending.popleft().result())
+        while pending:
+            total.merge(pending.popleft().result())
+    return total
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"{report['saves']} save state(s), {report['archipelago']} Archipelago, "
+          f"{report['unreadable']} unreadable, {report['timed']} with check timing")
+    if report["checks_per_minute"] is not None:
+        quartiles = " / ".join(report["checks_per_minute_quartiles"])
+        print(f"Checks per active minute: {report['checks_per_minute']:.2f} pooled over "
+              f"{report['active_hours']:.1f} h; per save p25/p50/p75 {quartiles}")
+    for category, rows in report["milestones"].items():
+        print(f"\n{category:<24} {'in game':>8} {'checked':>8} {'median min':>11}")
+        for row in rows:
+            print(f"{row['name']:<24} {row['reached_in_game']:>8.1%} {row['checked']:>8.1%} "
+                  f"{row['median_minutes'] or '-':>11}")
+    if report["gating_items"]:
+        print(f"\n{'item received mid-stall':<24} {'received':>8} {'stalled':>8} {'unblocked':>9} {'rate':>6}")
+        for row in report["gating_items"]:
+            print(f"{row['name']:<24} {row['received']:>8} {row['mid_stall']:>8} {row['unblocked']:>9} "
+                  f"{row['unblock_rate']:>6.1%}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("paths", type=Path, nargs="+", help="save files, folders or archives")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes for parsing")
+    parser.add_argument("--chunk", type=int, default=256, help="saves per worker batch")
+    parser.add_argument("--category", nargs="+", choices=sorted(MILESTONES), default=sorted(MILESTONES),
+                        help="milestone categories to report")
+    parser.add_argument("--idle-minutes", type=float, default=10)
+    parser.add_argument("--stall-minutes", type=float, default=3)
+    parser.add_argument("--unblock-minutes", type=float, default=1)
+    parser.add_argument("--min-samples", type=int, default=5, help="stalls an item needs to be listed")
+    parser.add_argument("--out", type=Path, help="also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    settings = Settings(args.idle_minutes, args.stall_minutes, args.unblock_minutes)
+    aggregate = analyze(args.paths, settings, args.workers, args.chunk)
+    if not aggregate.saves:
+        print("No save states found.")
+        return 1
+    report = aggregate.report(args.category, args.min_samples)
+    print_report(report)
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
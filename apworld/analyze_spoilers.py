@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Aggregate Blockupelago item placement across many spoiler logs.
+
+Usage:
+    python analyze_spoilers.py output/
+    python analyze_spoilers.py output/ seeds.zip --workers 8 --out spoiler_report.json
+
+Reads Archipelago spoiler logs (*Spoiler*.txt in folders and .zip files,
+or any file named directly) line by line, so no spoiler is ever held in
+memory, and spreads the files across --workers processes. Only placements
+of Blockupelago slots' items (names from Items.item_table) are counted:
+where each item lands, per item group, by milestone category of
+Locations.location_table ("other" for other games' locations), and for the
+key items - those in the playthrough - the sphere they are found in, where
+they land and how deep into their category's milestone list, in tenths
+of the list. Also counts the last sphere each Blockupelago slot needs.
+Player names with parentheses are not recognized. Uses the Archipelago core
+when it is importable and the offline stand-in otherwise.
+"""
+
+import argparse
+import io
+import json
+import re
+import sys
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from benchmarks.harness import install_stand_in_if_missing
+
+# Items and Locations only need the core's base types; the stand-in provides them
+# when no Archipelago core is importable
+install_stand_in_if_missing()
+from blockupelago.Data import ITEMS  # noqa: E402
+from blockupelago.Items import item_table  # noqa: E402
+from blockupelago.Locations import location_table, milestone_index  # noqa: E402
+
+GAME = "Blockupelago"
+OTHER = "other"
+SECTIONS = ("Locations:", "Playthrough:", "Paths:", "Unreachable Progression Items:", "Entrances:",
+            "Starting Items:")
+DEPTH_BUCKETS = 10
+
+# Location and item names get " (player)" appended in multiworld spoilers
+MULTIWORLD_LINE = re.compile(r"^(?P<location>.+) \((?P<location_player>[^()]+)\): (?P<item>.+) \((?P<item_player>[^()]+)\)$")
+SINGLE_LINE = re.compile(r"^(?P<location>.+?): (?P<item>.+)$")
+SPHERE_LINE = re.compile(r"^(\d+): \{$")
+
+ITEM_GROUP = {name: category for name, _, _, category in ITEMS}
+# location name -> (milestone category, tenth of the category's list)
+LOCATION_DEPTH = {milestone.name: (category, index * DEPTH_BUCKETS // len(milestones))
+                  for category, milestones in milestone_index.items() for index, milestone in enumerate(milestones)}
+CATEGORIES = tuple(milestone_index) + (OTHER,)
+
+
+class Aggregate:
+    """Mergeable counters over any number of spoilers."""
+
+    def __init__(self):
+        self.spoilers = 0
+        self.unreadable = 0
+        self.slots = 0
+        # (item, location category): every placed Blockupelago item
+        self.placed: Counter = Counter()
+        # Key items: (item, sphere), (item, location category), (category, depth bucket)
+        self.key_spheres: Counter = Counter()
+        self.key_placed: Counter = Counter()
+        self.key_depth: Counter = Counter()
+        # Last sphere holding one of a slot's key items
+        self.slot_spheres: Counter = Counter()
+
+    def merge(self, other: "Aggregate") -> "Aggregate":
+        self.spoilers += other.spoilers
+        self.unreadable += other.unreadable
+        self.slots += other.slots
+        for name in ("placed", "key_spheres", "key_placed", "key_depth", "slot_spheres"):
+            getattr(self, name).update(getattr(other, name))
+        return self
+
+    def report(self) -> Dict[str, Any]:
+        items = {}
+        for name in sorted({item for item, _ in self.placed} | {item for item, _ in self.key_spheres},
+                           key=list(ITEM_GROUP).index):
+            spheres = {sphere: count for (item, sphere), count in self.key_spheres.items() if item == name}
+            items[name] = {"group": ITEM_GROUP[name],
+                           "placed": {where: self.placed[name, where] for where in CATEGORIES if self.placed[name, where]},
+                           "key": sum(spheres.values()),
+                           "key_placed": {where: self.key_placed[name, where] for where in CATEGORIES
+                                          if self.key_placed[name, where]},
+                           "spheres": dict(sorted(spheres.items()))}
+        groups: Dict[str, Counter] = {}
+        for (name, where), count in self.placed.items():
+            groups.setdefault(ITEM_GROUP[name], Counter())[where] += count
+        return {"spoilers": self.spoilers, "unreadable": self.unreadable, "slots": self.slots,
+                "items": items, "groups": {group: dict(counts) for group, counts in groups.items()},
+                "key_depth": {category: [self.key_depth[category, bucket] for bucket in range(DEPTH_BUCKETS)]
+                              for category in milestone_index},
+                "slot_spheres": dict(sorted(self.slot_spheres.items()))}
+
+
+def placement(line: str, multiworld: bool) -> Optional[Tuple[str, str, str, str]]:
+    """(location, location player, item, item player) of a spoiler placement line."""
+    match = (MULTIWORLD_LINE if multiworld else SINGLE_LINE).match(line)
+    if not match:
+        return None
+    if multiworld:
+        return match["location"], match["location_player"], match["item"], match["item_player"]
+    return match["location"], "", match["item"], ""
+
+
+def location_category(location: str, player: str, slots: set) -> str:
+    if player in slots and location in location_table:
+        return LOCATION_DEPTH[location][0] if location in LOCATION_DEPTH else OTHER
+    return OTHER
+
+
+def scan(lines: Iterable[str], aggregate: Aggregate) -> None:
+    """Fold one spoiler's lines into the aggregate."""
+    players, player, section, sphere = 1, "", None, None
+    slots: set = set()
+    slot_spheres: Dict[str, int] = {}
+    seen_locations = False
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line in SECTIONS:
+            section = line
+            seen_locations |= section == "Locations:"
+            continue
+        if section is None:
+            if line.startswith("Players:"):
+                players = int(line.split(":", 1)[1])
+            elif line.startswith("Player ") and ": " in line:
+                player = line.split(": ", 1)[1]
+            elif line.startswith("Game:") and line.split(":", 1)[1].strip() == GAME:
+                slots.add(player)
+            continue
+        if not slots:
+            continue
+        multiworld = players > 1
+        if section == "Locations:":
+            parsed = placement(line, multiworld)
+            if parsed and parsed[3] in slots and parsed[2] in item_table and item_table[parsed[2]].code is not None:
+                aggregate.placed[parsed[2], location_category(parsed[0], parsed[1], slots)] += 1
+        elif section == "Playthrough:":
+            header = SPHERE_LINE.match(line)
+            if header:
+                sphere = int(header[1])
+                continue
+            parsed = placement(line.strip(), multiworld) if line.startswith("  ") else None
+            if sphere is None or not parsed or parsed[3] not in slots:
+                continue
+            location, location_player, item, item_player = parsed
+            if item not in item_table or item_table[item].code is None:
+                continue
+            where = location_category(location, location_player, slots)
+            aggregate.key_spheres[item, sphere] += 1
+            aggregate.key_placed[item, where] += 1
+            if where != OTHER:
+                aggregate.key_depth[LOCATION_DEPTH[location]] += 1
+            slot_spheres[item_player] = max(slot_spheres.get(item_player, 0), sphere)
+
+    if not seen_locations:
+        aggregate.unreadable += 1
+        return
+    aggregate.spoilers += 1
+    aggregate.slots += len(slots)
+    aggregate.slot_spheres.update(slot_spheres.values())
+
+
+def open_spoiler(path: Path, member: Optional[str]) -> Iterator[str]:
+    if member is None:
+        with open(path, encoding="utf-8-sig", errors="replace") as handle:
+            yield from handle
+    else:
+        with zipfile.ZipFile(path) as archive, archive.open(member) as raw:
+            yield from io.TextIOWrapper(raw, encoding="utf-8-sig", errors="replace")
+
+
+def analyze_file(task: Tuple[Path, Optional[str]]) -> Aggregate:
+    aggregate = Aggregate()
+    scan(open_spoiler(*task), aggregate)
+    return aggregate
+
+
+def find_spoilers(paths: Sequence[Path]) -> Iterator[Tuple[Path, Optional[str]]]:
+    """(file, zip member or None) for every spoiler under the paths."""
+    for path in paths:
+        if path.is_dir():
+            for file in sorted(path.rglob("*")):
+                if file.suffix == ".zip" and zipfile.is_zipfile(file):
+                    yield from find_spoilers([file])
+                elif file.is_file() and file.suffix == ".txt" and "Spoiler" in file.name:
+                    yield file, None
+        elif zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                for name in archive.namelist():
+                    if name.endswith(".txt") and "Spoiler" in name.rsplit("/", 1)[-1]:
+                        yield path, name
+        else:
+            yield path, None
+
+
+def analyze(paths: Sequence[Path], workers: int = 1) -> Aggregate:
+    total = Aggregate()
+    tasks = find_spoilers(paths)
+    if workers <= 1:
+        for task in tasks:
+            total.merge(analyze_file(task))
+        return total
+    with ProcessPoolExecutor(workers, initializer=install_stand_in_if_missing) as pool:
+        for aggregate in pool.map(analyze_file, tasks, chunksize=16):
+            total.merge(aggregate)
+    return total
+
+
+def shares(counts: Dict[str, int]) -> str:
+    total = sum(counts.values())
+    return " ".join(f"{counts.get(where, 0) / total:>6.1%}" if total else f"{'-':>6}" for where in CATEGORIES)
+
+
+def sphere_quantile(spheres: Dict[int, int], fraction: float) -> int:
+    total, seen = sum(spheres.values()), 0
+    for sphere, count in spheres.items():
+        seen += count
+        if seen >= fraction * total:
+            return sphere
+    return 0
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"{report['spoilers']} spoiler(s), {report['slots']} Blockupelago slot(s), "
+          f"{report['unreadable']} unreadable")
+    columns = " ".join(f"{where[:6]:>6}" for where in CATEGORIES)
+    print(f"\n{'item group (all placed)':<24} {'placed':>7} {columns}")
+    for group, counts in report["groups"].items():
+        print(f"{group:<24} {sum(counts.values()):>7} {shares(counts)}")
+
+    print(f"\n{'key item':<24} {'key':>7} {'p50':>4} {'p90':>4} {'max':>4} {columns}")
+    for name, row in report["items"].items():
+        if row["key"]:
+            spheres = row["spheres"]
+            print(f"{name:<24} {row['key']:>7} {sphere_quantile(spheres, 0.5):>4} {sphere_quantile(spheres, 0.9):>4} "
+                  f"{max(spheres):>4} {shares(row['key_placed'])}")
+
+    print(f"\n{'key item depth':<24} " + " ".join(f"{bucket * 10:>3}%" for bucket in range(DEPTH_BUCKETS)))
+    for category, counts in report["key_depth"].items():
+        total = sum(counts)
+        print(f"{category:<24} " + " ".join(f"{count / total:>4.0%}" if total else f"{'-':>4}" for count in counts))
+
+    if report["slot_spheres"]:
+        print("\nlast key sphere per slot: " + ", ".join(f"{sphere}: {count}"
+                                                       for sphere, count in report["slot_spheres"].items()))
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("paths", type=Path, nargs="+", help="spoiler logs, folders or .zip files")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--out", type=Path, help="also write the histograms as JSON")
+    args = parser.parse_args(argv)
+
+    aggregate = analyze(args.paths, args.workers)
+    if not aggregate.slots:
+        print("No spoilers with Blockupelago slots found.")
+        return 1
+    report = aggregate.report()
+    print_report(report)
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
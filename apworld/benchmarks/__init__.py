@@ -0,0 +1,6 @@
+"""
+Blockupelago Benchmarks
+
+Offline performance measurements for the apworld. Run from the apworld
+folder, e.g. ``python -m benchmarks.bench_generation``.
+"""
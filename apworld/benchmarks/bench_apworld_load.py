@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Cold load benchmark for the packaged blockupelago.apworld.
+
+Usage:
+    python -m benchmarks.bench_apworld_load
+    python -m benchmarks.bench_apworld_load --runs 30
+
+Packages the world with and without precompiled bytecode, then loads each
+archive in fresh interpreters the way Archipelago loads custom_worlds: a
+zipimporter on the .apworld, the package executed as ``worlds.blockupelago``.
+Reports the median load time and confirms which entries zipimport used.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+from .harness import APWORLD_DIR, STAND_IN_DIR
+
+LOADER = """
+import sys, time
+sys.path.insert(0, {stand_in!r})
+import BaseClasses, Options, worlds.AutoWorld
+import importlib.util, zipimport
+start = time.perf_counter()
+importer = zipimport.zipimporter({archive!r})
+spec = importer.find_spec("blockupelago")
+module = importlib.util.module_from_spec(spec)
+module.__package__ = "worlds.blockupelago"
+module.__name__ = "worlds.blockupelago"
+sys.modules[module.__name__] = module
+importer.exec_module(module)
+elapsed = time.perf_counter() - start
+modules = [mod for name, mod in sys.modules.items() if name.startswith("worlds.blockupelago")]
+print(elapsed, sum(mod.__file__.endswith(".pyc") for mod in modules), len(modules))
+"""
+
+
+def load_times(archive: Path, runs: int) -> Tuple[List[float], str]:
+    """Load times in seconds, and how many modules came from bytecode."""
+    code = LOADER.format(stand_in=str(STAND_IN_DIR), archive=str(archive))
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        elapsed, from_bytecode, total = output.stdout.split()
+        times.append(float(elapsed))
+    return times, f"{from_bytecode}/{total}"
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(APWORLD_DIR))
+    from build_apworld import build_apworld
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for label, bytecode in (("source only", False), ("with bytecode", True)):
+            archive = Path(tmp) / f"{label.replace(' ', '_')}.apworld"
+            build_apworld(bytecode=bytecode, output_file=archive)
+            results[label] = (archive.stat().st_size, *load_times(archive, args.runs))
+
+    print(f"\n{'archive':<15} {'bytes':>8} {'median ms':>10} {'min ms':>8} {'.pyc used':>10}")
+    for label, (size, times, from_bytecode) in results.items():
+        print(f"{label:<15} {size:>8} {statistics.median(times) * 1e3:>10.2f} {min(times) * 1e3:>8.2f} "
+              f"{from_bytecode:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
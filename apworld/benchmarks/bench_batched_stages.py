@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Batched stage_* generation against per-player generation.
+
+Usage:
+    python -m benchmarks.bench_batched_stages
+    python -m benchmarks.bench_batched_stages --players 100 1000 --repeat 5
+
+Runs create_regions, create_items and set_rules for the same multiworld
+twice: with BlockudokuWorld.batched_stages off (every player builds its own
+regions, items and rules) and on (the stage_* hooks build them for every
+Blockupelago player at once), for slots on default options and for slots
+cycling through every milestone_pruning mode, several goal scores, both
+starting_piece_slots values and milestone_logic on and off. Checks both
+paths produce the same regions, entrances, locations (address, progress
+type, locked item) and item pool, and that every location's access rule and
+every completion condition agree on an empty state, on states holding a
+random part of the pool and on the full pool. Then reports time per player
+for each path.
+"""
+
+import argparse
+import random
+import sys
+from typing import Any, Dict, List, Tuple
+
+from .harness import _time_call, build_multiworld, install_stand_in, run_stage
+
+STAGES = ("create_regions", "create_items", "set_rules")
+DEFAULT_PLAYERS = (1, 50, 500, 2000)
+# Shares of the pool collected into the states the rules are evaluated on
+STATE_FRACTIONS = (0.0, 0.25, 0.5, 0.75, 1.0)
+
+
+def mixed_options(player: int) -> Dict[str, Any]:
+    return {"milestone_pruning": player % 3, "goal_score": (1, 2, 3, 5, 10)[player % 5] * 10000,
+            "gem_checks": (player * 13) % 101, "starting_piece_slots": 2 + (player // 5) % 2,
+            "milestone_logic": (player // 2) % 2}
+
+
+def build(players: int, batched: bool, mixed: bool) -> Tuple[Any, float]:
+    """A generated multiworld and the time its stages took."""
+    from blockupelago import BlockudokuWorld
+    from worlds.AutoWorld import make_options
+
+    BlockudokuWorld.batched_stages = batched
+    try:
+        multiworld = build_multiworld(players)
+        for player in multiworld.player_ids if mixed else ():
+            world = multiworld.worlds[player]
+            world.options = make_options(BlockudokuWorld.options_dataclass, **mixed_options(player))
+        elapsed = sum(_time_call(lambda: run_stage(multiworld, stage)) for stage in STAGES)
+    finally:
+        BlockudokuWorld.batched_stages = True
+    return multiworld, elapsed
+
+
+def signature(multiworld: Any) -> List[tuple]:
+    """Everything the stages produce, per player, in a comparable form."""
+    from BaseClasses import CollectionState
+
+    regions = [(region.player, region.name, [(exit_.name, exit_.connected_region.name) for exit_ in region.exits],
+                [(location.name, location.address, int(location.progress_type),
+                  location.item.name if location.item else None, location.locked)
+                 for location in region.locations])
+               for region in sorted(multiworld.regions, key=lambda region: region.player)]
+    items = [(item.player, item.name, int(item.classification), item.code) for item in multiworld.itempool]
+
+    # Every access rule and completion condition on states holding a growing, seeded random
+    # part of the pool; the pool is sorted first so both paths collect the same items
+    pool = sorted(multiworld.itempool, key=lambda item: (item.player, item.name))
+    random.Random(0).shuffle(pool)
+    states = []
+    for fraction in STATE_FRACTIONS:
+        state = CollectionState(multiworld)
+        for item in pool[:round(fraction * len(pool))]:
+            state.collect(item, True)
+        states.append(state)
+    rules = [(location.player, location.name, [location.access_rule(state) for state in states])
+             for region in multiworld.regions for location in region.locations]
+    rules.sort()
+    rules += [(player, "completion", [multiworld.completion_condition[player](state) for state in states])
+              for player in multiworld.player_ids]
+    return [regions, items, rules]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--players", type=int, nargs="+", default=list(DEFAULT_PLAYERS))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per path (best is kept)")
+    args = parser.parse_args(argv)
+
+    install_stand_in()
+    print(f"{'players':>7} {'options':<8} {'per-player us/p':>16} {'batched us/p':>13} {'speedup':>8}")
+    for players in args.players:
+        for mixed in (False, True):
+            times = {}
+            for batched in (False, True):
+                runs = [build(players, batched, mixed) for _ in range(args.repeat)]
+                times[batched] = min(elapsed for _, elapsed in runs) / players * 1e6
+                if batched:
+                    assert signature(runs[0][0]) == signature(per_player), \
+                        f"{players} players: batched generation differs from per-player generation"
+                else:
+                    per_player = runs[0][0]
+            print(f"{players:>7} {'mixed' if mixed else 'default':<8} {times[False]:>16.1f} {times[True]:>13.1f} "
+                  f"{times[False] / times[True]:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
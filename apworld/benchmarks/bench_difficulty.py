@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Coverage and load cost of the shipped milestone difficulty table.
+
+Usage:
+    python -m benchmarks.bench_difficulty
+    python -m benchmarks.bench_difficulty --runs 30 --players 1000
+
+Checks blockupelago/difficulty.bin is current, monotone along every axis
+and puts every milestone in logic once everything is collected. Then, for
+every StartingPieceSlots value and every number of shape, piece slot and
+permanent items item_table can give a player, collects those items into a
+state and checks each milestone rule agrees with a direct table lookup
+(tests/test_difficulty.py runs both checks).
+Reports the cold cost of loading the table with pkgutil.get_data, both from
+the folder and from inside a packaged .apworld, the cost of a rule call
+and create_regions time per player with milestone_logic off and on.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from itertools import product
+from pathlib import Path
+from typing import List
+
+from .harness import APWORLD_DIR, STAND_IN_DIR, _time_call, build_multiworld, install_stand_in, run_stage
+
+LOADER = """
+import sys, time
+sys.path.insert(0, {stand_in!r})
+sys.path.insert(0, {path!r})
+import BaseClasses, Options, worlds.AutoWorld
+{package_setup}
+from {package}.Difficulty import get_table
+start = time.perf_counter()
+get_table()
+print(time.perf_counter() - start)
+"""
+ZIP_SETUP = """
+import importlib.util, zipimport
+importer = zipimport.zipimporter({archive!r})
+spec = importer.find_spec("blockupelago")
+module = importlib.util.module_from_spec(spec)
+module.__package__ = "worlds.blockupelago"
+module.__name__ = "worlds.blockupelago"
+sys.modules[module.__name__] = module
+importer.exec_module(module)
+"""
+
+
+def check_table() -> None:
+    from blockupelago.Data import MILESTONES
+    from blockupelago.Difficulty import CATEGORIES, HAND_SIZES, PERMANENT_COUNTS, SHAPE_COUNTS, get_table
+
+    table = get_table()
+    full = tuple(len(MILESTONES[category]) for category in CATEGORIES)
+    assert table.reachable(SHAPE_COUNTS - 1, HAND_SIZES[-1], PERMANENT_COUNTS - 1) == full, \
+        "not every milestone is in logic with every unlock"
+    for shapes, hand_size, permanents in product(range(SHAPE_COUNTS), HAND_SIZES, range(PERMANENT_COUNTS)):
+        counts = table.reachable(shapes, hand_size, permanents)
+        for smaller in ((shapes - 1, hand_size, permanents), (shapes, hand_size - 1, permanents),
+                        (shapes, hand_size, permanents - 1)):
+            if smaller[0] >= 0 and smaller[1] >= HAND_SIZES[0] and smaller[2] >= 0:
+                assert all(a >= b for a, b in zip(counts, table.reachable(*smaller))), \
+                    f"{(shapes, hand_size, permanents)} has fewer milestones in logic than {smaller}"
+
+
+def check_coverage() -> int:
+    """Every item combination's rules against the table; returns the combinations checked."""
+    from BaseClasses import CollectionState
+    from blockupelago.Data import PERMANENT_ITEMS, PIECE_ITEMS, SLOT_ITEMS, STARTER_PIECES
+    from blockupelago.Difficulty import CATEGORIES, get_table
+    from blockupelago.Locations import milestone_index
+    from blockupelago.Options import StartingPieceSlots
+
+    table = get_table()
+    shapes = [name for name in PIECE_ITEMS if name not in STARTER_PIECES]
+    checked = 0
+    for starting_slots in range(StartingPieceSlots.range_start, StartingPieceSlots.range_end + 1):
+        multiworld = build_multiworld(1, options={"milestone_logic": 1, "starting_piece_slots": starting_slots})
+        for stage in ("create_regions", "create_items", "set_rules"):
+            run_stage(multiworld, stage)
+        world = multiworld.worlds[1]
+        for counts in product(range(len(shapes) + 1), range(len(SLOT_ITEMS) + 1), range(len(PERMANENT_ITEMS) + 1)):
+            state = CollectionState(multiworld)
+            for names, count in zip((shapes, SLOT_ITEMS, PERMANENT_ITEMS), counts):
+                for name in names[:count]:
+                    state.collect(world.create_item(name), True)
+            expected = table.reachable(counts[0], starting_slots + counts[1], counts[2])
+            # Milestones past the best state wait for every counted item
+            everything = counts == (len(shapes), len(SLOT_ITEMS), len(PERMANENT_ITEMS))
+            for column, category in enumerate(CATEGORIES):
+                for index, milestone in enumerate(milestone_index[category]):
+                    location = multiworld.get_location(milestone.name, 1)
+                    assert location.access_rule(state) == (index < expected[column] or everything), \
+                        f"{milestone.name} with {counts} (starting slots {starting_slots}) disagrees with the table"
+            checked += 1
+    return checked
+
+
+def load_times(package: str, path: Path, package_setup: str, runs: int) -> List[float]:
+    code = LOADER.format(stand_in=str(STAND_IN_DIR), path=str(path), package=package, package_setup=package_setup)
+    return [float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                 check=True).stdout) for _ in range(runs)]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=15, help="fresh interpreters per load measurement")
+    parser.add_argument("--players", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    install_stand_in()
+    from BaseClasses import CollectionState
+    from build_apworld import build_apworld
+
+    check_table()
+    print(f"table ok; {check_coverage()} item combinations agree with the table")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = Path(tmp) / "blockupelago.apworld"
+        build_apworld(output_file=archive)
+        loads = {"folder": load_times("blockupelago", APWORLD_DIR, "", args.runs),
+                 ".apworld": load_times("worlds.blockupelago", APWORLD_DIR,
+                                        ZIP_SETUP.format(archive=str(archive)), args.runs)}
+    print(f"\n{'table load from':<16} {'median us':>10} {'min us':>8}")
+    for label, times in loads.items():
+        print(f"{label:<16} {statistics.median(times) * 1e6:>10.1f} {min(times) * 1e6:>8.1f}")
+
+    multiworld = build_multiworld(1, options={"milestone_logic": 1})
+    run_stage(multiworld, "create_regions")
+    rule = multiworld.get_location("Clear 1250 Lines", 1).access_rule
+    state = CollectionState(multiworld)
+    calls = 200000
+    start = time.perf_counter()
+    for _ in range(calls):
+        rule(state)
+    print(f"\nmilestone rule call: {(time.perf_counter() - start) / calls * 1e9:.0f} ns")
+
+    print(f"\n{'milestone_logic':<16} {'create_regions us/player':>25}")
+    for value in (0, 1):
+        multiworld = build_multiworld(args.players, options={"milestone_logic": value})
+        elapsed = _time_call(lambda: run_stage(multiworld, "create_regions"))
+        print(f"{('on' if value else 'off'):<16} {elapsed / args.players * 1e6:>25.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
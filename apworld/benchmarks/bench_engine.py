@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Throughput of the blockudoku_sim bitboard engine.
+
+Usage:
+    python -m benchmarks.bench_engine
+    python -m benchmarks.bench_engine --seconds 2
+
+Reports how many anchors per second a line-by-line port of the grid
+functions in app/utils/blockudoku.ts and the bitboard engine can test,
+placing and clearing on every legal one. tests/test_engine.py checks the
+engine against the same port on random boards (with gems).
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from typing import Callable, List, Tuple
+
+from blockudoku_sim import (
+    ALL_PIECES, board_from_grid, can_place, clear_completed, legal_placements, mirror_shape, place, rotate_shape,
+    shrink_shape,
+)
+
+Grid = List[List[int]]
+
+
+# Reference port of app/utils/blockudoku.ts; keep it literal, not clever
+
+def ts_can_place_piece(grid: Grid, shape, row: int, col: int) -> bool:
+    grid_rows, grid_cols = len(grid), len(grid[0])
+    piece_rows, piece_cols = len(shape), len(shape[0])
+    if row + piece_rows > grid_rows or col + piece_cols > grid_cols:
+        return False
+    for r in range(piece_rows):
+        for c in range(piece_cols):
+            if shape[r][c] == 1 and grid[row + r][col + c] == 1:
+                return False
+    return True
+
+
+def ts_place_piece(grid: Grid, shape, row: int, col: int) -> Grid:
+    new_grid = [list(r) for r in grid]
+    for r in range(len(shape)):
+        for c in range(len(shape[0])):
+            if shape[r][c] == 1:
+                new_grid[row + r][col + c] = 1
+    return new_grid
+
+
+def ts_clear_completed(grid: Grid) -> Tuple[Grid, List[int], List[int], List[int]]:
+    rows = [r for r in range(9) if all(cell == 1 for cell in grid[r])]
+    cols = [c for c in range(9) if all(grid[r][c] == 1 for r in range(9))]
+    boxes = [br * 3 + bc for br in range(3) for bc in range(3)
+             if all(grid[br * 3 + r][bc * 3 + c] == 1 for r in range(3) for c in range(3))]
+    new_grid = [list(r) for r in grid]
+    for r in rows:
+        new_grid[r] = [0] * 9
+    for c in cols:
+        for r in range(9):
+            new_grid[r][c] = 0
+    for box in boxes:
+        for r in range(3):
+            for c in range(3):
+                new_grid[box // 3 * 3 + r][box % 3 * 3 + c] = 0
+    return new_grid, rows, cols, boxes
+
+
+def ts_calculate_score(rows: int, cols: int, boxes: int, combo: float) -> int:
+    return math.floor((rows * 10 + cols * 10 + boxes * 30) * combo)
+
+
+def ts_can_place_any_piece(grid: Grid, shapes) -> bool:
+    return any(ts_can_place_piece(grid, shape, r, c) for shape in shapes for r in range(9) for c in range(9))
+
+
+def all_orientations():
+    """Every rotation, mirror and shrink reachable from ALL_PIECES."""
+    seen, pending = set(), [piece.shape for piece in ALL_PIECES]
+    while pending:
+        shape = pending.pop()
+        if shape in seen:
+            continue
+        seen.add(shape)
+        pending += [rotate_shape(shape), mirror_shape(shape)]
+        shrunk = shrink_shape(shape)
+        if shrunk:
+            pending.append(shrunk)
+    return sorted(seen)
+
+
+def random_grid(rng: random.Random) -> Grid:
+    density = rng.random()
+    grid = [[1 if rng.random() < density else 0 for _ in range(9)] for _ in range(9)]
+    for _ in range(rng.randrange(4)):
+        grid[rng.randrange(9)][rng.randrange(9)] = 2
+    # Force some complete units so clears are exercised
+    for _ in range(rng.randrange(3)):
+        kind, index = rng.randrange(3), rng.randrange(9)
+        for i in range(9):
+            r, c = ((index, i), (i, index), (index // 3 * 3 + i // 3, index % 3 * 3 + i % 3))[kind]
+            grid[r][c] = 1
+    return grid
+
+
+def throughput(step: Callable[[], int], seconds: float) -> float:
+    done, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        done += step()
+    return done / (time.perf_counter() - start)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    shapes = all_orientations()
+    samples = [(random_grid(rng), rng.choice(shapes)) for _ in range(256)]
+    bitboards = [(board_from_grid(grid), shape) for grid, shape in samples]
+
+    def grid_step() -> int:
+        # Try every anchor, place and clear on each legal one
+        for grid, shape in samples:
+            for r in range(9):
+                for c in range(9):
+                    if ts_can_place_piece(grid, shape, r, c):
+                        ts_clear_completed(ts_place_piece(grid, shape, r, c))
+        return len(samples) * 81
+
+    def bitboard_step() -> int:
+        for board, shape in bitboards:
+            for r in range(9):
+                for c in range(9):
+                    if can_place(board, shape, r, c):
+                        clear_completed(place(board, shape, r, c))
+        return len(bitboards) * 81
+
+    def mask_step() -> int:
+        # What the simulators do: only walk the precomputed in-bounds anchors
+        for board, shape in bitboards:
+            for placement in legal_placements(board, shape):
+                clear_completed(board | placement.mask)
+        return len(bitboards) * 81
+
+    rates = {label: throughput(step, args.seconds)
+             for label, step in (("grid", grid_step), ("bitboard", bitboard_step), ("masks", mask_step))}
+    print(f"\n{'engine':<10} {'anchors/s':>12}")
+    for label, rate in rates.items():
+        print(f"{label:<10} {rate:>12,.0f}  ({rate / rates['grid']:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
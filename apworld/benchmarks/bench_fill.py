@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Fill time with rule-driven item classification.
+
+Usage:
+    python -m benchmarks.bench_fill
+    python -m benchmarks.bench_fill --players 100 500 --goals 10000 50000 100000
+
+Generates rooms of Blockupelago slots, with milestone_logic off and on, and
+fills them with the stand-in's assumed fill (stand_in/Fill.py), once with
+the classification from Items.classify and once with every piece, slot and
+permanent item forced back to the generated progression classification,
+which is what the world did before classification followed the rules.
+Reports progression items per slot, how many of them take part in
+progression balancing, and fill time. The stand-in has no progression
+balancing, so its cost is only visible as the balanced-item count. Checks
+every filled room is beatable.
+"""
+
+import argparse
+import sys
+from typing import Any, List, Tuple
+
+from .harness import _time_call, build_multiworld, install_stand_in, run_stage
+
+DEFAULT_GOALS = (10000, 30000, 50000, 100000)
+
+
+def generate(players: int, goal_score: int, milestone_logic: int, generated_classification: bool) -> Any:
+    from blockupelago.Items import item_table
+
+    multiworld = build_multiworld(players, options={"goal_score": goal_score, "milestone_logic": milestone_logic})
+    for stage in ("create_regions", "create_items", "set_rules"):
+        run_stage(multiworld, stage)
+    if generated_classification:
+        for item in multiworld.itempool:
+            item.classification = item_table[item.name].classification
+    return multiworld
+
+
+def fill(players: int, goal_score: int, milestone_logic: int,
+         generated_classification: bool) -> Tuple[float, int, int]:
+    """(fill seconds, progression items per slot, balanced items per slot)."""
+    from BaseClasses import ItemClassification
+    from Fill import beatable, distribute_items_restrictive
+
+    multiworld = generate(players, goal_score, milestone_logic, generated_classification)
+    progression = [item for item in multiworld.itempool if item.advancement]
+    balanced = [item for item in progression if ItemClassification.skip_balancing not in item.classification]
+    seconds = _time_call(lambda: distribute_items_restrictive(multiworld))
+    assert beatable(multiworld), f"{players} slots, goal {goal_score}: filled room is not beatable"
+    return seconds, len(progression) // players, len(balanced) // players
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--players", type=int, nargs="+", default=[500])
+    parser.add_argument("--goals", type=int, nargs="+", default=list(DEFAULT_GOALS))
+    args = parser.parse_args(argv)
+
+    install_stand_in()
+    print(f"{'players':>7} {'goal':>7} {'logic':>5} {'classification':<15} {'prog/slot':>9} {'balanced':>8} "
+          f"{'fill s':>8}")
+    for players in args.players:
+        for goal_score in args.goals:
+            for milestone_logic in (0, 1):
+                times = {}
+                for label, generated in (("generated", True), ("rule-driven", False)):
+                    seconds, progression, balanced = fill(players, goal_score, milestone_logic, generated)
+                    times[label] = seconds
+                    print(f"{players:>7} {goal_score:>7} {milestone_logic:>5} {label:<15} {progression:>9} "
+                          f"{balanced:>8} {seconds:>8.2f}")
+                print(f"{'':>7} {'':>7} {'':>5} {'speedup':<15} {times['generated'] / times['rule-driven']:>28.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
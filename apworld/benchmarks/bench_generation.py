@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Per-stage generation benchmark for BlockudokuWorld.
+
+Usage:
+    python -m benchmarks.bench_generation
+    python -m benchmarks.bench_generation --players 1 50 --repeat 5
+    python -m benchmarks.bench_generation --record
+
+Runs create_regions, create_items, set_rules and fill_slot_data for
+multiworlds made entirely of Blockupelago slots and reports wall time,
+allocations and peak memory per stage. Stages listed in baseline.json are
+checked against their recorded per-player time; the run exits non-zero if
+any of them is slower than ``baseline * tolerance``. The baseline stores
+each time relative to a fixed pure-Python workload timed in the same
+process, and is scaled by that workload's time on the current machine, so
+it carries over between machines.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from .harness import StageResult, _time_call, measure_generation
+
+BASELINE_FILE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_PLAYERS = (1, 50, 500, 2000)
+DEFAULT_TOLERANCE = 1.5
+REFERENCE_ROUNDS = 5
+
+
+def _reference_workload() -> None:
+    # Dict building, string formatting and a keyed sort, like the stages themselves
+    names = {f"Location {index}": index for index in range(50000)}
+    sorted(names.items(), key=lambda item: item[1] % 101)
+
+
+def reference_us() -> float:
+    """Best time of the reference workload on this machine, in microseconds."""
+    return min(_time_call(_reference_workload) for _ in range(REFERENCE_ROUNDS)) * 1e6
+
+
+def print_results(results: List[StageResult]) -> None:
+    print(f"{'players':>7}  {'stage':<15} {'wall ms':>10} {'us/player':>10} "
+          f"{'allocs':>10} {'peak KiB':>10}")
+    for result in results:
+        print(f"{result.players:>7}  {result.stage:<15} {result.wall_time * 1e3:>10.2f} "
+              f"{result.per_player_us:>10.1f} {result.allocations:>10} "
+              f"{result.peak_memory / 1024:>10.1f}")
+
+
+def load_baseline() -> Dict[str, Dict[str, float]]:
+    if not BASELINE_FILE.exists():
+        return {}
+    return json.loads(BASELINE_FILE.read_text())
+
+
+def record_baseline(results: List[StageResult], stages: List[str], reference: float) -> None:
+    """Store the per-player time of the largest run for each guarded stage, relative to the reference."""
+    largest = max(result.players for result in results)
+    baseline = {
+        result.stage: {"players": result.players, "relative": round(result.per_player_us / reference, 6)}
+        for result in results if result.players == largest and result.stage in stages
+    }
+    BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+    print(f"\nRecorded baseline for {', '.join(sorted(baseline))} in {BASELINE_FILE.name}")
+
+
+def check_regressions(results: List[StageResult], tolerance: float, reference: float) -> List[str]:
+    """Compare each guarded stage's largest run against the baseline scaled to this machine."""
+    baseline = load_baseline()
+    failures = []
+    for stage, recorded in sorted(baseline.items()):
+        runs = [result for result in results if result.stage == stage]
+        if not runs:
+            continue
+        run = max(runs, key=lambda result: result.players)
+        expected = recorded["relative"] * reference
+        limit = expected * tolerance
+        status = "ok" if run.per_player_us <= limit else "REGRESSION"
+        print(f"  {stage:<15} {run.per_player_us:>8.1f} us/player "
+              f"(baseline {expected:.1f}, limit {limit:.1f}) {status}")
+        if status != "ok":
+            failures.append(stage)
+    return failures
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--players", type=int, nargs="+", default=list(DEFAULT_PLAYERS))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per player count (best is kept)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown factor against the baseline")
+    parser.add_argument("--record", action="store_true", help="write the current run as the new baseline")
+    parser.add_argument("--guard", nargs="+", default=["create_regions", "create_items", "set_rules"],
+                        help="stages written to the baseline by --record")
+    args = parser.parse_args(argv)
+
+    # Timed before and after the stages; the faster of the two stands for this machine
+    reference = reference_us()
+    results: List[StageResult] = []
+    for players in args.players:
+        results.extend(measure_generation(players, repeat=args.repeat))
+    reference = min(reference, reference_us())
+    print_results(results)
+    print(f"\nReference workload: {reference / 1e3:.2f} ms")
+
+    if args.record:
+        record_baseline(results, args.guard, reference)
+        return 0
+
+    print("\nRegression check:")
+    failures = check_regressions(results, args.tolerance, reference)
+    if failures:
+        print(f"\nFAILED: {', '.join(failures)} slower than baseline x{args.tolerance}")
+        return 1
+    print("\nAll guarded stages within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the blockupelago package.
+
+Usage:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --ref HEAD~1 --runs 30
+
+Imports the world in fresh interpreters (the way Archipelago's world loader
+meets it at startup) and reports the median cumulative import time of each
+blockupelago module from ``-X importtime``. Two modes are measured: "source"
+compiles every module on each start, which is what zipimport does for an
+.apworld that ships only .py files, and "bytecode" loads warm cached .pyc
+files. With --ref, the same package at another git revision is measured
+side by side.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List
+
+from .harness import APWORLD_DIR, STAND_IN_DIR
+
+
+def import_times(source_root: Path, runs: int, bytecode: bool) -> Dict[str, float]:
+    """Median cumulative import time in microseconds per blockupelago module."""
+    samples: Dict[str, List[int]] = {}
+    code = (f"import sys; sys.path[:0] = [{str(STAND_IN_DIR)!r}, {str(source_root)!r}]; "
+            f"import BaseClasses, Options, worlds.AutoWorld; import blockupelago")
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env["PYTHONPYCACHEPREFIX"] = cache_dir
+        command = [sys.executable, "-X", "importtime", "-c", code]
+        if bytecode:
+            # Warm the cache once so every measured run loads .pyc files
+            subprocess.run(command, env=env, capture_output=True, check=True)
+        else:
+            command.insert(1, "-B")
+        for _ in range(runs):
+            result = subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+            _collect(result.stderr, samples)
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+def _collect(stderr: str, samples: Dict[str, List[int]]) -> None:
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if name.startswith("blockupelago"):
+            samples.setdefault(name, []).append(int(cumulative))
+
+
+def export_revision(revision: str, target: Path) -> Path:
+    """Extract apworld/blockupelago at a git revision into target."""
+    archive = subprocess.run(["git", "archive", revision, "blockupelago"], cwd=APWORLD_DIR,
+                             capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=BytesIO(archive)) as tar:
+        tar.extractall(target)
+    return target
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--ref", help="git revision to compare against")
+    args = parser.parse_args(argv)
+
+    columns = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        roots = {"working tree": APWORLD_DIR}
+        if args.ref:
+            roots[args.ref] = export_revision(args.ref, Path(tmp))
+        for label, root in roots.items():
+            for mode in ("source", "bytecode"):
+                columns[f"{label} {mode}"] = import_times(root, args.runs, mode == "bytecode")
+
+    names = sorted({name for times in columns.values() for name in times})
+    print(f"{'module':<26}" + "".join(f"{label:>22}" for label in columns) + "   (us, cumulative)")
+    for name in names:
+        row = "".join(f"{times.get(name, float('nan')):>22.0f}" for times in columns.values())
+        print(f"{name:<26}{row}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
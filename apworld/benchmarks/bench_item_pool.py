@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Item pool construction benchmark for many same-option slots.
+
+Usage:
+    python -m benchmarks.bench_item_pool
+    python -m benchmarks.bench_item_pool --players 100 500 1000
+
+Compares BlockudokuWorld.create_items against the original per-item
+implementation (kept here as legacy_create_items) and checks that both
+produce the same pool, item for item.
+"""
+
+import argparse
+import sys
+from typing import Any, List
+
+from .harness import _time_call, build_multiworld, run_stage
+
+
+def legacy_create_items(world: Any) -> None:
+    """The pre-plan create_items: one create_item call and append per location."""
+    from blockupelago.Items import STARTER_PIECES
+    from blockupelago.Locations import location_table
+
+    location_count = len([loc for loc in location_table.values() if loc.code is not None])
+    piece_type_items = [
+        "Single Block", "Domino I", "Tromino I", "Tromino L",
+        "Tetromino I", "Tetromino O", "Tetromino T", "Tetromino L", "Tetromino S",
+        "Pentomino I", "Pentomino L", "Pentomino P", "Pentomino U", "Pentomino W", "Pentomino Plus",
+        "3x3 Corner", "3x3 T-Shape", "3x3 Cross"
+    ]
+    shape_pool = [p for p in piece_type_items if p not in STARTER_PIECES]
+    for item_name in shape_pool:
+        world.multiworld.itempool.append(world.create_item(item_name))
+    for item_name in ("4th Piece Slot", "5th Piece Slot",
+                      "Permanent Free Rotate", "Permanent Free Mirror", "Permanent Free Hold"):
+        world.multiworld.itempool.append(world.create_item(item_name))
+
+    filler_count = location_count - (len(shape_pool) + 5)
+    n_abilities = (filler_count * 2) // 3
+    n_mults = filler_count - n_abilities
+    ability_items = [
+        "Rotate Ability", "Undo Ability", "Remove Block", "Hold Ability", "Mirror Ability", "Shrink Ability"
+    ]
+    for i in range(n_abilities):
+        world.multiworld.itempool.append(world.create_item(ability_items[i % len(ability_items)]))
+    for i in range(n_mults):
+        if i % 10 < 5:
+            item_name = "Score Multiplier +10%"
+        elif i % 10 < 8:
+            item_name = "Score Multiplier +25%"
+        else:
+            item_name = "Score Multiplier +50%"
+        world.multiworld.itempool.append(world.create_item(item_name))
+
+
+def _pool_signature(multiworld: Any) -> List[tuple]:
+    return [(item.name, int(item.classification), item.code, item.player) for item in multiworld.itempool]
+
+
+def bench(players: int, repeat: int) -> None:
+    legacy_time = current_time = float("inf")
+    for _ in range(repeat):
+        legacy = build_multiworld(players)
+        run_stage(legacy, "create_regions")
+        legacy_time = min(legacy_time, _time_call(
+            lambda: [legacy_create_items(legacy.worlds[player]) for player in legacy.player_ids]))
+
+        current = build_multiworld(players)
+        run_stage(current, "create_regions")
+        current_time = min(current_time, _time_call(lambda: run_stage(current, "create_items")))
+
+    if _pool_signature(legacy) != _pool_signature(current):
+        raise AssertionError(f"create_items pool differs from the legacy pool with {players} players")
+
+    print(f"{players:>7}  {legacy_time / players * 1e6:>12.1f} {current_time / players * 1e6:>12.1f} "
+          f"{legacy_time / current_time:>8.2f}x")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--players", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'players':>7}  {'legacy us/p':>12} {'plan us/p':>12} {'speedup':>9}")
+    for players in args.players:
+        bench(players, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Placement mask table: build, load and move enumeration.
+
+Usage:
+    python -m benchmarks.bench_masks
+    python -m benchmarks.bench_masks --boards 2000 --seconds 2
+
+Times building the table from the piece catalogue, loading it again from an
+existing file (memory-mapped), and enumerating the legal moves of random
+boards with the table, with board.legal_placements and with a nested loop
+over can_place. Checks that all three agree first.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from blockudoku_sim import GRID_SIZE, can_place, legal_placements
+from blockudoku_sim.masks import MaskTable, build_table, load_table, write_table
+
+
+def timed(action: Callable[[], object], repeat: int) -> float:
+    """Median seconds per call."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def nested_moves(board: int, shape) -> List[int]:
+    return [r * GRID_SIZE + c for r in range(GRID_SIZE) for c in range(GRID_SIZE) if can_place(board, shape, r, c)]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--boards", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "placement_masks.bin"
+        cold = timed(lambda: MaskTable(build_table()), args.repeat)
+        write_table(path)
+        warm = timed(lambda: load_table(path).close(), args.repeat)
+        table = load_table(path)
+        print(f"table: {len(table.shapes)} orientations, {table.placement_count} placements, "
+              f"{path.stat().st_size} bytes")
+        print(f"cold build {cold * 1e3:8.2f} ms")
+        print(f"warm mmap  {warm * 1e3:8.2f} ms")
+
+        rng = random.Random(args.seed)
+        samples = [(rng.getrandbits(81) & rng.getrandbits(81), rng.choice(table.shapes)) for _ in range(args.boards)]
+        for board, shape in samples:
+            expected = [p.row * GRID_SIZE + p.col for p in legal_placements(board, shape)]
+            assert [table.anchors[i] for i in table.moves(board, shape)] == expected, (board, shape)
+            assert nested_moves(board, shape) == expected, (board, shape)
+
+        rates = {}
+        for label, enumerate_moves in (("nested loop", nested_moves),
+                                       ("placements", legal_placements),
+                                       ("mask table", table.moves)):
+            done, start = 0, time.perf_counter()
+            while time.perf_counter() - start < args.seconds:
+                for board, shape in samples:
+                    enumerate_moves(board, shape)
+                done += len(samples)
+            rates[label] = done / (time.perf_counter() - start)
+        table.close()
+
+    print(f"\n{'enumerator':<12} {'boards/s':>12}")
+    for label, rate in rates.items():
+        print(f"{label:<12} {rate:>12,.0f}  ({rate / rates['nested loop']:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
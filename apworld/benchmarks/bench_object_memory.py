@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Per-object memory of Blockupelago items and locations.
+
+Usage:
+    python -m benchmarks.bench_object_memory
+    python -m benchmarks.bench_object_memory --count 200000
+
+Allocates the same number of objects with plain subclasses of the base
+classes (which carry a per-instance __dict__) and with slotted subclasses,
+and reports tracemalloc bytes per object. Items use the shipped slotted
+BlockudokuItem. Location has no __slots__ upstream, so its subclasses keep a
+__dict__ either way; the location row shows what adding slots on top costs,
+which is why BlockudokuLocation does not declare any.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from typing import Callable, List
+
+from .harness import load_world
+
+
+def bytes_per_object(factory: Callable[[int], object], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        objects = [factory(i) for i in range(count)]
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # The list holding the objects is not part of their footprint
+    return (current - base - sys.getsizeof(objects)) / count
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    load_world()
+    from BaseClasses import Item, ItemClassification, Location, MultiWorld, Region
+    from blockupelago.Items import BlockudokuItem
+    from blockupelago.Locations import BlockudokuLocation
+
+    class DictItem(Item):
+        game: str = "Blockupelago"
+
+    class SlottedLocation(Location):
+        game: str = "Blockupelago"
+        __slots__ = ("player", "name", "address", "parent_region", "item")
+
+        def __init__(self, *args):
+            super().__init__(*args)
+            self.item = None
+
+    region = Region("Game Area", 1, MultiWorld(1))
+    name = "Score Multiplier +10%"
+    progression = ItemClassification.progression
+
+    rows = [
+        ("item", lambda i: DictItem(name, progression, 8004001, 1),
+         lambda i: BlockudokuItem(name, progression, 8004001, 1)),
+        ("location", lambda i: BlockudokuLocation(1, name, 9000000 + i, region),
+         lambda i: SlottedLocation(1, name, 9000000 + i, region)),
+    ]
+
+    print(f"{'object':<10} {'__dict__ B':>12} {'slotted B':>12} {'saved':>8}")
+    for label, legacy, compact in rows:
+        before = bytes_per_object(legacy, args.count)
+        after = bytes_per_object(compact, args.count)
+        print(f"{label:<10} {before:>12.1f} {after:>12.1f} {1 - after / before:>8.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Options-space stress sweep for BlockudokuWorld.
+
+Usage:
+    python -m benchmarks.bench_options_sweep
+    python -m benchmarks.bench_options_sweep --seeds 5000 --players 1 2 8 --workers 4
+    python -m benchmarks.bench_options_sweep --out sweep_report.json
+
+Builds cases from every field of BlockudokuOptions: first each option at its
+boundary values with the rest at their defaults, then random combinations,
+with every slot of a multi-player seed drawing its own options. Each case is
+generated in a worker process against the offline stand-in: the world
+stages, an item/location count check per player, an assumed fill
+(stand_in/Fill.py) and a sweep checking it is beatable with every location
+reachable. The report lists fill failures, count mismatches, generation time
+percentiles, the slowest cases and the mean time per option value, so
+combinations that break the pool-equals-locations invariant or blow up
+generation time show up before players hit them. Exits non-zero if any case
+failed.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .harness import STAGES, build_multiworld, install_stand_in, run_stage
+
+SLOWEST_SHOWN = 10
+# Ranges wider than this are reported in this many equal-width buckets
+VALUE_BUCKETS = 5
+
+
+class Case(NamedTuple):
+    index: int
+    seed: int
+    options: Tuple[Dict[str, Any], ...]  # one per player
+
+
+def option_space() -> Dict[str, Tuple[Tuple[int, ...], Any]]:
+    """Per BlockudokuOptions field: (boundary values, default)."""
+    install_stand_in()
+    from Options import Choice, Range, Toggle
+    from blockupelago.Options import BlockudokuOptions
+
+    space = {}
+    for field in fields(BlockudokuOptions):
+        option = field.type
+        if issubclass(option, Range):
+            values = (option.range_start, option.range_end)
+        elif issubclass(option, Choice):
+            values = tuple(sorted(option.options.values()))
+        elif issubclass(option, Toggle):
+            values = (0, 1)
+        else:
+            continue
+        space[field.name] = (values, option.default)
+    return space
+
+
+def sample_options(space: Dict[str, Tuple[Tuple[int, ...], Any]], rng: random.Random) -> Dict[str, Any]:
+    options = {}
+    for name, (values, _) in space.items():
+        if len(values) == 2 and values[1] - values[0] > 1:
+            options[name] = rng.randint(values[0], values[1])
+        else:
+            options[name] = rng.choice(values)
+    return options
+
+
+def build_cases(seeds: int, player_counts: Sequence[int], seed: int) -> List[Case]:
+    space = option_space()
+    rng = random.Random(seed)
+    defaults = {name: default for name, (_, default) in space.items()}
+    slots: List[Tuple[Dict[str, Any], ...]] = [
+        ({**defaults, name: value},) for name, (values, _) in space.items() for value in values
+    ]
+    while len(slots) < seeds:
+        players = rng.choice(player_counts)
+        slots.append(tuple(sample_options(space, rng) for _ in range(players)))
+    return [Case(index, rng.getrandbits(32), options) for index, options in enumerate(slots[:seeds])]
+
+
+def case_multiworld(case: Case) -> Any:
+    """A multiworld whose slots each get their own options."""
+    from worlds.AutoWorld import make_options
+
+    multiworld = build_multiworld(len(case.options), case.seed)
+    for player, options in zip(multiworld.player_ids, case.options):
+        world = multiworld.worlds[player]
+        world.options = make_options(type(world).options_dataclass, **options)
+    return multiworld
+
+
+def generate(case: Case) -> Dict[str, Any]:
+    """Generate and fill one seed; never raises, failures are part of the record."""
+    from Fill import distribute_items_restrictive, beatable, unreachable
+
+    record: Dict[str, Any] = {"case": case.index, "seed": case.seed, "players": len(case.options),
+                              "ok": False, "error": None, "mismatches": [], "stage_ms": {}}
+    start = time.perf_counter()
+    try:
+        multiworld = case_multiworld(case)
+        for stage in STAGES:
+            stage_start = time.perf_counter()
+            run_stage(multiworld, stage)
+            record["stage_ms"][stage] = (time.perf_counter() - stage_start) * 1e3
+            if stage == "create_items":
+                record["mismatches"] = _count_mismatches(multiworld)
+        fill_start = time.perf_counter()
+        distribute_items_restrictive(multiworld)
+        record["stage_ms"]["fill"] = (time.perf_counter() - fill_start) * 1e3
+        if not beatable(multiworld):
+            raise RuntimeError("filled multiworld is not beatable")
+        missed = unreachable(multiworld)
+        if missed:
+            raise RuntimeError(f"{len(missed)} locations are unreachable, e.g. player {missed[0].player}'s "
+                               f"{missed[0].name}")
+        record["ok"] = not record["mismatches"]
+    except Exception as error:
+        record["error"] = f"{type(error).__name__}: {error}"
+    record["total_ms"] = (time.perf_counter() - start) * 1e3
+    return record
+
+
+def _count_mismatches(multiworld: Any) -> List[Dict[str, int]]:
+    items = Counter(item.player for item in multiworld.itempool)
+    locations = Counter(location.player for location in multiworld.get_locations() if location.item is None)
+    return [{"player": player, "items": items[player], "locations": locations[player]}
+            for player in multiworld.player_ids if items[player] != locations[player]]
+
+
+def run_cases(cases: List[Case], workers: int, chunksize: int) -> List[Dict[str, Any]]:
+    if workers == 1:
+        install_stand_in()
+        return [generate(case) for case in cases]
+    with ProcessPoolExecutor(workers, initializer=install_stand_in) as pool:
+        return list(pool.map(generate, cases, chunksize=chunksize))
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _value_label(value: Any, values: Tuple[int, ...]) -> str:
+    low, high = values[0], values[-1]
+    if len(values) != 2 or high - low < VALUE_BUCKETS * 2:
+        return str(value)
+    width = -(-(high - low + 1) // VALUE_BUCKETS)
+    start = low + (value - low) // width * width
+    return f"{start}-{min(start + width - 1, high)}"
+
+
+def aggregate(cases: List[Case], records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    space = option_space()
+    times = [record["total_ms"] for record in records]
+    errors = Counter(record["error"] for record in records if record["error"])
+    by_value: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+    for case, record in zip(cases, records):
+        per_player = record["total_ms"] / record["players"]
+        for options in case.options:
+            for name, value in options.items():
+                by_value[name][_value_label(value, space[name][0])].append(per_player)
+
+    def stage_summary(stage: str) -> Dict[str, float]:
+        values = [record["stage_ms"][stage] for record in records if stage in record["stage_ms"]]
+        return {"p50": statistics.median(values), "p95": _percentile(values, 0.95), "max": max(values)} \
+            if values else {}
+
+    slowest = sorted(zip(cases, records), key=lambda pair: pair[1]["total_ms"], reverse=True)[:SLOWEST_SHOWN]
+    return {
+        "cases": len(records),
+        "ok": sum(record["ok"] for record in records),
+        "errors": dict(errors.most_common()),
+        "mismatches": [{"case": record["case"], "options": list(case.options), "mismatches": record["mismatches"]}
+                       for case, record in zip(cases, records) if record["mismatches"]],
+        "failures": [{"case": record["case"], "seed": record["seed"], "options": list(case.options),
+                      "error": record["error"]} for case, record in zip(cases, records) if record["error"]],
+        "total_ms": {"p50": statistics.median(times), "p95": _percentile(times, 0.95), "max": max(times)},
+        "stage_ms": {stage: stage_summary(stage) for stage in (*STAGES, "fill")},
+        "slowest": [{"case": record["case"], "seed": record["seed"], "total_ms": record["total_ms"],
+                     "options": list(case.options)} for case, record in slowest],
+        "per_player_ms_by_option": {
+            name: {label: round(statistics.mean(samples), 3)
+                   for label, samples in sorted(values.items(), key=lambda pair: int(pair[0].split("-")[0]))}
+            for name, values in sorted(by_value.items())
+        },
+    }
+
+
+def print_report(report: Dict[str, Any], elapsed: float) -> None:
+    print(f"{report['cases']} seeds in {elapsed:.1f} s: {report['ok']} ok, "
+          f"{len(report['failures'])} failed, {len(report['mismatches'])} with count mismatches")
+    for error, count in report["errors"].items():
+        print(f"  {count:>5} x {error}")
+    print(f"\n{'stage':<15} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for stage, summary in (*report["stage_ms"].items(), ("total", report["total_ms"])):
+        if summary:
+            print(f"{stage:<15} {summary['p50']:>9.2f} {summary['p95']:>9.2f} {summary['max']:>9.2f}")
+    print("\nslowest seeds:")
+    for entry in report["slowest"]:
+        print(f"  case {entry['case']:>5} ({len(entry['options'])} players) {entry['total_ms']:>9.2f} ms")
+    print("\nper-player ms by option value (spread shows which options drive generation time):")
+    for name, values in report["per_player_ms_by_option"].items():
+        low, high = min(values.values()), max(values.values())
+        print(f"  {name:<28} {low:>8.2f} .. {high:>8.2f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seeds", type=int, default=2000)
+    parser.add_argument("--players", type=int, nargs="+", default=[1, 1, 2, 4],
+                        help="player counts to draw from (repeat a count to weight it)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write the full report as JSON")
+    args = parser.parse_args(argv)
+
+    cases = build_cases(args.seeds, args.players, args.seed)
+    start = time.perf_counter()
+    records = run_cases(cases, args.workers, args.chunksize)
+    elapsed = time.perf_counter() - start
+
+    report = aggregate(cases, records)
+    print_report(report, elapsed)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+        print(f"\nWrote {args.out}")
+    return 0 if report["ok"] == report["cases"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
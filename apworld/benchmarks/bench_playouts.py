@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Throughput of the batched playout simulator.
+
+Usage:
+    python -m benchmarks.bench_playouts
+    python -m benchmarks.bench_playouts --games 2048 --workers 1 4
+
+Plays the same number of starter-piece games with different lockstep batch
+sizes and process counts and reports games per second. Batch size 1 is the
+one-game-at-a-time baseline. Also checks that the totals do not depend on
+the worker count for a fixed seed.
+"""
+
+import argparse
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+from blockudoku_sim.playout import UnlockSet, run_playouts
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--games", type=int, default=512)
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 16, 128, 512])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2])
+    args = parser.parse_args(argv)
+
+    unlocks = [UnlockSet()]
+    results = {}
+    print(f"{'batch':>6} {'workers':>8} {'games/s':>10} {'mean score':>11}")
+    for batch in args.batches:
+        games = args.games if batch > 1 else min(args.games, 64)
+        for workers in args.workers:
+            start = time.perf_counter()
+            stats = run_playouts(unlocks, games, seed=1, batch=batch, workers=workers)[0]
+            elapsed = time.perf_counter() - start
+            results.setdefault(batch, []).append(stats)
+            print(f"{batch:>6} {workers:>8} {games / elapsed:>10.1f} {stats.score.mean():>11.1f}")
+
+    for batch, runs in results.items():
+        for stats in runs[1:]:
+            assert all(np.array_equal(a, b) for a, b in zip(runs[0], stats)), f"batch {batch} differs by workers"
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
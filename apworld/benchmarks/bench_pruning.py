@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Location pruning benchmark for the milestone_pruning option.
+
+Usage:
+    python -m benchmarks.bench_pruning
+    python -m benchmarks.bench_pruning --players 200 --goals 10000 30000 100000
+
+For each milestone_pruning mode and goal_score, generates a multiworld of
+Blockupelago slots and reports how many locations are created, how many of
+them are excluded, and the create_regions + create_items time per player.
+Checks that every world still has exactly one pool item per location, so
+pruning never leaves the fill short of items or locations, and at least one
+filler item per excluded location, since Fill puts nothing else on them
+(tests/test_pruning.py checks both under pytest).
+"""
+
+import argparse
+import sys
+from typing import Dict, List, Tuple
+
+from .harness import build_multiworld, install_stand_in, measure_generation, run_stage
+
+MODES = ("off", "prune", "exclude")
+DEFAULT_GOALS = (10000, 30000, 60000, 100000)
+
+
+def make_options(goal_score: int, mode: str, gem_checks: int) -> Dict[str, int]:
+    from blockupelago.Options import MilestonePruning
+    return {"goal_score": goal_score, "milestone_pruning": getattr(MilestonePruning, f"option_{mode}"),
+            "gem_checks": gem_checks}
+
+
+def location_counts(options: Dict[str, int]) -> Tuple[int, int, int, int]:
+    """(locations, excluded, pool items, filler pool items) of a one-player world."""
+    from BaseClasses import ItemClassification, LocationProgressType
+
+    multiworld = build_multiworld(1, options=options)
+    run_stage(multiworld, "create_regions")
+    run_stage(multiworld, "create_items")
+    locations = [location for region in multiworld.regions for location in region.locations
+                 if location.address is not None]
+    excluded = sum(location.progress_type == LocationProgressType.EXCLUDED for location in locations)
+    filler = sum(item.classification == ItemClassification.filler for item in multiworld.itempool)
+    return len(locations), excluded, len(multiworld.itempool), filler
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--goals", type=int, nargs="+", default=list(DEFAULT_GOALS))
+    parser.add_argument("--gem-checks", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    install_stand_in()
+    failures = 0
+    print(f"{'goal':>7} {'mode':<8} {'locations':>9} {'excluded':>8} {'items':>6} {'filler':>6} {'us/player':>10}")
+    for goal_score in args.goals:
+        for mode in MODES:
+            options = make_options(goal_score, mode, args.gem_checks)
+            locations, excluded, items, filler = location_counts(options)
+            results = measure_generation(args.players, args.repeat, options=options)
+            per_player = sum(result.per_player_us for result in results
+                             if result.stage in ("create_regions", "create_items"))
+            status = ("  MISMATCH" if items != locations else
+                      "  SHORT OF FILLER" if filler < excluded else "")
+            failures += bool(status)
+            print(f"{goal_score:>7} {mode:<8} {locations:>9} {excluded:>8} {items:>6} {filler:>6} "
+                  f"{per_player:>10.1f}{status}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Goal rule evaluation during a full-multiworld sweep.
+
+Usage:
+    python -m benchmarks.bench_rules
+    python -m benchmarks.bench_rules --players 100 1000 --rounds 20
+
+Generates a multiworld of Blockupelago players, with milestone_logic off
+(only the Goal is gated) and on, fills it with the stand-in's assumed fill
+and sweeps it from an empty CollectionState, once with the difficulty-table
+Goal rule from Rules.py and once with the original rule (kept here as
+legacy_goal_rule: can_reach on the goal's score milestone). Also times the
+goal rules alone with every player marked stale, which is what a sweep sees
+after each collected item. Checks that collect/remove keep the rule counters
+exact (tests/test_rules.py runs the same check).
+"""
+
+import argparse
+import sys
+from itertools import product
+from typing import Any, List
+
+from .harness import _time_call, build_multiworld, install_stand_in, run_stage
+
+
+def legacy_goal_rule(world: Any):
+    """The pre-Rules.py goal rule: reach the score milestone at or above goal_score."""
+    from blockupelago.Locations import first_milestone_at_least
+
+    player = world.player
+    goal_milestone = first_milestone_at_least("score", world.options.goal_score.value)
+    return lambda state, loc=goal_milestone.name: state.can_reach(loc, "Location", player)
+
+
+def generate(players: int, milestone_logic: int, legacy: bool) -> Any:
+    from Fill import distribute_items_restrictive
+
+    multiworld = build_multiworld(players, options={"goal_score": 50000, "milestone_logic": milestone_logic})
+    for stage in ("create_regions", "create_items", "set_rules"):
+        run_stage(multiworld, stage)
+    if legacy:
+        for player in multiworld.player_ids:
+            multiworld.get_location("Goal", player).access_rule = legacy_goal_rule(multiworld.worlds[player])
+
+    # The goal (and with milestone_logic the milestones) are gated, so the pool is placed by
+    # the assumed fill rather than shuffled
+    distribute_items_restrictive(multiworld)
+    return multiworld
+
+
+def check_counters(multiworld: Any, state: Any) -> None:
+    from collections import Counter
+    from blockupelago.Rules import COUNTER_FOR_ITEM
+
+    # Every collected advancement item feeding a counter is counted once
+    expected = {player: Counter() for player in multiworld.player_ids}
+    for item in multiworld.itempool:
+        if item.advancement and item.name in COUNTER_FOR_ITEM:
+            expected[item.player][COUNTER_FOR_ITEM[item.name]] += 1
+    for player in multiworld.player_ids:
+        counters = state.prog_items[player]
+        assert all(counters[counter] == count for counter, count in expected[player].items()), counters
+        assert expected[player], "no counted items in the pool"
+    for location in multiworld.get_locations():
+        if location.item and location.item.advancement:
+            state.remove(location.item)
+    assert not any(state.prog_items.values()), "remove left counters behind"
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--players", type=int, nargs="+", default=[50, 500])
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    install_stand_in()
+    from BaseClasses import CollectionState
+
+    print(f"{'players':>7} {'logic':<6} {'rule':<8} {'sweep ms':>10} {'goal rules us/eval':>19}")
+    for players, milestone_logic, (label, legacy) in product(args.players, (0, 1),
+                                                             (("legacy", True), ("table", False))):
+        multiworld = generate(players, milestone_logic, legacy)
+        state = CollectionState(multiworld)
+        sweep = _time_call(state.sweep_for_advancements)
+        assert multiworld.can_beat_game(state), "sweep did not reach every goal"
+
+        rules = [multiworld.get_location("Goal", player).access_rule for player in multiworld.player_ids]
+
+        def evaluate_rules() -> None:
+            for _ in range(args.rounds):
+                for player in multiworld.player_ids:
+                    state.stale[player] = True
+                for rule in rules:
+                    rule(state)
+
+        rule_time = _time_call(evaluate_rules)
+        print(f"{players:>7} {'on' if milestone_logic else 'off':<6} {label:<8} {sweep * 1e3:>10.1f} "
+              f"{rule_time / (args.rounds * players) * 1e6:>19.2f}")
+        check_counters(multiworld, state)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Throughput of the alias-table piece sampler.
+
+Usage:
+    python -m benchmarks.bench_sampler
+    python -m benchmarks.bench_sampler --hands 100000
+
+Reports draws per second for a line-by-line port of getWeightedRandomPiece
+in app/utils/blockudoku.ts (kept below; its linear scan is the baseline),
+NumPy's choice and the alias tables, and the time to precompute the table
+for every unlock set. tests/test_sampler.py checks the sampler's
+distribution against the same port.
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import List, Sequence
+
+import numpy as np
+
+from blockudoku_sim.pieces import ALL_PIECES, Piece
+from blockudoku_sim.sampler import PieceSampler, alias_table, precompute_tables
+from blockudoku_sim.unlocks import UnlockSet
+
+
+def ts_weighted_random_piece(available: Sequence[Piece], size_ratio: float, rng: random.Random) -> Piece:
+    """getWeightedRandomPiece, with Math.random() as rng.random()."""
+    weights = []
+    for piece in available:
+        size = sum(cell == 1 for row in piece.shape for cell in row)
+        normalized_size = (size - 1) / 4
+        distance = abs(normalized_size - size_ratio)
+        weights.append(max(0.1, 1 - distance))
+    remaining = rng.random() * sum(weights)
+    for piece, weight in zip(available, weights):
+        remaining -= weight
+        if remaining <= 0:
+            return piece
+    return available[-1]
+
+
+def throughput(hands: int) -> None:
+    unlocks = UnlockSet(pieces=frozenset(piece.name for piece in ALL_PIECES), slots=3)
+    available = list(ALL_PIECES)
+    alias_table(unlocks.pieces)
+    draws = hands * unlocks.slots
+
+    rng = random.Random(1)
+    scan_draws = min(draws, 100000)
+    start = time.perf_counter()
+    for _ in range(scan_draws):
+        ts_weighted_random_piece(available, 0.5, rng)
+    scan = scan_draws / (time.perf_counter() - start)
+
+    generator = np.random.default_rng(1)
+    weights = np.array([max(0.1, 1 - abs((sum(map(sum, piece.shape)) - 1) / 4 - 0.5)) for piece in available])
+    start = time.perf_counter()
+    generator.choice(len(available), size=(hands, unlocks.slots), p=weights / weights.sum())
+    choice = draws / (time.perf_counter() - start)
+
+    sampler = PieceSampler(seed=1)
+    start = time.perf_counter()
+    sampler.hands(unlocks, hands)
+    batched = draws / (time.perf_counter() - start)
+
+    single_draws = min(draws, 20000)
+    start = time.perf_counter()
+    for _ in range(single_draws):
+        sampler.draw(unlocks.pieces)
+    single = single_draws / (time.perf_counter() - start)
+
+    print(f"\n{'method':<28} {'draws/s':>12}")
+    for label, rate in (("port, linear scan", scan), ("numpy choice, batch", choice),
+                        ("alias, one draw per call", single), ("alias, batch of hands", batched)):
+        print(f"{label:<28} {rate:>12,.0f}")
+
+    start = time.perf_counter()
+    tables = precompute_tables()
+    print(f"\nbuilt {len(tables.columns)} unlock-set tables in {time.perf_counter() - start:.2f} s "
+          f"({sum(array.nbytes for array in tables) / 2 ** 20:.1f} MiB)")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--hands", type=int, default=1000000, help="hands drawn for the throughput run")
+    args = parser.parse_args(argv)
+
+    throughput(args.hands)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Games per second of the beam-search player.
+
+Usage:
+    python -m benchmarks.bench_search
+    python -m benchmarks.bench_search --widths 1 8 32 --goal 10000
+
+Plays the same seeded games up to a small goal score at several beam widths
+and in the time-budgeted mode, and reports games/s, search nodes/s, the
+transposition table hit rate and the mean score. Fixed-width runs are
+replayed once to check that they are deterministic.
+"""
+
+import argparse
+import sys
+import time
+from typing import List
+
+from blockudoku_sim.search import BeamPlayer, SearchConfig
+from blockudoku_sim.unlocks import UnlockSet
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--games", type=int, default=4)
+    parser.add_argument("--goal", type=int, default=3000)
+    parser.add_argument("--widths", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--hand-budget", type=float, default=0.01)
+    args = parser.parse_args(argv)
+
+    configs = [(f"beam {width}", SearchConfig(width)) for width in args.widths]
+    configs.append((f"{args.hand_budget * 1e3:g} ms/hand", SearchConfig(args.widths[0], args.hand_budget)))
+
+    print(f"{'player':<14} {'games/s':>8} {'nodes/s':>10} {'tt hits':>8} {'mean score':>11} {'reached':>8}")
+    for label, config in configs:
+        player = BeamPlayer(UnlockSet(), config)
+        start = time.perf_counter()
+        results = [player.play(seed, goal_score=args.goal) for seed in range(args.games)]
+        elapsed = time.perf_counter() - start
+        if config.hand_budget is None:
+            replay = BeamPlayer(UnlockSet(), config)
+            assert [replay.play(seed, goal_score=args.goal)[:5] for seed in range(args.games)] == \
+                [result[:5] for result in results], f"{label} is not deterministic"
+        print(f"{label:<14} {len(results) / elapsed:>8.2f} {player.nodes / elapsed:>10,.0f} "
+              f"{player.transposition_hits / max(player.nodes, 1):>8.1%} "
+              f"{sum(r.score for r in results) / len(results):>11.0f} "
+              f"{sum(r.reached_goal for r in results):>4}/{len(results)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+slot_data size budget for BlockudokuWorld.
+
+Usage:
+    python -m benchmarks.bench_slot_data
+    python -m benchmarks.bench_slot_data --players 1 100 1000
+
+Runs fill_slot_data for rooms of Blockupelago slots (all on default
+options, and with slots cycling through every milestone_pruning mode and a
+spread of goal scores), then reports the JSON size the client receives per
+slot and the zlib-compressed pickle size of all slot_data, the way
+Archipelago stores it in the multidata. Fails if a slot's JSON is over
+SLOT_BUDGET bytes, if the compressed room data averages more than
+ROOM_BUDGET bytes per slot, or if the encoded tables do not decode back to
+the slot's milestone thresholds, locations and item IDs. tests/test_slot_data.py
+runs the same checks on a 200-slot room.
+"""
+
+import argparse
+import json
+import pickle
+import sys
+import zlib
+from typing import Any, Dict, List
+
+from .harness import build_multiworld, install_stand_in, run_stage
+
+DEFAULT_PLAYERS = (1, 50, 500)
+# Bytes of JSON per slot, as sent in the Connected packet
+SLOT_BUDGET = 1024
+# Compressed multidata bytes per slot, averaged over the room
+ROOM_BUDGET = 256
+
+
+def mixed_options(player: int) -> Dict[str, Any]:
+    return {"milestone_pruning": player % 3, "goal_score": 10000 + (player % 10) * 10000,
+            "gem_checks": (player * 7) % 101}
+
+
+def build_room(players: int, mixed: bool) -> Any:
+    from worlds.AutoWorld import make_options
+
+    multiworld = build_multiworld(players)
+    if mixed:
+        for player in multiworld.player_ids:
+            world = multiworld.worlds[player]
+            world.options = make_options(type(world).options_dataclass, **mixed_options(player))
+    run_stage(multiworld, "create_regions")
+    return multiworld
+
+
+def check_round_trip(multiworld: Any, slot_data: Dict[int, Dict[str, Any]]) -> List[str]:
+    from blockupelago.Data import ITEM_NAME_TO_ID
+    from blockupelago.Locations import milestone_index
+    from blockupelago.SlotData import decode_tables
+
+    thresholds = {category: [milestone.threshold for milestone in milestones]
+                  for category, milestones in milestone_index.items()}
+    errors = []
+    for player, data in slot_data.items():
+        decoded = decode_tables(json.loads(json.dumps(data["tables"])))
+        codes = sorted(location.address for location in multiworld.get_locations(player)
+                       if location.address is not None)
+        if decoded["milestones"] != thresholds:
+            errors.append(f"player {player}: milestone thresholds differ")
+        if decoded["locations"] != codes:
+            errors.append(f"player {player}: {len(decoded['locations'])} encoded locations, {len(codes)} created")
+        if decoded["items"] != sorted(ITEM_NAME_TO_ID.values()):
+            errors.append(f"player {player}: item IDs differ")
+    return errors
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--players", type=int, nargs="+", default=list(DEFAULT_PLAYERS))
+    args = parser.parse_args(argv)
+
+    install_stand_in()
+    failures: List[str] = []
+    print(f"{'players':>7} {'options':<8} {'max JSON B':>10} {'room zlib B':>11} {'B/slot':>7}")
+    for players in args.players:
+        for mixed in (False, True):
+            multiworld = build_room(players, mixed)
+            slot_data = {player: multiworld.worlds[player].fill_slot_data() for player in multiworld.player_ids}
+            largest = max(len(json.dumps(data, separators=(",", ":"))) for data in slot_data.values())
+            room = len(zlib.compress(pickle.dumps(slot_data), 9))
+            label = "mixed" if mixed else "default"
+            print(f"{players:>7} {label:<8} {largest:>10} {room:>11} {room / players:>7.1f}")
+            if largest > SLOT_BUDGET:
+                failures.append(f"{players} {label}: slot JSON {largest} B over {SLOT_BUDGET} B")
+            if players > 1 and room / players > ROOM_BUDGET:
+                failures.append(f"{players} {label}: {room / players:.0f} B/slot over {ROOM_BUDGET} B")
+            failures += check_round_trip(multiworld, slot_data)
+
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+Benchmark Harness
+
+Loads the Blockupelago world against the offline Archipelago stand-in in
+``stand_in/`` and measures generation stages across many players.
+"""
+
+import gc
+import importlib.util
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+APWORLD_DIR = BENCHMARK_DIR.parent
+STAND_IN_DIR = BENCHMARK_DIR / "stand_in"
+
+STAGES = ("create_regions", "create_items", "set_rules", "fill_slot_data")
+
+
+def install_stand_in() -> None:
+    """Put the stand-in core and the apworld sources at the front of sys.path."""
+    for path in (str(APWORLD_DIR), str(STAND_IN_DIR)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def install_stand_in_if_missing() -> None:
+    """
+    For user-facing tools: keep a real Archipelago core if one is importable
+    (say, run from inside an Archipelago checkout), else install_stand_in.
+    Either way the apworld sources are importable.
+    """
+    if importlib.util.find_spec("BaseClasses") is None:
+        install_stand_in()
+    elif str(APWORLD_DIR) not in sys.path:
+        sys.path.append(str(APWORLD_DIR))
+
+
+def load_world() -> type:
+    """Import the world package and return BlockudokuWorld."""
+    install_stand_in()
+    from blockupelago import BlockudokuWorld
+    return BlockudokuWorld
+
+
+def build_multiworld(players: int, seed: int = 0, options: Optional[Dict[str, Any]] = None) -> Any:
+    """Create a MultiWorld where every slot is a Blockupelago player."""
+    world_type = load_world()
+    from BaseClasses import MultiWorld
+    from worlds.AutoWorld import make_options
+
+    multiworld = MultiWorld(players, seed)
+    for player in multiworld.player_ids:
+        multiworld.game[player] = world_type.game
+        multiworld.player_name[player] = f"Blockupelago{player}"
+        world = world_type(multiworld, player)
+        world.options = make_options(world_type.options_dataclass, **(options or {}))
+        multiworld.worlds[player] = world
+    return multiworld
+
+
+def run_stage(multiworld: Any, stage: str) -> None:
+    """Run one generation stage for every player, the way Archipelago's Main does."""
+    from worlds.AutoWorld import call_all
+
+    if stage == "fill_slot_data":
+        for player in multiworld.player_ids:
+            multiworld.worlds[player].fill_slot_data()
+    else:
+        call_all(multiworld, stage)
+
+
+class StageResult(NamedTuple):
+    stage: str
+    players: int
+    wall_time: float
+    allocations: int
+    peak_memory: int
+
+    @property
+    def per_player_us(self) -> float:
+        return self.wall_time / self.players * 1e6
+
+
+def _time_call(func: Callable[[], None]) -> float:
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def _trace_call(func: Callable[[], None]) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocations = sum(max(stat.count_diff, 0) for stat in after.compare_to(before, "lineno"))
+    return allocations, peak - base
+
+
+def measure_generation(players: int, repeat: int = 3, seed: int = 0,
+                       options: Optional[Dict[str, Any]] = None) -> List[StageResult]:
+    """
+    Measure every stage for the given player count.
+
+    Wall time is the best of ``repeat`` untraced runs; allocations and peak
+    memory come from one separate run under tracemalloc so tracing overhead
+    never leaks into the timings.
+    """
+    wall_times: Dict[str, float] = {stage: float("inf") for stage in STAGES}
+    for _ in range(repeat):
+        multiworld = build_multiworld(players, seed, options)
+        for stage in STAGES:
+            elapsed = _time_call(lambda: run_stage(multiworld, stage))
+            wall_times[stage] = min(wall_times[stage], elapsed)
+        del multiworld
+
+    results = []
+    multiworld = build_multiworld(players, seed, options)
+    for stage in STAGES:
+        allocations, peak = _trace_call(lambda: run_stage(multiworld, stage))
+        results.append(StageResult(stage, players, wall_times[stage], allocations, peak))
+    return results
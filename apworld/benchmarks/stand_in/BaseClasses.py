@@ -0,0 +1,264 @@
+"""
+Offline stand-in for Archipelago's BaseClasses
+
+Provides only the surface that Blockupelago touches during generation.
+Class layouts (``__slots__`` on Item, plain attributes on Location) follow
+upstream so that timing and memory numbers are representative.
+"""
+
+import random
+from collections import Counter
+from enum import IntEnum, IntFlag
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+
+
+class ItemClassification(IntFlag):
+    filler = 0b0000
+    progression = 0b0001
+    useful = 0b0010
+    trap = 0b0100
+    skip_balancing = 0b1000
+    progression_skip_balancing = 0b1001
+
+
+class LocationProgressType(IntEnum):
+    DEFAULT = 1
+    PRIORITY = 2
+    EXCLUDED = 3
+
+
+class Tutorial(NamedTuple):
+    tutorial_name: str
+    description: str
+    language: str
+    file_name: str
+    link: str
+    authors: List[str]
+
+
+class Item:
+    game: str = "Generic"
+    __slots__ = ("name", "classification", "code", "player", "location")
+
+    def __init__(self, name: str, classification: ItemClassification, code: Optional[int], player: int):
+        self.name = name
+        self.classification = classification
+        self.player = player
+        self.code = code
+        self.location = None
+
+    @property
+    def advancement(self) -> bool:
+        return ItemClassification.progression in self.classification
+
+    @property
+    def useful(self) -> bool:
+        return ItemClassification.useful in self.classification
+
+    @property
+    def excludable(self) -> bool:
+        return not (self.advancement or self.useful)
+
+    def __repr__(self) -> str:
+        return f"{self.name} (Player {self.player})"
+
+
+class Location:
+    game: str = "Generic"
+    player: int
+    name: str
+    address: Optional[int]
+    parent_region: Optional["Region"]
+    locked: bool = False
+    show_in_spoiler: bool = True
+    progress_type: LocationProgressType = LocationProgressType.DEFAULT
+    always_allow: Callable[[Any, Item], bool] = staticmethod(lambda state, item: False)
+    access_rule: Callable[[Any], bool] = staticmethod(lambda state: True)
+    item_rule: Callable[[Item], bool] = staticmethod(lambda item: True)
+    item: Optional[Item] = None
+
+    def __init__(self, player: int, name: str = "", address: Optional[int] = None,
+                 parent: Optional["Region"] = None):
+        self.player = player
+        self.name = name
+        self.address = address
+        self.parent_region = parent
+
+    def can_reach(self, state: "CollectionState") -> bool:
+        # Region first: it is cached per state, the access rule is not
+        return self.parent_region.can_reach(state) and self.access_rule(state)
+
+    def place_locked_item(self, item: Item) -> None:
+        if self.item:
+            raise Exception(f"Location {self} already filled.")
+        self.item = item
+        item.location = self
+        self.locked = True
+
+    def __repr__(self) -> str:
+        return f"{self.name} (Player {self.player})"
+
+
+class Entrance:
+    access_rule: Callable[[Any], bool] = staticmethod(lambda state: True)
+
+    def __init__(self, player: int, name: str = "", parent: Optional["Region"] = None):
+        self.name = name
+        self.player = player
+        self.parent_region = parent
+        self.connected_region: Optional[Region] = None
+
+    def can_reach(self, state: "CollectionState") -> bool:
+        return self.parent_region.can_reach(state) and self.access_rule(state)
+
+    def connect(self, region: "Region") -> None:
+        self.connected_region = region
+        region.entrances.append(self)
+
+
+class Region:
+    def __init__(self, name: str, player: int, multiworld: "MultiWorld", hint: Optional[str] = None):
+        self.name = name
+        self.player = player
+        self.multiworld = multiworld
+        self.hint_text = hint
+        self.entrances: List[Entrance] = []
+        self.exits: List[Entrance] = []
+        self.locations: List[Location] = []
+
+    def can_reach(self, state: "CollectionState") -> bool:
+        if state.stale[self.player]:
+            state.update_reachable_regions(self.player)
+        return self in state.reachable_regions[self.player]
+
+    def connect(self, connecting_region: "Region", name: Optional[str] = None,
+                rule: Optional[Callable[[Any], bool]] = None) -> Entrance:
+        exit_ = Entrance(self.player, name or f"{self.name} -> {connecting_region.name}", self)
+        if rule:
+            exit_.access_rule = rule
+        self.exits.append(exit_)
+        exit_.connect(connecting_region)
+        return exit_
+
+    def __repr__(self) -> str:
+        return f"{self.name} (Player {self.player})"
+
+
+class MultiWorld:
+    """Holds every player's worlds, regions and the shared item pool."""
+
+    def __init__(self, players: int, seed: Optional[int] = None):
+        self.players = players
+        self.player_ids = tuple(range(1, players + 1))
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.game: Dict[int, str] = {}
+        self.player_name: Dict[int, str] = {}
+        self.worlds: Dict[int, Any] = {}
+        self.regions: List[Region] = []
+        self.itempool: List[Item] = []
+        self.completion_condition: Dict[int, Callable[[Any], bool]] = {}
+        self._regions_by_name: Dict[tuple, Region] = {}
+        self._locations_by_name: Optional[Dict[tuple, Location]] = None
+
+    def get_region(self, name: str, player: int) -> Region:
+        return self._region_cache()[player, name]
+
+    def get_location(self, name: str, player: int) -> Location:
+        return self._location_cache()[player, name]
+
+    def _region_cache(self) -> Dict[tuple, Region]:
+        # Rebuilt when regions were added since the last lookup
+        if len(self._regions_by_name) != len(self.regions):
+            self._regions_by_name = {(region.player, region.name): region for region in self.regions}
+            self._locations_by_name = None
+        return self._regions_by_name
+
+    def _location_cache(self) -> Dict[tuple, Location]:
+        self._region_cache()
+        if self._locations_by_name is None:
+            self._locations_by_name = {(location.player, location.name): location
+                                       for region in self.regions for location in region.locations}
+        return self._locations_by_name
+
+    def can_beat_game(self, state: "CollectionState") -> bool:
+        return all(self.completion_condition[player](state) for player in self.player_ids)
+
+    def get_game_players(self, game_name: str) -> tuple:
+        return tuple(player for player in self.player_ids if self.game[player] == game_name)
+
+    def get_locations(self, player: Optional[int] = None) -> List[Location]:
+        return [location for region in self.regions for location in region.locations
+                if player is None or location.player == player]
+
+
+class CollectionState:
+    """
+    Items collected per player and the regions they make reachable.
+
+    Reachability is recomputed lazily: collecting or removing an item marks
+    its player stale, and the next region check walks that player's
+    entrances again from Menu.
+    """
+
+    def __init__(self, multiworld: MultiWorld):
+        self.multiworld = multiworld
+        self.prog_items: Dict[int, Counter] = {player: Counter() for player in multiworld.player_ids}
+        self.reachable_regions: Dict[int, Set[Region]] = {player: set() for player in multiworld.player_ids}
+        self.stale: Dict[int, bool] = {player: True for player in multiworld.player_ids}
+        self.locations_checked: Set[Location] = set()
+
+    def update_reachable_regions(self, player: int) -> None:
+        self.stale[player] = False
+        start = self.multiworld.get_region("Menu", player)
+        reachable = {start}
+        queue = list(start.exits)
+        while queue:
+            entrance = queue.pop()
+            target = entrance.connected_region
+            if target not in reachable and entrance.access_rule(self):
+                reachable.add(target)
+                queue.extend(target.exits)
+        self.reachable_regions[player] = reachable
+
+    def can_reach(self, spot: str, resolution_hint: str, player: int) -> bool:
+        if resolution_hint == "Location":
+            return self.multiworld.get_location(spot, player).can_reach(self)
+        return self.multiworld.get_region(spot, player).can_reach(self)
+
+    def has(self, item: str, player: int, count: int = 1) -> bool:
+        return self.prog_items[player][item] >= count
+
+    def count(self, item: str, player: int) -> int:
+        return self.prog_items[player][item]
+
+    def collect(self, item: Item, prevent_sweep: bool = True, location: Optional[Location] = None) -> bool:
+        if location:
+            self.locations_checked.add(location)
+        changed = self.multiworld.worlds[item.player].collect(self, item)
+        if changed:
+            self.stale[item.player] = True
+        return changed
+
+    def remove(self, item: Item) -> bool:
+        changed = self.multiworld.worlds[item.player].remove(self, item)
+        if changed:
+            self.stale[item.player] = True
+        return changed
+
+    def sweep_for_advancements(self, locations: Optional[Iterable[Location]] = None) -> int:
+        """Collect every reachable advancement item until nothing changes; returns how many."""
+        if locations is None:
+            locations = self.multiworld.get_locations()
+        pending = [location for location in locations
+                   if location.item and location.item.advancement and location not in self.locations_checked]
+        collected = 0
+        while True:
+            reachable = [location for location in pending if location.can_reach(self)]
+            if not reachable:
+                return collected
+            for location in reachable:
+                self.collect(location.item, True, location)
+            collected += len(reachable)
+            reached = set(reachable)
+            pending = [location for location in pending if location not in reached]
@@ -0,0 +1,93 @@
+"""
+Offline stand-in for Archipelago's Fill
+
+A compact version of distribute_items_restrictive: progression items are
+placed with assumed fill (each item goes to a location reachable with every
+not-yet-placed progression item in hand), never on excluded locations;
+excluded locations then take filler (neither progression nor useful) only,
+failing like upstream when there is not enough of it, and the rest of the
+pool fills the remaining locations at random. Enough to tell whether a set
+of worlds can be filled, beaten and fully reached; none of upstream's
+balancing or swap heuristics.
+"""
+
+from typing import Dict, List
+
+from BaseClasses import CollectionState, Item, Location, LocationProgressType, MultiWorld
+
+
+class FillError(RuntimeError):
+    pass
+
+
+def _sweep_from_pool(multiworld: MultiWorld, pool: List[Item]) -> CollectionState:
+    state = CollectionState(multiworld)
+    for item in pool:
+        state.collect(item, True)
+    state.sweep_for_advancements()
+    return state
+
+
+def fill_restrictive(multiworld: MultiWorld, locations: List[Location], items: List[Item]) -> None:
+    """
+    Place items (popped from the end) on locations they stay reachable at; both
+    lists are consumed. Like upstream, one item per player is placed per round
+    against a single sweep of everything still unplaced.
+    """
+    while items:
+        batch: Dict[int, Item] = {}
+        for index in range(len(items) - 1, -1, -1):
+            player = items[index].player
+            if player not in batch:
+                batch[player] = items.pop(index)
+        state = _sweep_from_pool(multiworld, items)
+        for item in batch.values():
+            for index, location in enumerate(locations):
+                if location.item_rule(item) and location.can_reach(state):
+                    break
+            else:
+                raise FillError(f"No reachable location left for {item} ({len(items)} progression items unplaced)")
+            location = locations.pop(index)
+            location.item = item
+            item.location = location
+
+
+def distribute_items_restrictive(multiworld: MultiWorld) -> None:
+    random = multiworld.random
+    locations = [location for location in multiworld.get_locations() if location.item is None]
+    random.shuffle(locations)
+    pool = list(multiworld.itempool)
+    random.shuffle(pool)
+    if len(pool) != len(locations):
+        raise FillError(f"{len(pool)} items for {len(locations)} locations")
+
+    progression = [item for item in pool if item.advancement]
+    useful = [item for item in pool if not item.advancement and not item.excludable]
+    filler = [item for item in pool if item.excludable]
+    excluded = [location for location in locations if location.progress_type == LocationProgressType.EXCLUDED]
+    open_locations = [location for location in locations
+                      if location.progress_type != LocationProgressType.EXCLUDED]
+    if len(progression) > len(open_locations):
+        raise FillError(f"{len(progression)} progression items for {len(open_locations)} non-excluded locations")
+    if len(excluded) > len(filler):
+        raise FillError(f"Not enough filler items for excluded locations. There are {len(excluded) - len(filler)} "
+                        f"more excluded locations than filler or trap items.")
+
+    fill_restrictive(multiworld, open_locations, progression)
+    for location, item in zip(excluded + open_locations, filler[:len(excluded)] + useful + filler[len(excluded):]):
+        location.item = item
+        item.location = location
+
+
+def beatable(multiworld: MultiWorld) -> bool:
+    """Whether every player's completion condition holds after sweeping the filled world."""
+    state = CollectionState(multiworld)
+    state.sweep_for_advancements()
+    return multiworld.can_beat_game(state)
+
+
+def unreachable(multiworld: MultiWorld) -> List[Location]:
+    """Locations a sweep of the filled world never reaches; upstream's full accessibility rejects any."""
+    state = CollectionState(multiworld)
+    state.sweep_for_advancements()
+    return [location for location in multiworld.get_locations() if not location.can_reach(state)]
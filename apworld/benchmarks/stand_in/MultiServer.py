@@ -0,0 +1,146 @@
+"""
+Offline stand-in for Archipelago's MultiServer
+
+Hosts a filled stand-in MultiWorld over websockets, speaking enough of the
+network protocol for load testing clients: RoomInfo, Connect/Connected
+(ConnectionRefused for unknown slots), LocationChecks answered with
+ReceivedItems to the item's owner, LocationScouts, ConnectUpdate,
+StatusUpdate and Bounce/Bounced. No hints, commands, passwords or saving.
+Requires websockets.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Set, Tuple
+
+import websockets
+
+from BaseClasses import MultiWorld
+
+VERSION = {"major": 0, "minor": 6, "build": 0, "class": "Version"}
+CLIENT_GOAL = 30
+
+
+class Client:
+    def __init__(self, socket: Any):
+        self.socket = socket
+        self.slot = 0
+        self.tags: Set[str] = set()
+
+    async def send(self, *packets: Dict[str, Any]) -> None:
+        try:
+            await self.socket.send(json.dumps(list(packets), separators=(",", ":")))
+        except websockets.ConnectionClosed:
+            pass
+
+
+class Context:
+    def __init__(self, multiworld: MultiWorld, slot_data: Dict[int, Dict[str, Any]]):
+        self.seed_name = str(multiworld.seed)
+        self.players = {player: multiworld.player_name[player] for player in multiworld.player_ids}
+        self.slots_by_name = {name: player for player, name in self.players.items()}
+        self.games = {player: multiworld.game[player] for player in multiworld.player_ids}
+        self.slot_data = slot_data
+        # (finding slot, location id) -> NetworkItem sent to the item's owner
+        self.locations: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self.location_owners: Dict[Tuple[int, int], int] = {}
+        for location in multiworld.get_locations():
+            if location.address is None or location.item is None:
+                continue
+            key = (location.player, location.address)
+            self.locations[key] = {"item": location.item.code, "location": location.address,
+                                   "player": location.player, "flags": int(location.item.classification),
+                                   "class": "NetworkItem"}
+            self.location_owners[key] = location.item.player
+        self.checked: Dict[int, Set[int]] = {player: set() for player in self.players}
+        self.received: Dict[int, List[Dict[str, Any]]] = {player: [] for player in self.players}
+        self.goals: Set[int] = set()
+        self.clients: Set[Client] = set()
+
+    def slot_locations(self, slot: int) -> List[int]:
+        return sorted(location for player, location in self.locations if player == slot)
+
+    async def handle(self, socket: Any) -> None:
+        client = Client(socket)
+        self.clients.add(client)
+        await client.send({"cmd": "RoomInfo", "version": VERSION, "generator_version": VERSION, "tags": [],
+                           "password": False, "permissions": {}, "hint_cost": 0, "location_check_points": 0,
+                           "games": sorted(set(self.games.values())), "datapackage_checksums": {},
+                           "seed_name": self.seed_name, "time": time.time()})
+        try:
+            async for message in socket:
+                for packet in json.loads(message):
+                    await self.dispatch(client, packet)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.clients.discard(client)
+
+    async def dispatch(self, client: Client, packet: Dict[str, Any]) -> None:
+        command = packet.get("cmd")
+        if command == "Connect":
+            await self.connect(client, packet)
+        elif not client.slot:
+            await client.send({"cmd": "InvalidPacket", "type": "cmd", "original_cmd": command,
+                               "text": "not connected"})
+        elif command == "LocationChecks":
+            await self.check_locations(client.slot, packet.get("locations", ()))
+        elif command == "LocationScouts":
+            infos = [self.locations[client.slot, location] for location in packet.get("locations", ())
+                     if (client.slot, location) in self.locations]
+            await client.send({"cmd": "LocationInfo", "locations": infos})
+        elif command == "ConnectUpdate":
+            client.tags = set(packet.get("tags", client.tags))
+        elif command == "StatusUpdate":
+            if packet.get("status") == CLIENT_GOAL:
+                self.goals.add(client.slot)
+        elif command == "Bounce":
+            await self.bounce(packet)
+
+    async def connect(self, client: Client, packet: Dict[str, Any]) -> None:
+        slot = self.slots_by_name.get(packet.get("name"))
+        if slot is None or self.games[slot] != packet.get("game"):
+            await client.send({"cmd": "ConnectionRefused", "errors": ["InvalidSlot" if slot is None else "InvalidGame"]})
+            return
+        client.slot = slot
+        client.tags = set(packet.get("tags", ()))
+        checked = self.checked[slot]
+        await client.send(
+            {"cmd": "Connected", "team": 0, "slot": slot,
+             "players": [{"team": 0, "slot": player, "alias": name, "name": name, "class": "NetworkPlayer"}
+                         for player, name in self.players.items()],
+             "missing_locations": [location for location in self.slot_locations(slot) if location not in checked],
+             "checked_locations": sorted(checked), "slot_info": {}, "hint_points": 0,
+             "slot_data": self.slot_data.get(slot, {}) if packet.get("slot_data", True) else {}},
+            {"cmd": "ReceivedItems", "index": 0, "items": self.received[slot]},
+        )
+
+    async def check_locations(self, slot: int, locations: List[int]) -> None:
+        new_items: Dict[int, List[Dict[str, Any]]] = {}
+        for location in locations:
+            key = (slot, location)
+            if key not in self.locations or location in self.checked[slot]:
+                continue
+            self.checked[slot].add(location)
+            owner = self.location_owners[key]
+            self.received[owner].append(self.locations[key])
+            new_items.setdefault(owner, []).append(self.locations[key])
+        sends = []
+        for owner, items in new_items.items():
+            index = len(self.received[owner]) - len(items)
+            packet = {"cmd": "ReceivedItems", "index": index, "items": items}
+            sends += [client.send(packet) for client in self.clients if client.slot == owner]
+        await asyncio.gather(*sends)
+
+    async def bounce(self, packet: Dict[str, Any]) -> None:
+        tags, slots, games = (set(packet.get(key, ())) for key in ("tags", "slots", "games"))
+        bounced = {**packet, "cmd": "Bounced"}
+        await asyncio.gather(*(client.send(bounced) for client in self.clients
+                               if client.slot and (client.tags & tags or client.slot in slots
+                                                   or self.games[client.slot] in games)))
+
+
+async def serve(context: Context, host: str = "localhost", port: int = 38281) -> Any:
+    """Start serving; returns the websockets server (close() it to stop)."""
+    return await websockets.serve(context.handle, host, port, max_size=None, ping_interval=None)
@@ -0,0 +1,86 @@
+"""
+Offline stand-in for Archipelago's Options
+
+Options hold a resolved ``value`` only; weighting and YAML parsing are out of
+scope for benchmarking.
+"""
+
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict
+
+
+class Option:
+    default: ClassVar[Any] = 0
+    display_name: ClassVar[str] = ""
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    @classmethod
+    def from_any(cls, data: Any) -> "Option":
+        return cls(data)
+
+    def __int__(self) -> int:
+        return int(self.value)
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Option):
+            return self.value == other.value
+        return self.value == other
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.value!r})"
+
+
+class Range(Option):
+    range_start: ClassVar[int] = 0
+    range_end: ClassVar[int] = 1
+
+    def __init__(self, value: int):
+        if not self.range_start <= value <= self.range_end:
+            raise ValueError(f"{type(self).__name__} {value} outside of range "
+                             f"{self.range_start}-{self.range_end}")
+        super().__init__(int(value))
+
+
+class Toggle(Option):
+    default = 0
+
+    def __init__(self, value: int):
+        super().__init__(int(bool(value)))
+
+
+class DefaultOnToggle(Toggle):
+    default = 1
+
+
+class Choice(Option):
+    options: ClassVar[Dict[str, int]] = {}
+    name_lookup: ClassVar[Dict[int, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls.options = {name[len("option_"):]: value for name, value in vars(cls).items()
+                       if name.startswith("option_")}
+        cls.name_lookup = {value: name for name, value in cls.options.items()}
+
+    @classmethod
+    def from_any(cls, data: Any) -> "Choice":
+        if isinstance(data, str):
+            return cls(cls.options[data.lower()])
+        return cls(data)
+
+    @property
+    def current_key(self) -> str:
+        return self.name_lookup[self.value]
+
+
+@dataclass
+class PerGameCommonOptions:
+    pass
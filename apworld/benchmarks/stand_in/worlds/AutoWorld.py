@@ -0,0 +1,110 @@
+"""
+Offline stand-in for Archipelago's worlds.AutoWorld
+
+Mirrors the World base class and the call_all/call_stage dispatch used by
+Archipelago's Main, so world code runs unchanged against it.
+"""
+
+import random
+from dataclasses import fields
+from typing import Any, ClassVar, Dict, Optional, Set, Type
+
+from BaseClasses import Item, MultiWorld, Tutorial  # noqa: F401 (re-exported like upstream)
+
+
+class AutoWorldRegister(type):
+    world_types: Dict[str, Type["World"]] = {}
+
+    def __new__(mcs, name: str, bases: tuple, dct: Dict[str, Any]) -> "AutoWorldRegister":
+        new_class = super().__new__(mcs, name, bases, dct)
+        if "game" in dct:
+            AutoWorldRegister.world_types[dct["game"]] = new_class
+        return new_class
+
+
+class WebWorld:
+    theme: str = "grass"
+    tutorials: list = []
+
+
+class World(metaclass=AutoWorldRegister):
+    game: ClassVar[str]
+    options_dataclass: ClassVar[type]
+    item_name_to_id: ClassVar[Dict[str, int]] = {}
+    location_name_to_id: ClassVar[Dict[str, int]] = {}
+    item_name_groups: ClassVar[Dict[str, Set[str]]] = {}
+    location_name_groups: ClassVar[Dict[str, Set[str]]] = {}
+    web: ClassVar[WebWorld] = WebWorld()
+
+    def __init__(self, multiworld: MultiWorld, player: int):
+        self.multiworld = multiworld
+        self.player = player
+        self.random = random.Random(multiworld.random.getrandbits(64))
+
+    def create_item(self, name: str) -> Item:
+        raise NotImplementedError
+
+    def create_regions(self) -> None:
+        pass
+
+    def create_items(self) -> None:
+        pass
+
+    def set_rules(self) -> None:
+        pass
+
+    def fill_slot_data(self) -> Dict[str, Any]:
+        return {}
+
+    def collect_item(self, state: Any, item: Item, remove: bool = False) -> Optional[str]:
+        if item.advancement:
+            return item.name
+        return None
+
+    def collect(self, state: Any, item: Item) -> bool:
+        name = self.collect_item(state, item)
+        if name:
+            state.prog_items[self.player][name] += 1
+            return True
+        return False
+
+    def remove(self, state: Any, item: Item) -> bool:
+        name = self.collect_item(state, item, True)
+        if name:
+            state.prog_items[self.player][name] -= 1
+            if state.prog_items[self.player][name] < 1:
+                del state.prog_items[self.player][name]
+            return True
+        return False
+
+
+def make_options(options_dataclass: type, **overrides: Any) -> Any:
+    """Build an options dataclass instance from defaults, with per-field overrides."""
+    values = {}
+    for field in fields(options_dataclass):
+        option_type = field.type
+        value = overrides.get(field.name, option_type.default)
+        values[field.name] = option_type.from_any(value)
+    return options_dataclass(**values)
+
+
+def call_single(multiworld: MultiWorld, method_name: str, player: int, *args: Any) -> Any:
+    return getattr(multiworld.worlds[player], method_name)(*args)
+
+
+def call_stage(multiworld: MultiWorld, method_name: str, *args: Any) -> None:
+    world_types = {multiworld.worlds[player].__class__ for player in multiworld.player_ids}
+    for world_type in sorted(world_types, key=lambda world_type: world_type.__name__):
+        stage_callable = getattr(world_type, f"stage_{method_name}", None)
+        if stage_callable:
+            stage_callable(multiworld, *args)
+
+
+def call_all(multiworld: MultiWorld, method_name: str, *args: Any) -> None:
+    for player in multiworld.player_ids:
+        prev_item_count = len(multiworld.itempool)
+        call_single(multiworld, method_name, player, *args)
+        for item in multiworld.itempool[prev_item_count:]:
+            assert item.player == player, \
+                f"{method_name} of player {player} added an item for player {item.player}"
+    call_stage(multiworld, method_name, *args)
@@ -0,0 +1 @@
+"""Offline stand-in for Archipelago's worlds package."""
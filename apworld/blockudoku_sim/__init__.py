@@ -0,0 +1,20 @@
+"""
+Blockudoku Simulation
+
+A Python port of the client's game rules (app/utils/blockudoku.ts) on a
+bitboard, so generation-side code can reason about the game. Not part of the
+packaged apworld.
+"""
+
+from .board import (
+    BOX_MASKS, CELL_COUNT, COL_MASKS, EMPTY_BOARD, FULL_BOARD, GRID_SIZE, ROW_MASKS, UNIT_MASKS, ClearResult,
+    Placement, board_from_grid, calculate_score, can_place, can_place_any, can_place_shape, clear_completed,
+    combo_multiplier, complete_boxes, complete_cols, complete_rows, filled_count, grid_from_board,
+    legal_placements, place, placements, shape_mask,
+)
+from .pieces import (
+    ALL_PIECES, PIECES_BY_NAME, STARTER_PIECE_NAMES, Piece, Shape, mirror_shape, piece_size, rotate_shape,
+    shrink_shape,
+)
+from .masks import MaskTable, get_table, load_table, orientations
+from .unlocks import UnlockSet
@@ -0,0 +1,164 @@
+"""
+Blockudoku Bitboard
+
+The 9x9 board as an 81-bit integer: cell (row, col) is bit ``row * 9 + col``
+and a set bit means the cell is filled. Gems are not part of the board, the
+same way the client tracks them in gemCells and treats a gem cell as empty
+for placement and clears.
+
+Mirrors canPlacePiece, placePiece, getCompleteRows/Cols/Boxes,
+clearCompleted, calculateScore and canPlaceAnyPiece from
+app/utils/blockudoku.ts.
+"""
+
+import math
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Sequence, Tuple
+
+from .pieces import Shape
+
+GRID_SIZE = 9
+BOX_SIZE = 3
+CELL_COUNT = GRID_SIZE * GRID_SIZE
+
+EMPTY_BOARD = 0
+FULL_BOARD = (1 << CELL_COUNT) - 1
+
+
+def cell_bit(row: int, col: int) -> int:
+    return 1 << (row * GRID_SIZE + col)
+
+
+ROW_MASKS: Tuple[int, ...] = tuple(((1 << GRID_SIZE) - 1) << (row * GRID_SIZE) for row in range(GRID_SIZE))
+COL_MASKS: Tuple[int, ...] = tuple(sum(cell_bit(row, col) for row in range(GRID_SIZE)) for col in range(GRID_SIZE))
+# Boxes are numbered row-major, box_row * 3 + box_col, like getCompleteBoxes
+BOX_MASKS: Tuple[int, ...] = tuple(
+    sum(cell_bit(box_row * BOX_SIZE + r, box_col * BOX_SIZE + c) for r in range(BOX_SIZE) for c in range(BOX_SIZE))
+    for box_row in range(BOX_SIZE) for box_col in range(BOX_SIZE)
+)
+# All 27 units: rows 0-8, columns 9-17, boxes 18-26
+UNIT_MASKS: Tuple[int, ...] = ROW_MASKS + COL_MASKS + BOX_MASKS
+
+
+class Placement(NamedTuple):
+    """A legal anchor for a shape: top-left row/col and the cells it covers."""
+    row: int
+    col: int
+    mask: int
+
+
+class ClearResult(NamedTuple):
+    board: int
+    cleared_rows: Tuple[int, ...]
+    cleared_cols: Tuple[int, ...]
+    cleared_boxes: Tuple[int, ...]
+
+    @property
+    def total_clears(self) -> int:
+        return len(self.cleared_rows) + len(self.cleared_cols) + len(self.cleared_boxes)
+
+
+@lru_cache(maxsize=None)
+def shape_mask(shape: Shape) -> int:
+    """Mask of a shape anchored at (0, 0)."""
+    return sum(cell_bit(r, c) for r, row in enumerate(shape) for c, cell in enumerate(row) if cell == 1)
+
+
+@lru_cache(maxsize=None)
+def placements(shape: Shape) -> Tuple[Placement, ...]:
+    """
+    Every in-bounds anchor of a shape, row-major.
+
+    Bounds follow canPlacePiece: the shape's bounding box (including empty
+    cells of the shape) has to fit inside the grid.
+    """
+    rows = len(shape)
+    cols = len(shape[0]) if shape else 0
+    base = shape_mask(shape)
+    return tuple(
+        Placement(row, col, base << (row * GRID_SIZE + col))
+        for row in range(GRID_SIZE - rows + 1)
+        for col in range(GRID_SIZE - cols + 1)
+    )
+
+
+def can_place(board: int, shape: Shape, row: int, col: int) -> bool:
+    """Check if a shape can be placed with its top-left corner at (row, col)."""
+    if row < 0 or col < 0 or row + len(shape) > GRID_SIZE or col + len(shape[0]) > GRID_SIZE:
+        return False
+    return not board & (shape_mask(shape) << (row * GRID_SIZE + col))
+
+
+def place(board: int, shape: Shape, row: int, col: int) -> int:
+    """Place a shape on the board (returns the new board). Does not check for overlap."""
+    return board | (shape_mask(shape) << (row * GRID_SIZE + col))
+
+
+def legal_placements(board: int, shape: Shape) -> List[Placement]:
+    return [placement for placement in placements(shape) if not board & placement.mask]
+
+
+def can_place_shape(board: int, shape: Shape) -> bool:
+    """Check if a shape fits anywhere on the board."""
+    for placement in placements(shape):
+        if not board & placement.mask:
+            return True
+    return False
+
+
+def can_place_any(board: int, shapes: Iterable[Shape]) -> bool:
+    """Check if any of the shapes fits anywhere on the board."""
+    return any(can_place_shape(board, shape) for shape in shapes)
+
+
+def complete_rows(board: int) -> Tuple[int, ...]:
+    return tuple(i for i, mask in enumerate(ROW_MASKS) if board & mask == mask)
+
+
+def complete_cols(board: int) -> Tuple[int, ...]:
+    return tuple(i for i, mask in enumerate(COL_MASKS) if board & mask == mask)
+
+
+def complete_boxes(board: int) -> Tuple[int, ...]:
+    return tuple(i for i, mask in enumerate(BOX_MASKS) if board & mask == mask)
+
+
+def clear_completed(board: int) -> ClearResult:
+    """Clear complete rows, columns and boxes (returns the new board and clear info)."""
+    cleared = 0
+    for mask in UNIT_MASKS:
+        if board & mask == mask:
+            cleared |= mask
+    if not cleared:
+        return ClearResult(board, (), (), ())
+    return ClearResult(board & ~cleared, complete_rows(board), complete_cols(board), complete_boxes(board))
+
+
+def calculate_score(cleared_rows: int, cleared_cols: int, cleared_boxes: int, combo_multiplier: float) -> int:
+    """Score for a placement's clears, like calculateScore in the client."""
+    base_score = cleared_rows * 10 + cleared_cols * 10 + cleared_boxes * 30
+    # Combo multiplier for multiple clears at once
+    return math.floor(base_score * combo_multiplier)
+
+
+def combo_multiplier(total_clears: int) -> int:
+    """Combo multiplier useBlockudoku applies to a placement's clears."""
+    return total_clears if total_clears > 1 else 1
+
+
+def board_from_grid(grid: Sequence[Sequence[int]]) -> int:
+    """Convert a client BlockGrid (0 empty, 1 filled, 2 gem) to a bitboard."""
+    board = 0
+    for r, row in enumerate(grid):
+        for c, cell in enumerate(row):
+            if cell == 1:
+                board |= cell_bit(r, c)
+    return board
+
+
+def grid_from_board(board: int) -> List[List[int]]:
+    return [[(board >> (r * GRID_SIZE + c)) & 1 for c in range(GRID_SIZE)] for r in range(GRID_SIZE)]
+
+
+def filled_count(board: int) -> int:
+    return board.bit_count()
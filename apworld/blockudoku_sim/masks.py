@@ -0,0 +1,269 @@
+"""
+Blockudoku Placement Masks
+
+Every in-bounds anchor of every orientation of every piece, precomputed as
+board masks and stored in a versioned binary file that is memory-mapped on
+load. Orientations are everything Rotate, Mirror and Shrink can turn a piece
+into, with symmetric duplicates removed.
+
+File layout (little-endian, all sections 8-byte aligned):
+
+    header        magic, format version, catalogue hash, section counts
+    shapes        per shape: rows, cols (uint8) and its cells as a 25-bit
+                  row-major mask of the 5x5 box (uint32)
+    shape_starts  uint32[shapes + 1]; placements of shape i are
+                  shape_starts[i]:shape_starts[i + 1]
+    lo, hi        uint64[placements]; bits 0-63 and 64-80 of each mask
+    anchors       uint8[placements]; row * 9 + col of the top-left corner
+    piece_starts  uint32[pieces + 1] into piece_shapes
+    piece_shapes  uint32[...]; orientation shape indices, ALL_PIECES order
+
+The lo/hi split lets numpy view the same buffer as uint64 arrays.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .board import GRID_SIZE, placements
+from .pieces import ALL_PIECES, Shape, mirror_shape, rotate_shape, shrink_shape
+
+# Bump when the layout or the orientation rules change
+TABLE_VERSION = 1
+MAGIC = b"BKSMASKS"
+DEFAULT_TABLE_PATH = Path(__file__).with_name("placement_masks.bin")
+
+LOW_BITS = (1 << 64) - 1
+SHAPE_BOX = 5
+
+HEADER = struct.Struct("<8sI32sIII")
+SHAPE = struct.Struct("<BBxxI")
+
+
+def orientations(shape: Shape) -> Tuple[Shape, ...]:
+    """Every distinct shape reachable from a shape by rotating, mirroring and shrinking."""
+    seen = {}
+    pending = [shape]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen[current] = None
+        pending += [rotate_shape(current), mirror_shape(current)]
+        shrunk = shrink_shape(current)
+        if shrunk is not None:
+            pending.append(shrunk)
+    return tuple(sorted(seen))
+
+
+def catalogue_hash() -> bytes:
+    """Identifies the piece catalogue and table version a file was built from."""
+    source = repr((TABLE_VERSION, GRID_SIZE, [(piece.name, piece.shape) for piece in ALL_PIECES]))
+    return hashlib.sha256(source.encode("utf-8")).digest()
+
+
+def _shape_bits(shape: Shape) -> int:
+    return sum(1 << (r * SHAPE_BOX + c) for r, row in enumerate(shape) for c, cell in enumerate(row) if cell == 1)
+
+
+def _shape_from_bits(rows: int, cols: int, bits: int) -> Shape:
+    return tuple(tuple((bits >> (r * SHAPE_BOX + c)) & 1 for c in range(cols)) for r in range(rows))
+
+
+def _pad(data: bytes) -> bytes:
+    return data + bytes(-len(data) % 8)
+
+
+def build_table() -> bytes:
+    """Compute the whole table and return it serialized."""
+    shape_index: Dict[Shape, int] = {}
+    piece_shapes: List[List[int]] = []
+    for piece in ALL_PIECES:
+        indices = []
+        for shape in orientations(piece.shape):
+            indices.append(shape_index.setdefault(shape, len(shape_index)))
+        piece_shapes.append(indices)
+
+    shapes = list(shape_index)
+    shape_starts = [0]
+    lo: List[int] = []
+    hi: List[int] = []
+    anchors: List[int] = []
+    for shape in shapes:
+        for placement in placements(shape):
+            lo.append(placement.mask & LOW_BITS)
+            hi.append(placement.mask >> 64)
+            anchors.append(placement.row * GRID_SIZE + placement.col)
+        shape_starts.append(len(lo))
+
+    piece_starts = [0]
+    for indices in piece_shapes:
+        piece_starts.append(piece_starts[-1] + len(indices))
+
+    sections = [
+        HEADER.pack(MAGIC, TABLE_VERSION, catalogue_hash(), len(shapes), len(lo), len(ALL_PIECES)),
+        b"".join(SHAPE.pack(len(shape), len(shape[0]), _shape_bits(shape)) for shape in shapes),
+        struct.pack(f"<{len(shape_starts)}I", *shape_starts),
+        struct.pack(f"<{len(lo)}Q", *lo),
+        struct.pack(f"<{len(hi)}Q", *hi),
+        bytes(anchors),
+        struct.pack(f"<{len(piece_starts)}I", *piece_starts),
+        struct.pack(f"<{piece_starts[-1]}I", *(i for indices in piece_shapes for i in indices)),
+    ]
+    return b"".join(_pad(section) for section in sections)
+
+
+class MaskTable:
+    """
+    Read-only view of a placement mask table.
+
+    Sections are memoryviews straight into the mapped file (or bytes when the
+    table was built in memory), so loading does no per-entry work beyond
+    decoding the shape list.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        self._views = [view]
+        try:
+            self._read_sections(view)
+        except Exception:
+            # Let go of the buffer now, so a rejected file can be replaced while the error propagates
+            self.close()
+            raise
+
+    def _read_sections(self, view: memoryview) -> None:
+        magic, version, digest, shape_count, placement_count, piece_count = HEADER.unpack_from(view)
+        if magic != MAGIC or version != TABLE_VERSION or digest != catalogue_hash():
+            raise ValueError("placement mask table is stale or not a mask table")
+
+        offset = 0
+
+        def section(size: int, fmt: Optional[str] = None) -> memoryview:
+            nonlocal offset
+            chunk = view[offset:offset + size]
+            offset += size + (-size % 8)
+            self._views.append(chunk)
+            if fmt:
+                chunk = chunk.cast(fmt)
+                self._views.append(chunk)
+            return chunk
+
+        section(HEADER.size)
+        shape_data = section(SHAPE.size * shape_count)
+        self.shapes: Tuple[Shape, ...] = tuple(
+            _shape_from_bits(*SHAPE.unpack_from(shape_data, i * SHAPE.size)) for i in range(shape_count))
+        self.shape_index: Dict[Shape, int] = {shape: i for i, shape in enumerate(self.shapes)}
+        self.shape_starts = section(4 * (shape_count + 1), "I")
+        self.lo = section(8 * placement_count, "Q")
+        self.hi = section(8 * placement_count, "Q")
+        self.anchors = section(placement_count)
+        self.piece_starts = section(4 * (piece_count + 1), "I")
+        self.piece_shapes = section(4 * self.piece_starts[piece_count], "I")
+        self.piece_orientations: Dict[str, Tuple[int, ...]] = {
+            piece.name: tuple(self.piece_shapes[self.piece_starts[i]:self.piece_starts[i + 1]])
+            for i, piece in enumerate(ALL_PIECES)
+        }
+        self._shape_masks: List[Optional[Tuple[Tuple[int, int], ...]]] = [None] * shape_count
+
+    @property
+    def placement_count(self) -> int:
+        return len(self.lo)
+
+    def mask(self, placement: int) -> int:
+        """Full 81-bit board mask of a placement index."""
+        return self.lo[placement] | (self.hi[placement] << 64)
+
+    def anchor(self, placement: int) -> Tuple[int, int]:
+        return divmod(self.anchors[placement], GRID_SIZE)
+
+    def shape_range(self, shape: Shape) -> range:
+        i = self.shape_index[shape]
+        return range(self.shape_starts[i], self.shape_starts[i + 1])
+
+    def shape_masks(self, shape: Shape) -> Tuple[Tuple[int, int], ...]:
+        """
+        (placement index, mask) pairs of a shape, decoded from the lo/hi
+        words on first use. Indexing a memoryview per test is slower in
+        CPython than scanning a tuple of ints, so each shape is decoded once.
+        """
+        i = self.shape_index[shape]
+        masks = self._shape_masks[i]
+        if masks is None:
+            start, end = self.shape_starts[i], self.shape_starts[i + 1]
+            masks = self._shape_masks[i] = tuple(
+                zip(range(start, end), [lo | (hi << 64) for lo, hi in zip(self.lo[start:end], self.hi[start:end])]))
+        return masks
+
+    def moves(self, board: int, shape: Shape) -> List[int]:
+        """Indices of every placement of a shape that fits on the board."""
+        return [i for i, mask in self.shape_masks(shape) if not board & mask]
+
+    def has_move(self, board: int, shapes: Sequence[Shape]) -> bool:
+        for shape in shapes:
+            for _, mask in self.shape_masks(shape):
+                if not board & mask:
+                    return True
+        return False
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+def write_table(path: Path) -> None:
+    # Write next to the target, then swap it in
+    temp_file = path.with_name(path.name + f".{os.getpid()}.tmp")
+    try:
+        temp_file.write_bytes(build_table())
+        os.replace(temp_file, path)
+    except OSError:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+
+def load_table(path: Optional[Path] = None) -> MaskTable:
+    """
+    Memory-map the table at path, (re)building the file first if it is
+    missing or stale. Falls back to an in-memory table when the location is
+    not writable, and on big-endian hosts where the file cannot be viewed
+    in place.
+    """
+    path = Path(path) if path else DEFAULT_TABLE_PATH
+    if sys.byteorder != "little":
+        return MaskTable(build_table())
+    for attempt in range(2):
+        buffer = None
+        try:
+            with open(path, "rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            return MaskTable(buffer)
+        except (OSError, ValueError, struct.error):
+            # Windows cannot replace a file that is still mapped
+            if buffer is not None:
+                buffer.close()
+            if attempt:
+                break
+            try:
+                write_table(path)
+            except OSError:
+                break
+    return MaskTable(build_table())
+
+
+_table: Optional[MaskTable] = None
+
+
+def get_table() -> MaskTable:
+    """The shared table at DEFAULT_TABLE_PATH, loaded on first use."""
+    global _table
+    if _table is None:
+        _table = load_table()
+    return _table
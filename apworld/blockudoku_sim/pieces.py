@@ -0,0 +1,117 @@
+"""
+Blockudoku Pieces
+
+Piece shapes and transformations, ported from the client's
+app/utils/blockudoku.ts (ALL_PIECES, rotatePiece, mirrorPiece, shrinkPiece).
+Names match the piece items in the apworld's Items.item_table.
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+Shape = Tuple[Tuple[int, ...], ...]
+
+
+class Piece(NamedTuple):
+    """A polyomino: client id, item name and 0/1 shape rows."""
+    id: str
+    name: str
+    shape: Shape
+
+
+ALL_PIECES: Tuple[Piece, ...] = (
+    Piece("single", "Single Block", ((1,),)),
+    Piece("domino_i", "Domino I", ((1, 1),)),
+    Piece("tromino_i", "Tromino I", ((1, 1, 1),)),
+    Piece("tromino_l", "Tromino L", ((1, 0),
+                                     (1, 1))),
+    Piece("tetromino_i", "Tetromino I", ((1, 1, 1, 1),)),
+    Piece("tetromino_o", "Tetromino O", ((1, 1),
+                                         (1, 1))),
+    Piece("tetromino_t", "Tetromino T", ((1, 1, 1),
+                                         (0, 1, 0))),
+    Piece("tetromino_l", "Tetromino L", ((1, 0),
+                                         (1, 0),
+                                         (1, 1))),
+    Piece("tetromino_s", "Tetromino S", ((0, 1, 1),
+                                         (1, 1, 0))),
+    Piece("pentomino_i", "Pentomino I", ((1, 1, 1, 1, 1),)),
+    Piece("pentomino_l", "Pentomino L", ((1, 0),
+                                         (1, 0),
+                                         (1, 0),
+                                         (1, 1))),
+    Piece("pentomino_p", "Pentomino P", ((1, 1),
+                                         (1, 1),
+                                         (1, 0))),
+    Piece("pentomino_u", "Pentomino U", ((1, 0, 1),
+                                         (1, 1, 1))),
+    Piece("pentomino_w", "Pentomino W", ((1, 0, 0),
+                                         (1, 1, 0),
+                                         (0, 1, 1))),
+    Piece("pentomino_plus", "Pentomino Plus", ((0, 1, 0),
+                                               (1, 1, 1),
+                                               (0, 1, 0))),
+    Piece("corner_3x3", "3x3 Corner", ((1, 1, 1),
+                                       (1, 0, 0),
+                                       (1, 0, 0))),
+    Piece("t_shape_3x3", "3x3 T-Shape", ((1, 1, 1),
+                                         (0, 1, 0),
+                                         (0, 1, 0))),
+    Piece("cross_3x3", "3x3 Cross", ((0, 1, 0),
+                                     (1, 1, 1),
+                                     (0, 1, 0))),
+)
+
+PIECES_BY_NAME: Dict[str, Piece] = {piece.name: piece for piece in ALL_PIECES}
+
+# Starter pieces that are always unlocked in Archipelago mode
+STARTER_PIECE_NAMES: Tuple[str, ...] = ("Tromino L", "Tetromino T", "Tetromino L")
+
+
+def piece_size(shape: Shape) -> int:
+    """Number of blocks in a shape."""
+    return sum(map(sum, shape))
+
+
+def rotate_shape(shape: Shape) -> Shape:
+    """Rotate a shape 90 degrees clockwise."""
+    rows = len(shape)
+    cols = len(shape[0]) if shape else 0
+    return tuple(tuple(shape[r][c] for r in range(rows - 1, -1, -1)) for c in range(cols))
+
+
+def mirror_shape(shape: Shape) -> Shape:
+    """Mirror a shape horizontally (flip left-right)."""
+    return tuple(tuple(reversed(row)) for row in shape)
+
+
+def shrink_shape(shape: Shape) -> Optional[Shape]:
+    """
+    Shrink a shape by removing one layer from each side of its bounding box.
+
+    Returns None if the shape is a single cell or nothing would be left,
+    matching shrinkPiece in the client.
+    """
+    cells = [(r, c) for r, row in enumerate(shape) for c, cell in enumerate(row) if cell == 1]
+    if not cells:
+        return None
+    min_row = min(r for r, _ in cells)
+    max_row = max(r for r, _ in cells)
+    min_col = min(c for _, c in cells)
+    max_col = max(c for _, c in cells)
+
+    # If piece is already 1x1, can't shrink
+    if min_row == max_row and min_col == max_col:
+        return None
+
+    new_min_row = min(min_row + 1, max_row)
+    new_max_row = max(max_row - 1, min_row)
+    new_min_col = min(min_col + 1, max_col)
+    new_max_col = max(max_col - 1, min_col)
+
+    new_shape = tuple(
+        tuple(shape[r][c] for c in range(new_min_col, new_max_col + 1))
+        for r in range(new_min_row, new_max_row + 1)
+    )
+    if not new_shape or not any(cell == 1 for row in new_shape for cell in row):
+        return None
+    return new_shape
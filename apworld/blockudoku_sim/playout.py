@@ -0,0 +1,352 @@
+"""
+Blockudoku Playouts
+
+Batched self-play: many games advance in lockstep as NumPy arrays of board
+words (lo = cells 0-63, hi = cells 64-80), using the placement mask table
+for move generation. Games follow useBlockudoku: a hand of ``slots`` pieces
+drawn with the size-weighted generator (random rotation, 50% mirror), a
+refill once the hand is empty, a 30% gem spawn per refill, and scoring,
+combos and gem collection exactly as tryPlacePiece does them. Statistics
+are per game, since starting a new game resets them in the client.
+
+The player is greedy: each move it tries every legal placement of every
+hand piece and plays the one with the most points plus the board
+evaluation of blockudoku_sim.search (ragged edges and isolated holes), so
+it plays like a beam search of width 1.
+Permanent Free Rotate/Mirror let any hand piece be played in every
+orientation those transformations reach; Permanent Free Hold adds a hold
+slot that parks the last piece of a stuck hand so the hand refills.
+Consumable abilities are not used.
+
+Requires numpy; NumPy 2.0+ counts bits with np.bitwise_count, older
+versions fall back to a 16-bit lookup table.
+
+The reachability it estimates (see estimate_milestones.py) is advisory: the
+difficulty table shipped in the apworld is built with the beam-search
+player of blockudoku_sim.search (see build_difficulty.py), which plays
+stronger games than this greedy player.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .board import FULL_BOARD, UNIT_MASKS
+from .masks import LOW_BITS, get_table
+from .pieces import ALL_PIECES, STARTER_PIECE_NAMES, mirror_shape, rotate_shape
+from .search import _HAS_BELOW, _HAS_LEFT, _HAS_RIGHT, EDGE_WEIGHT, ISOLATED_WEIGHT
+from .unlocks import (
+    COMBO_MULTIPLIER_INCREMENT, FREE_HOLD, FREE_MIRROR, FREE_ROTATE, GEM_SPAWN_RATIO, MAX_GEM_CHECKS, UnlockSet,
+    piece_weight, playable_as,
+)
+
+STATS = ("score", "line_clear", "box_clear", "piece", "gem")
+
+
+class GameStats(NamedTuple):
+    """Per-game totals, one array entry per game."""
+    score: np.ndarray
+    line_clear: np.ndarray
+    box_clear: np.ndarray
+    piece: np.ndarray
+    gem: np.ndarray
+
+
+class _Tables(NamedTuple):
+    placement_lo: np.ndarray
+    placement_hi: np.ndarray
+    placement_shape: np.ndarray
+    unit_lo: np.ndarray
+    unit_hi: np.ndarray
+    cell_lo: np.ndarray
+    cell_hi: np.ndarray
+    spawn_shapes: np.ndarray  # piece, rotations, mirrored -> shape index
+    piece_weights: np.ndarray
+    shape_count: int
+
+
+def _split(masks: Iterable[int]) -> Tuple[np.ndarray, np.ndarray]:
+    masks = list(masks)
+    return (np.array([mask & LOW_BITS for mask in masks], dtype=np.uint64),
+            np.array([mask >> 64 for mask in masks], dtype=np.uint64))
+
+
+@lru_cache(maxsize=None)
+def _tables() -> _Tables:
+    table = get_table()
+    starts = np.asarray(table.shape_starts, dtype=np.int64)
+    spawn = np.empty((len(ALL_PIECES), 4, 2), dtype=np.int16)
+    for p, piece in enumerate(ALL_PIECES):
+        shape = piece.shape
+        for rotations in range(4):
+            spawn[p, rotations, 0] = table.shape_index[shape]
+            spawn[p, rotations, 1] = table.shape_index[mirror_shape(shape)]
+            shape = rotate_shape(shape)
+    weights = np.array([piece_weight(piece) for piece in ALL_PIECES])
+    return _Tables(
+        np.asarray(table.lo), np.asarray(table.hi),
+        np.repeat(np.arange(len(table.shapes), dtype=np.int16), np.diff(starts)),
+        *_split(UNIT_MASKS),
+        *_split(1 << cell for cell in range(81)),
+        spawn, weights, len(table.shapes),
+    )
+
+
+@lru_cache(maxsize=None)
+def _variants(free_rotate: bool, free_mirror: bool) -> np.ndarray:
+    """variants[s, t]: a hand piece in shape s can be played as shape t."""
+    table = get_table()
+    variants = np.zeros((len(table.shapes) + 1, len(table.shapes)), dtype=bool)
+    for s, shape in enumerate(table.shapes):
+        variants[s, [table.shape_index[t] for t in playable_as(shape, free_rotate, free_mirror)]] = True
+    # The extra last row is what an empty slot (-1) indexes: nothing
+    return variants
+
+
+if hasattr(np, "bitwise_count"):  # NumPy 2.0+
+    def _bit_count(words: np.ndarray) -> np.ndarray:
+        return np.bitwise_count(words).astype(np.int64)
+else:
+    # Bits set in every 16-bit value; a uint64 word is four lookups
+    _BITS_IN_UINT16 = np.zeros(1 << 16, dtype=np.int64)
+    for _bit in range(16):
+        _BITS_IN_UINT16 += (np.arange(1 << 16) >> _bit) & 1
+
+    def _bit_count(words: np.ndarray) -> np.ndarray:
+        words = np.ascontiguousarray(words, dtype=np.uint64)
+        return _BITS_IN_UINT16[words.view(np.uint16).reshape(words.shape + (4,))].sum(axis=-1)
+
+
+def _popcount(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    return _bit_count(lo) + _bit_count(hi)
+
+
+def _word(mask: int, high: bool) -> np.uint64:
+    return np.uint64(mask >> 64 if high else mask & LOW_BITS)
+
+
+_HI_BITS = _word(FULL_BOARD, True)
+_EVAL_MASKS = {name: (_word(mask, False), _word(mask, True))
+               for name, mask in (("right", _HAS_RIGHT), ("below", _HAS_BELOW), ("left", _HAS_LEFT),
+                                  ("full", FULL_BOARD))}
+
+
+def _shift_right(lo: np.ndarray, hi: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    return (lo >> np.uint64(n)) | (hi << np.uint64(64 - n)), hi >> np.uint64(n)
+
+
+def _shift_left(lo: np.ndarray, hi: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    return lo << np.uint64(n), ((hi << np.uint64(n)) | (lo >> np.uint64(64 - n))) & _HI_BITS
+
+
+def _evaluate(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """search.evaluate over arrays of board words."""
+    right, below, left, full = (_EVAL_MASKS[name] for name in ("right", "below", "left", "full"))
+    lo1, hi1 = _shift_right(lo, hi, 1)
+    lo9, hi9 = _shift_right(lo, hi, 9)
+    edges = (_popcount((lo ^ lo1) & right[0], (hi ^ hi1) & right[1])
+             + _popcount((lo ^ lo9) & below[0], (hi ^ hi9) & below[1]))
+    empty_lo, empty_hi = full[0] & ~lo, full[1] & ~hi
+    right_lo, right_hi = _shift_right(empty_lo, empty_hi, 1)
+    left_lo, left_hi = _shift_left(empty_lo, empty_hi, 1)
+    down_lo, down_hi = _shift_right(empty_lo, empty_hi, 9)
+    up_lo, up_hi = _shift_left(empty_lo, empty_hi, 9)
+    open_lo = (right_lo & right[0]) | (left_lo & left[0]) | down_lo | up_lo
+    open_hi = (right_hi & right[1]) | (left_hi & left[1]) | down_hi | up_hi
+    isolated = _popcount(empty_lo & ~open_lo, empty_hi & ~open_hi)
+    return -(edges * EDGE_WEIGHT + isolated * ISOLATED_WEIGHT)
+
+
+def simulate(unlocks: UnlockSet, games: int, seed: int = 0, max_moves: int = 5000) -> GameStats:
+    """Play ``games`` games in lockstep and return their per-game totals."""
+    tables = _tables()
+    rng = np.random.default_rng(seed)
+    pieces = np.array([i for i, piece in enumerate(ALL_PIECES) if piece.name in unlocks.pieces])
+    if not len(pieces):
+        raise ValueError("no pieces unlocked")
+    weights = tables.piece_weights[pieces] / tables.piece_weights[pieces].sum()
+    variants = _variants(FREE_ROTATE in unlocks.permanents, FREE_MIRROR in unlocks.permanents)
+    free_hold = FREE_HOLD in unlocks.permanents
+    slots = unlocks.slots
+    hold = slots  # index of the hold column in hand
+
+    lo = np.zeros(games, dtype=np.uint64)
+    hi = np.zeros(games, dtype=np.uint64)
+    gem_lo = np.zeros(games, dtype=np.uint64)
+    gem_hi = np.zeros(games, dtype=np.uint64)
+    hand = np.full((games, slots + 1), -1, dtype=np.int16)
+    combos = np.zeros(games, dtype=np.int64)
+    totals = {stat: np.zeros(games, dtype=np.int64) for stat in STATS}
+    alive = np.ones(games, dtype=bool)
+
+    def refill(rows: np.ndarray) -> None:
+        if not len(rows):
+            return
+        drawn = rng.choice(pieces, size=(len(rows), slots), p=weights)
+        rotations = rng.integers(0, 4, size=drawn.shape)
+        mirrored = rng.random(drawn.shape) < 0.5
+        hand[rows, :slots] = tables.spawn_shapes[drawn, rotations, mirrored.astype(np.int64)]
+        # spawnGem: a random cell that is neither filled nor a gem
+        rows = rows[rng.random(len(rows)) < GEM_SPAWN_RATIO]
+        occupied_lo = lo[rows] | gem_lo[rows]
+        occupied_hi = hi[rows] | gem_hi[rows]
+        free = ((occupied_lo[:, None] & tables.cell_lo) | (occupied_hi[:, None] & tables.cell_hi)) == 0
+        keys = np.where(free, rng.random(free.shape), -1.0)
+        cells = keys.argmax(axis=1)
+        spawned = keys[np.arange(len(rows)), cells] >= 0
+        rows, cells = rows[spawned], cells[spawned]
+        gem_lo[rows] |= tables.cell_lo[cells]
+        gem_hi[rows] |= tables.cell_hi[cells]
+
+    refill(np.arange(games))
+    for _ in range(max_moves):
+        rows = np.flatnonzero(alive)
+        if not len(rows):
+            break
+        board_lo, board_hi, held = lo[rows], hi[rows], hand[rows]
+
+        playable = np.zeros((len(rows), tables.shape_count), dtype=bool)
+        for k in range(slots + 1):
+            playable |= variants[held[:, k]]
+        fits = ((board_lo[:, None] & tables.placement_lo) | (board_hi[:, None] & tables.placement_hi)) == 0
+        legal = fits & playable[:, tables.placement_shape]
+        has_move = legal.any(axis=1)
+
+        dead = ~has_move
+        if free_hold:
+            # Park the last piece of a stuck hand so a fresh hand is drawn
+            stuck = dead & (held[:, hold] < 0) & ((held[:, :slots] >= 0).sum(axis=1) == 1)
+            if stuck.any():
+                parked = rows[stuck]
+                slot = (hand[parked, :slots] >= 0).argmax(axis=1)
+                hand[parked, hold] = hand[parked, slot]
+                hand[parked, slot] = -1
+                refill(parked)
+                dead &= ~stuck
+        alive[rows[dead]] = False
+
+        rows, legal = rows[has_move], legal[has_move]
+        board_lo, board_hi, held = board_lo[has_move], board_hi[has_move], held[has_move]
+        if not len(rows):
+            continue
+        count = len(rows)
+        index = np.arange(count)
+
+        # Score every legal placement: points it earns plus the evaluation of the board it leaves
+        game, placement = np.nonzero(legal)
+        new_lo = board_lo[game] | tables.placement_lo[placement]
+        new_hi = board_hi[game] | tables.placement_hi[placement]
+        complete = (((new_lo[:, None] & tables.unit_lo) == tables.unit_lo)
+                    & ((new_hi[:, None] & tables.unit_hi) == tables.unit_hi))
+        cleared_lo = np.bitwise_or.reduce(np.where(complete, tables.unit_lo, np.uint64(0)), axis=1)
+        cleared_hi = np.bitwise_or.reduce(np.where(complete, tables.unit_hi, np.uint64(0)), axis=1)
+        new_lo &= ~cleared_lo
+        new_hi &= ~cleared_hi
+        lines = complete[:, :18].sum(axis=1)
+        boxes = complete[:, 18:].sum(axis=1)
+        total_clears = lines + boxes
+        new_combos = combos[rows][game] + (total_clears > 1)
+        score_multiplier = unlocks.multiplier + new_combos * COMBO_MULTIPLIER_INCREMENT
+        combo_multiplier = np.where(total_clears > 1, total_clears, 1)
+        points = np.floor((lines * 10 + boxes * 30) * (combo_multiplier * score_multiplier)).astype(np.int64)
+        # Random tie-breaks, well below the evaluation's step of 1
+        value = np.full(legal.shape, -np.inf)
+        value[game, placement] = points + _evaluate(new_lo, new_hi) + rng.random(len(game)) * 1e-3
+        candidate = np.empty(legal.shape, dtype=np.int64)
+        candidate[game, placement] = np.arange(len(game))
+        best = candidate[index, value.argmax(axis=1)]
+        chosen = placement[best]
+        cleared_lo, cleared_hi = cleared_lo[best], cleared_hi[best]
+        lines, boxes, total_clears, points = lines[best], boxes[best], total_clears[best], points[best]
+
+        # Use up the hand piece (hold last) that can become the chosen shape
+        can_be = variants[held, tables.placement_shape[chosen][:, None]]
+        slot = np.where(can_be[:, :slots].any(axis=1), can_be[:, :slots].argmax(axis=1), hold)
+        hand[rows, slot] = -1
+        totals["piece"][rows] += 1
+
+        lo[rows] = new_lo[best]
+        hi[rows] = new_hi[best]
+
+        gems = _popcount(gem_lo[rows] & cleared_lo, gem_hi[rows] & cleared_hi)
+        totals["gem"][rows] = np.minimum(totals["gem"][rows] + gems, MAX_GEM_CHECKS)
+        gem_lo[rows] &= ~cleared_lo
+        gem_hi[rows] &= ~cleared_hi
+        totals["line_clear"][rows] += lines
+        totals["box_clear"][rows] += boxes
+        combos[rows] += total_clears > 1
+        totals["score"][rows] += points
+
+        refill(rows[(hand[rows, :slots] < 0).all(axis=1)])
+
+    return GameStats(**totals)
+
+
+def _simulate_batch(args: Tuple[UnlockSet, int, int, int]) -> GameStats:
+    unlocks, games, seed, max_moves = args
+    return simulate(unlocks, games, seed, max_moves)
+
+
+def run_playouts(unlock_sets: Sequence[UnlockSet], games: int, seed: int = 0, batch: int = 256,
+                 workers: Optional[int] = None, max_moves: int = 5000) -> List[GameStats]:
+    """
+    Simulate ``games`` games for each unlock set, split into batches across
+    a process pool. Every batch gets its own seed from one SeedSequence, so
+    the result does not depend on the number of workers.
+    """
+    seeds = iter(np.random.SeedSequence(seed).generate_state(len(unlock_sets) * -(-games // batch)))
+    jobs = []
+    for unlocks in unlock_sets:
+        for start in range(0, games, batch):
+            jobs.append((unlocks, min(batch, games - start), int(next(seeds)), max_moves))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = list(map(_simulate_batch, jobs))
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_simulate_batch, jobs))
+
+    merged = []
+    batches = iter(results)
+    for _ in unlock_sets:
+        parts = [next(batches) for _ in range(0, games, batch)]
+        merged.append(GameStats(*(np.concatenate(column) for column in zip(*parts))))
+    return merged
+
+
+def milestone_table(unlock_sets: Sequence[UnlockSet], stats: Sequence[GameStats],
+                    milestones: Dict[str, Sequence[Tuple[int, str]]]) -> dict:
+    """
+    JSON-ready table of the results: per unlock set, the mean of each stat
+    and the fraction of games that reached each milestone.
+
+    ``milestones`` maps a stat name to (threshold, location name) pairs.
+    """
+    rows = []
+    for unlocks, result in zip(unlock_sets, stats):
+        rows.append({
+            "pieces": sorted(unlocks.pieces),
+            "slots": unlocks.slots,
+            "permanents": sorted(unlocks.permanents),
+            "multiplier": unlocks.multiplier,
+            "games": len(result.score),
+            "mean": {stat: round(float(getattr(result, stat).mean()), 2) for stat in STATS},
+            "reach": {name: round(float((getattr(result, stat) >= threshold).mean()), 4)
+                      for stat, entries in milestones.items() for threshold, name in entries},
+        })
+    return {"version": 1, "rows": rows}
+
+
+def unlock_ladder(slots: Iterable[int] = (3, 4, 5),
+                  permanents: Iterable[FrozenSet[str]] = (frozenset(),)) -> List[UnlockSet]:
+    """
+    Unlock sets from the starters up to every piece, adding pieces in item
+    order, for each hand size and permanent combination.
+    """
+    extra = [piece.name for piece in ALL_PIECES if piece.name not in STARTER_PIECE_NAMES]
+    return [UnlockSet(frozenset(STARTER_PIECE_NAMES) | frozenset(extra[:count]), slot, perms)
+            for perms in permanents for slot in slots for count in range(len(extra) + 1)]
@@ -0,0 +1,136 @@
+"""
+Blockudoku Piece Sampler
+
+Seeded draws from the client's size-weighted piece generator
+(getWeightedRandomPiece / generatePieces in app/utils/blockudoku.ts) with
+Vose alias tables: each unlock set's table is built once, on first use, and
+every draw after that is one uniform column pick plus one biased coin,
+whatever the number of unlocked pieces. The last ALIAS_CACHE_SIZE tables
+used are cached per (pieces, size ratio). precompute_tables builds the table
+for the starter pieces plus every subset of the shape items up front, into
+one set of flat arrays (AliasTables) rather than the cache.
+
+Requires numpy.
+"""
+
+from functools import lru_cache
+from typing import FrozenSet, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .pieces import ALL_PIECES, STARTER_PIECE_NAMES, Piece
+from .unlocks import DEFAULT_SIZE_RATIO, UnlockSet, piece_weight
+
+_PIECE_INDEX = {piece.name: index for index, piece in enumerate(ALL_PIECES)}
+SHAPE_ITEM_NAMES: Tuple[str, ...] = tuple(piece.name for piece in ALL_PIECES if piece.name not in STARTER_PIECE_NAMES)
+_STARTERS = frozenset(STARTER_PIECE_NAMES)
+
+# Unlock sets a simulation run usually visits; every one of the 2**15 is precompute_tables' job
+ALIAS_CACHE_SIZE = 1024
+
+
+class AliasTable(NamedTuple):
+    """Column i keeps pieces[i] with probability[i], else gives pieces[alias[i]]."""
+    pieces: np.ndarray  # indices into ALL_PIECES, in ALL_PIECES order
+    probability: np.ndarray
+    alias: np.ndarray
+
+
+def build_alias(weights: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Vose's alias method: (probability, alias) columns for the given weights."""
+    count = len(weights)
+    total = float(sum(weights))
+    scaled = [weight * count / total for weight in weights]
+    probability = np.ones(count)
+    alias = np.arange(count)
+    small = [index for index, value in enumerate(scaled) if value < 1]
+    large = [index for index, value in enumerate(scaled) if value >= 1]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probability[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1 - scaled[less]
+        (small if scaled[more] < 1 else large).append(more)
+    # Whatever is left is 1 up to rounding
+    return probability, alias
+
+
+@lru_cache(maxsize=ALIAS_CACHE_SIZE)
+def alias_table(pieces: FrozenSet[str], size_ratio: float = DEFAULT_SIZE_RATIO) -> AliasTable:
+    """The alias table for drawing from an unlock set's pieces."""
+    indices = sorted(_PIECE_INDEX[name] for name in pieces)
+    if not indices:
+        raise ValueError("No pieces available")
+    probability, alias = build_alias([piece_weight(ALL_PIECES[index], size_ratio) for index in indices])
+    return AliasTable(np.array(indices), probability, alias)
+
+
+def piece_probabilities(pieces: FrozenSet[str], size_ratio: float = DEFAULT_SIZE_RATIO) -> np.ndarray:
+    """Exact chance of each piece in ALL_PIECES under getWeightedRandomPiece (0 if locked)."""
+    weights = np.array([piece_weight(piece, size_ratio) if piece.name in pieces else 0.0 for piece in ALL_PIECES])
+    return weights / weights.sum()
+
+
+class AliasTables(NamedTuple):
+    """
+    The alias table of the starter pieces plus every subset of the shape
+    items, one row per subset: row r holds the subset whose bit i is
+    SHAPE_ITEM_NAMES[i], in its first columns[r] columns.
+    """
+    columns: np.ndarray
+    pieces: np.ndarray
+    probability: np.ndarray
+    alias: np.ndarray
+
+    def table(self, pieces: FrozenSet[str]) -> AliasTable:
+        """The row for an unlock set's pieces, as views into the flat arrays."""
+        if not pieces >= _STARTERS:
+            raise ValueError("Precomputed tables all include the starter pieces")
+        row = sum(1 << bit for bit, name in enumerate(SHAPE_ITEM_NAMES) if name in pieces)
+        if len(pieces) != len(_STARTERS) + bin(row).count("1"):
+            raise ValueError(f"Unknown pieces: {sorted(pieces - _STARTERS - set(SHAPE_ITEM_NAMES))}")
+        count = self.columns[row]
+        return AliasTable(self.pieces[row, :count], self.probability[row, :count], self.alias[row, :count])
+
+
+def precompute_tables(size_ratio: float = DEFAULT_SIZE_RATIO) -> AliasTables:
+    """Build the table for the starter pieces plus every subset of the shape items."""
+    rows = 1 << len(SHAPE_ITEM_NAMES)
+    # Piece indices fit in a byte, which keeps all 2**15 rows to about 6 MiB
+    columns = np.zeros(rows, dtype=np.int8)
+    pieces = np.zeros((rows, len(ALL_PIECES)), dtype=np.int8)
+    probability = np.ones((rows, len(ALL_PIECES)))
+    alias = np.zeros((rows, len(ALL_PIECES)), dtype=np.int8)
+    for row in range(rows):
+        names = _STARTERS.union(name for bit, name in enumerate(SHAPE_ITEM_NAMES) if row >> bit & 1)
+        indices = sorted(_PIECE_INDEX[name] for name in names)
+        count = columns[row] = len(indices)
+        pieces[row, :count] = indices
+        probability[row, :count], alias[row, :count] = build_alias(
+            [piece_weight(ALL_PIECES[index], size_ratio) for index in indices])
+    return AliasTables(columns, pieces, probability, alias)
+
+
+class PieceSampler:
+    """Seeded piece and hand draws for unlock sets."""
+
+    def __init__(self, seed: int = 0, size_ratio: float = DEFAULT_SIZE_RATIO, tables: Optional[AliasTables] = None):
+        """tables, if given, must come from precompute_tables with the same size_ratio."""
+        self.rng = np.random.default_rng(seed)
+        self.size_ratio = size_ratio
+        self.tables = tables
+
+    def draw_indices(self, pieces: FrozenSet[str], shape: Tuple[int, ...]) -> np.ndarray:
+        """An array of the given shape of ALL_PIECES indices."""
+        table = self.tables.table(pieces) if self.tables is not None else alias_table(pieces, self.size_ratio)
+        columns = self.rng.integers(len(table.pieces), size=shape)
+        kept = self.rng.random(shape) < table.probability[columns]
+        return table.pieces[np.where(kept, columns, table.alias[columns])]
+
+    def draw(self, pieces: FrozenSet[str]) -> Piece:
+        """One piece, like getWeightedRandomPiece."""
+        return ALL_PIECES[int(self.draw_indices(pieces, (1,))[0])]
+
+    def hands(self, unlocks: UnlockSet, count: int) -> np.ndarray:
+        """count hands of unlocks.slots pieces each, like generatePieces: a (count, slots) index array."""
+        return self.draw_indices(unlocks.pieces, (count, unlocks.slots))
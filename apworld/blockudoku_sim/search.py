@@ -0,0 +1,251 @@
+"""
+Blockudoku Beam Search
+
+A deterministic search player that plays each hand as a unit: it looks
+ahead over every order and placement of the pieces in the hand (3-5 slots),
+keeps the best ``beam_width`` partial sequences after each piece, and plays
+the best complete one. A transposition table keyed by the board bitmask
+(plus what is left to place) drops sequences that reach the same position
+with fewer points, which is common since pieces often commute.
+
+Positions are ranked by points scored so far plus a board evaluation that
+penalizes ragged edges between filled and empty cells and isolated empty
+cells. Scoring, combos and hand refills follow useBlockudoku; Permanent Free
+Rotate/Mirror/Hold widen the moves as in blockudoku_sim.playout.
+Gems do not change play and are not simulated.
+"""
+
+import math
+import random
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .board import FULL_BOARD, GRID_SIZE, UNIT_MASKS
+from .masks import MaskTable, get_table
+from .pieces import ALL_PIECES, Shape, mirror_shape, rotate_shape
+from .unlocks import (
+    COMBO_MULTIPLIER_INCREMENT, FREE_HOLD, FREE_MIRROR, FREE_ROTATE, UnlockSet, piece_weight, playable_as,
+)
+
+# Cells whose right / lower neighbour is on the board
+_HAS_RIGHT = sum(1 << (r * GRID_SIZE + c) for r in range(GRID_SIZE) for c in range(GRID_SIZE - 1))
+_HAS_BELOW = (1 << (GRID_SIZE * (GRID_SIZE - 1))) - 1
+_HAS_LEFT = _HAS_RIGHT << 1
+
+EDGE_WEIGHT = 1.0
+ISOLATED_WEIGHT = 4.0
+
+
+class SearchConfig(NamedTuple):
+    """
+    beam_width: partial sequences kept per depth.
+    hand_budget: seconds per hand; when set, each hand is searched again with
+        a doubled beam (starting from beam_width) while time remains, up to
+        max_beam_width. Results then depend on machine speed.
+    """
+    beam_width: int = 8
+    hand_budget: Optional[float] = None
+    max_beam_width: int = 256
+
+
+class GameResult(NamedTuple):
+    score: int
+    lines: int
+    boxes: int
+    pieces: int
+    reached_goal: bool
+    seconds: float
+
+
+class _Node(NamedTuple):
+    value: float
+    points: int
+    combos: int
+    lines: int
+    boxes: int
+    pieces: int
+    board: int
+    remaining: Tuple[Shape, ...]
+    held: Optional[Shape]
+
+
+def evaluate(board: int) -> float:
+    """Board quality, higher is better: minus ragged edges and isolated holes."""
+    edges = (((board ^ (board >> 1)) & _HAS_RIGHT).bit_count()
+             + ((board ^ (board >> GRID_SIZE)) & _HAS_BELOW).bit_count())
+    empty = FULL_BOARD & ~board
+    open_neighbour = (((empty >> 1) & _HAS_RIGHT) | ((empty << 1) & _HAS_LEFT)
+                      | (empty >> GRID_SIZE) | (empty << GRID_SIZE))
+    isolated = (empty & ~open_neighbour).bit_count()
+    return -(edges * EDGE_WEIGHT + isolated * ISOLATED_WEIGHT)
+
+
+@lru_cache(maxsize=1 << 16)
+def _touched_units(mask: int) -> Tuple[Tuple[int, int], ...]:
+    """(unit index, unit mask) of every row, column and box a placement covers."""
+    return tuple((i, unit) for i, unit in enumerate(UNIT_MASKS) if unit & mask)
+
+
+class BeamPlayer:
+    def __init__(self, unlocks: UnlockSet, config: SearchConfig = SearchConfig(), table: MaskTable = None):
+        self.unlocks = unlocks
+        self.config = config
+        self.table = table or get_table()
+        self.free_rotate = FREE_ROTATE in unlocks.permanents
+        self.free_mirror = FREE_MIRROR in unlocks.permanents
+        self.free_hold = FREE_HOLD in unlocks.permanents
+        self.pieces = [piece for piece in ALL_PIECES if piece.name in unlocks.pieces]
+        if not self.pieces:
+            raise ValueError("no pieces unlocked")
+        self.weights = [piece_weight(piece) for piece in self.pieces]
+        self._evaluations: Dict[int, float] = {}
+        self.transposition_hits = 0
+        self.nodes = 0
+
+    def draw_hand(self, rng: random.Random) -> Tuple[Shape, ...]:
+        """generateNewPieces: weighted pieces, 0-3 rotations, 50% mirrored."""
+        hand = []
+        for piece in rng.choices(self.pieces, self.weights, k=self.unlocks.slots):
+            shape = piece.shape
+            for _ in range(rng.randrange(4)):
+                shape = rotate_shape(shape)
+            if rng.random() < 0.5:
+                shape = mirror_shape(shape)
+            hand.append(shape)
+        return tuple(hand)
+
+    def _evaluate(self, board: int) -> float:
+        value = self._evaluations.get(board)
+        if value is None:
+            if len(self._evaluations) > 1 << 20:
+                self._evaluations.clear()
+            value = self._evaluations[board] = evaluate(board)
+        return value
+
+    def _children(self, node: _Node) -> Iterable[_Node]:
+        sources = [(i, shape) for i, shape in enumerate(node.remaining)]
+        if node.held is not None:
+            sources.append((None, node.held))
+        for i, shape in sources:
+            remaining = node.remaining if i is None else node.remaining[:i] + node.remaining[i + 1:]
+            held = node.held if i is not None else None
+            for variant in playable_as(shape, self.free_rotate, self.free_mirror):
+                for _, mask in self.table.shape_masks(variant):
+                    if node.board & mask:
+                        continue
+                    yield self._place(node, node.board | mask, mask, remaining, held)
+            if self.free_hold and i is not None and node.held is None:
+                # Park this piece in the hold instead of placing it
+                yield node._replace(remaining=remaining, held=shape)
+
+    def _place(self, node: _Node, board: int, mask: int, remaining, held) -> _Node:
+        cleared = 0
+        lines = boxes = 0
+        for i, unit in _touched_units(mask):
+            if board & unit == unit:
+                cleared |= unit
+                if i < 18:
+                    lines += 1
+                else:
+                    boxes += 1
+        points, combos = node.points, node.combos
+        if cleared:
+            board &= ~cleared
+            total = lines + boxes
+            if total > 1:
+                combos += 1
+            multiplier = self.unlocks.multiplier + combos * COMBO_MULTIPLIER_INCREMENT
+            points += math.floor((lines * 10 + boxes * 30) * ((total if total > 1 else 1) * multiplier))
+        return _Node(points + self._evaluate(board), points, combos, node.lines + lines, node.boxes + boxes,
+                     node.pieces + 1, board, remaining, held)
+
+    def _search(self, root: _Node, beam_width: int) -> _Node:
+        """Best node after placing as much of the hand as possible."""
+        beam = [root]
+        best = root
+        while beam:
+            table: Dict[tuple, _Node] = {}
+            for node in beam:
+                for child in self._children(node):
+                    self.nodes += 1
+                    key = (child.board, tuple(sorted(child.remaining)), child.held)
+                    seen = table.get(key)
+                    if seen is not None:
+                        self.transposition_hits += 1
+                        if seen.points >= child.points:
+                            continue
+                    table[key] = child
+            if not table:
+                break
+            beam = sorted(table.values(), key=lambda node: node.value, reverse=True)[:beam_width]
+            finished = [node for node in beam if not node.remaining]
+            if finished:
+                return max(finished, key=lambda node: node.value)
+            best = beam[0]
+        return best
+
+    def play_hand(self, root: _Node) -> _Node:
+        if self.config.hand_budget is None:
+            return self._search(root, self.config.beam_width)
+        deadline = time.perf_counter() + self.config.hand_budget
+        width = self.config.beam_width
+        best = self._search(root, width)
+        while width < self.config.max_beam_width and time.perf_counter() < deadline:
+            width *= 2
+            candidate = self._search(root, width)
+            if (len(candidate.remaining), -candidate.value) < (len(best.remaining), -best.value):
+                best = candidate
+        return best
+
+    def play(self, seed: int, goal_score: Optional[int] = None, max_pieces: Optional[int] = None,
+             time_limit: Optional[float] = None, targets: Optional[Tuple[int, int, int, int]] = None) -> GameResult:
+        """
+        Play one game. It ends when no hand can be fully placed, or early
+        once goal_score is reached, once the (score, lines, boxes, pieces)
+        targets are all reached, or when a piece or time limit runs out.
+        """
+        rng = random.Random(seed)
+        start = time.perf_counter()
+        node = _Node(0.0, 0, 0, 0, 0, 0, 0, (), None)
+        while True:
+            node = self.play_hand(node._replace(remaining=self.draw_hand(rng)))
+            if goal_score is not None and node.points >= goal_score:
+                break
+            if node.remaining:
+                break
+            if max_pieces is not None and node.pieces >= max_pieces:
+                break
+            if targets is not None and (node.points >= targets[0] and node.lines >= targets[1]
+                                        and node.boxes >= targets[2] and node.pieces >= targets[3]):
+                break
+            if time_limit is not None and time.perf_counter() - start >= time_limit:
+                break
+        return GameResult(node.points, node.lines, node.boxes, node.pieces,
+                          goal_score is not None and node.points >= goal_score, time.perf_counter() - start)
+
+
+def _play_games(args: Tuple[UnlockSet, SearchConfig, Sequence[int], Optional[int], Optional[int],
+                            Optional[float], Optional[Tuple[int, int, int, int]]]) -> List[GameResult]:
+    unlocks, config, seeds, goal_score, max_pieces, time_limit, targets = args
+    player = BeamPlayer(unlocks, config)
+    return [player.play(seed, goal_score, max_pieces, time_limit, targets) for seed in seeds]
+
+
+def play_games(unlocks: UnlockSet, seeds: Sequence[int], config: SearchConfig = SearchConfig(),
+               goal_score: Optional[int] = None, max_pieces: Optional[int] = None,
+               time_limit: Optional[float] = None, workers: int = 1,
+               targets: Optional[Tuple[int, int, int, int]] = None) -> List[GameResult]:
+    """Play one game per seed, optionally spread over a process pool."""
+    if workers == 1:
+        return _play_games((unlocks, config, seeds, goal_score, max_pieces, time_limit, targets))
+    from concurrent.futures import ProcessPoolExecutor
+    chunks = [seeds[i::workers] for i in range(workers)]
+    with ProcessPoolExecutor(workers) as pool:
+        parts = list(pool.map(_play_games, [(unlocks, config, chunk, goal_score, max_pieces, time_limit, targets)
+                                            for chunk in chunks]))
+    # Restore seed order
+    results = [None] * len(seeds)
+    for i, part in enumerate(parts):
+        results[i::workers] = part
+    return results
@@ -0,0 +1,51 @@
+"""
+Blockudoku Unlocks
+
+What a player has unlocked, and the client constants that decide how it
+plays: the size-weighted piece generator, the combo bonus and what the
+permanent abilities allow. Shared by the playout and search players.
+"""
+
+from functools import lru_cache
+from typing import FrozenSet, NamedTuple, Tuple
+
+from .pieces import STARTER_PIECE_NAMES, Piece, Shape, mirror_shape, piece_size, rotate_shape
+
+# app/utils/constants.ts
+DEFAULT_SIZE_RATIO = 0.5
+GEM_SPAWN_RATIO = 0.3
+COMBO_MULTIPLIER_INCREMENT = 0.02
+MAX_GEM_CHECKS = 100
+
+FREE_ROTATE = "Permanent Free Rotate"
+FREE_MIRROR = "Permanent Free Mirror"
+FREE_HOLD = "Permanent Free Hold"
+
+
+class UnlockSet(NamedTuple):
+    """What the player has: unlocked piece names, hand size and permanent abilities."""
+    pieces: FrozenSet[str] = frozenset(STARTER_PIECE_NAMES)
+    slots: int = 3
+    permanents: FrozenSet[str] = frozenset()
+    multiplier: float = 1.0
+
+
+def piece_weight(piece: Piece, size_ratio: float = DEFAULT_SIZE_RATIO) -> float:
+    """getWeightedRandomPiece: closer to the size ratio is likelier, never below 0.1."""
+    return max(0.1, 1 - abs((piece_size(piece.shape) - 1) / 4 - size_ratio))
+
+
+@lru_cache(maxsize=None)
+def playable_as(shape: Shape, free_rotate: bool, free_mirror: bool) -> Tuple[Shape, ...]:
+    """Every shape a hand piece can be placed as with free rotation and/or mirroring."""
+    reachable, pending = {}, [shape]
+    while pending:
+        current = pending.pop()
+        if current in reachable:
+            continue
+        reachable[current] = None
+        if free_rotate:
+            pending.append(rotate_shape(current))
+        if free_mirror:
+            pending.append(mirror_shape(current))
+    return tuple(reachable)
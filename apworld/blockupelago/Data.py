@@ -0,0 +1,347 @@
+"""
+Blockupelago Data
+
+Frozen item and location ID tables.
+Generated by apworld/generate_data.py - do not edit by hand.
+"""
+
+from types import MappingProxyType
+from BaseClasses import ItemClassification
+
+# (name, code, classification, category), in item_table order
+ITEMS = (
+    ("Single Block", 8000001, ItemClassification.progression, "piece"),
+    ("Domino I", 8000002, ItemClassification.progression, "piece"),
+    ("Tromino I", 8000003, ItemClassification.progression, "piece"),
+    ("Tromino L", 8000004, ItemClassification.progression, "piece"),
+    ("Tetromino I", 8000005, ItemClassification.progression, "piece"),
+    ("Tetromino O", 8000006, ItemClassification.progression, "piece"),
+    ("Tetromino T", 8000007, ItemClassification.progression, "piece"),
+    ("Tetromino L", 8000008, ItemClassification.progression, "piece"),
+    ("Tetromino S", 8000009, ItemClassification.progression, "piece"),
+    ("Pentomino I", 8000010, ItemClassification.progression, "piece"),
+    ("Pentomino L", 8000011, ItemClassification.progression, "piece"),
+    ("Pentomino P", 8000012, ItemClassification.progression, "piece"),
+    ("Pentomino U", 8000013, ItemClassification.progression, "piece"),
+    ("Pentomino W", 8000014, ItemClassification.progression, "piece"),
+    ("Pentomino Plus", 8000015, ItemClassification.progression, "piece"),
+    ("3x3 Corner", 8000016, ItemClassification.progression, "piece"),
+    ("3x3 T-Shape", 8000017, ItemClassification.progression, "piece"),
+    ("3x3 Cross", 8000018, ItemClassification.progression, "piece"),
+    ("4th Piece Slot", 8002001, ItemClassification.progression, "slot"),
+    ("5th Piece Slot", 8002002, ItemClassification.progression, "slot"),
+    ("Rotate Ability", 8003001, ItemClassification.useful, "ability"),
+    ("Undo Ability", 8003002, ItemClassification.useful, "ability"),
+    ("Remove Block", 8003003, ItemClassification.useful, "ability"),
+    ("Hold Ability", 8003004, ItemClassification.useful, "ability"),
+    ("Mirror Ability", 8003005, ItemClassification.useful, "ability"),
+    ("Shrink Ability", 8003006, ItemClassification.useful, "ability"),
+    ("Permanent Free Rotate", 8003101, ItemClassification.progression, "permanent"),
+    ("Permanent Free Mirror", 8003102, ItemClassification.progression, "permanent"),
+    ("Permanent Free Hold", 8003103, ItemClassification.progression, "permanent"),
+    ("Score Multiplier +10%", 8004001, ItemClassification.filler, "multiplier"),
+    ("Score Multiplier +25%", 8004002, ItemClassification.useful, "multiplier"),
+    ("Score Multiplier +50%", 8004003, ItemClassification.useful, "multiplier"),
+)
+
+ITEM_NAME_TO_ID = MappingProxyType({name: code for name, code, _, _ in ITEMS})
+
+STARTER_PIECES = frozenset({"Tromino L", "Tetromino T", "Tetromino L"})
+
+PIECE_ITEMS = (
+    "Single Block",
+    "Domino I",
+    "Tromino I",
+    "Tromino L",
+    "Tetromino I",
+    "Tetromino O",
+    "Tetromino T",
+    "Tetromino L",
+    "Tetromino S",
+    "Pentomino I",
+    "Pentomino L",
+    "Pentomino P",
+    "Pentomino U",
+    "Pentomino W",
+    "Pentomino Plus",
+    "3x3 Corner",
+    "3x3 T-Shape",
+    "3x3 Cross",
+)
+
+SLOT_ITEMS = (
+    "4th Piece Slot",
+    "5th Piece Slot",
+)
+
+ABILITY_ITEMS = (
+    "Rotate Ability",
+    "Undo Ability",
+    "Remove Block",
+    "Hold Ability",
+    "Mirror Ability",
+    "Shrink Ability",
+)
+
+PERMANENT_ITEMS = (
+    "Permanent Free Rotate",
+    "Permanent Free Mirror",
+    "Permanent Free Hold",
+)
+
+MULTIPLIER_ITEMS = (
+    "Score Multiplier +10%",
+    "Score Multiplier +25%",
+    "Score Multiplier +50%",
+)
+
+ITEM_GROUPS = MappingProxyType({
+    "Progression": frozenset({
+        "Single Block",
+        "Domino I",
+        "Tromino I",
+        "Tromino L",
+        "Tetromino I",
+        "Tetromino O",
+        "Tetromino T",
+        "Tetromino L",
+        "Tetromino S",
+        "Pentomino I",
+        "Pentomino L",
+        "Pentomino P",
+        "Pentomino U",
+        "Pentomino W",
+        "Pentomino Plus",
+        "3x3 Corner",
+        "3x3 T-Shape",
+        "3x3 Cross",
+    }),
+    "Abilities": frozenset({
+        "4th Piece Slot",
+        "5th Piece Slot",
+        "Rotate Ability",
+        "Undo Ability",
+        "Remove Block",
+        "Hold Ability",
+        "Mirror Ability",
+        "Shrink Ability",
+    }),
+    "Score Boosts": frozenset({
+        "Score Multiplier +10%",
+        "Score Multiplier +25%",
+        "Score Multiplier +50%",
+    }),
+})
+
+# category -> ((threshold, name, code), ...), ascending thresholds
+MILESTONES = MappingProxyType({
+    "score": (
+        (500, "Reach 500 Points", 9000001),
+        (1000, "Reach 1000 Points", 9000002),
+        (2000, "Reach 2000 Points", 9000003),
+        (3000, "Reach 3000 Points", 9000004),
+        (4000, "Reach 4000 Points", 9000005),
+        (5000, "Reach 5000 Points", 9000006),
+        (6000, "Reach 6000 Points", 9000007),
+        (7000, "Reach 7000 Points", 9000008),
+        (8000, "Reach 8000 Points", 9000009),
+        (9000, "Reach 9000 Points", 9000010),
+        (10000, "Reach 10000 Points", 9000011),
+        (12500, "Reach 12500 Points", 9000012),
+        (15000, "Reach 15000 Points", 9000013),
+        (17500, "Reach 17500 Points", 9000014),
+        (20000, "Reach 20000 Points", 9000015),
+        (25000, "Reach 25000 Points", 9000016),
+        (30000, "Reach 30000 Points", 9000017),
+        (35000, "Reach 35000 Points", 9000018),
+        (40000, "Reach 40000 Points", 9000019),
+        (50000, "Reach 50000 Points", 9000020),
+    ),
+    "line_clear": (
+        (1, "Clear 1 Line", 9001001),
+        (3, "Clear 3 Lines", 9001002),
+        (5, "Clear 5 Lines", 9001003),
+        (10, "Clear 10 Lines", 9001004),
+        (15, "Clear 15 Lines", 9001005),
+        (20, "Clear 20 Lines", 9001006),
+        (25, "Clear 25 Lines", 9001007),
+        (30, "Clear 30 Lines", 9001008),
+        (40, "Clear 40 Lines", 9001009),
+        (50, "Clear 50 Lines", 9001010),
+        (60, "Clear 60 Lines", 9001011),
+        (75, "Clear 75 Lines", 9001012),
+        (90, "Clear 90 Lines", 9001013),
+        (100, "Clear 100 Lines", 9001014),
+        (125, "Clear 125 Lines", 9001015),
+        (150, "Clear 150 Lines", 9001016),
+        (175, "Clear 175 Lines", 9001017),
+        (200, "Clear 200 Lines", 9001018),
+        (250, "Clear 250 Lines", 9001019),
+        (300, "Clear 300 Lines", 9001020),
+        (350, "Clear 350 Lines", 9001021),
+        (400, "Clear 400 Lines", 9001022),
+        (450, "Clear 450 Lines", 9001023),
+        (500, "Clear 500 Lines", 9001024),
+        (600, "Clear 600 Lines", 9001025),
+        (700, "Clear 700 Lines", 9001026),
+        (800, "Clear 800 Lines", 9001027),
+        (900, "Clear 900 Lines", 9001028),
+        (1000, "Clear 1000 Lines", 9001029),
+        (1250, "Clear 1250 Lines", 9001030),
+    ),
+    "box_clear": (
+        (1, "Clear 1 Box", 9002001),
+        (3, "Clear 3 Boxes", 9002002),
+        (5, "Clear 5 Boxes", 9002003),
+        (10, "Clear 10 Boxes", 9002004),
+        (15, "Clear 15 Boxes", 9002005),
+        (20, "Clear 20 Boxes", 9002006),
+        (25, "Clear 25 Boxes", 9002007),
+        (30, "Clear 30 Boxes", 9002008),
+        (40, "Clear 40 Boxes", 9002009),
+        (50, "Clear 50 Boxes", 9002010),
+        (60, "Clear 60 Boxes", 9002011),
+        (75, "Clear 75 Boxes", 9002012),
+        (90, "Clear 90 Boxes", 9002013),
+        (100, "Clear 100 Boxes", 9002014),
+        (125, "Clear 125 Boxes", 9002015),
+        (150, "Clear 150 Boxes", 9002016),
+        (175, "Clear 175 Boxes", 9002017),
+        (200, "Clear 200 Boxes", 9002018),
+        (250, "Clear 250 Boxes", 9002019),
+        (300, "Clear 300 Boxes", 9002020),
+    ),
+    "piece": (
+        (10, "Place 10 Pieces", 9004001),
+        (25, "Place 25 Pieces", 9004002),
+        (50, "Place 50 Pieces", 9004003),
+        (75, "Place 75 Pieces", 9004004),
+        (100, "Place 100 Pieces", 9004005),
+        (150, "Place 150 Pieces", 9004006),
+        (200, "Place 200 Pieces", 9004007),
+        (250, "Place 250 Pieces", 9004008),
+        (300, "Place 300 Pieces", 9004009),
+        (400, "Place 400 Pieces", 9004010),
+        (500, "Place 500 Pieces", 9004011),
+        (600, "Place 600 Pieces", 9004012),
+        (700, "Place 700 Pieces", 9004013),
+        (800, "Place 800 Pieces", 9004014),
+        (900, "Place 900 Pieces", 9004015),
+        (1000, "Place 1000 Pieces", 9004016),
+        (1250, "Place 1250 Pieces", 9004017),
+        (1500, "Place 1500 Pieces", 9004018),
+        (1750, "Place 1750 Pieces", 9004019),
+        (2000, "Place 2000 Pieces", 9004020),
+        (2500, "Place 2500 Pieces", 9004021),
+        (3000, "Place 3000 Pieces", 9004022),
+        (3500, "Place 3500 Pieces", 9004023),
+        (4000, "Place 4000 Pieces", 9004024),
+        (5000, "Place 5000 Pieces", 9004025),
+    ),
+    "gem": (
+        (1, "Collect Gem #1", 9005001),
+        (2, "Collect Gem #2", 9005002),
+        (3, "Collect Gem #3", 9005003),
+        (4, "Collect Gem #4", 9005004),
+        (5, "Collect Gem #5", 9005005),
+        (6, "Collect Gem #6", 9005006),
+        (7, "Collect Gem #7", 9005007),
+        (8, "Collect Gem #8", 9005008),
+        (9, "Collect Gem #9", 9005009),
+        (10, "Collect Gem #10", 9005010),
+        (11, "Collect Gem #11", 9005011),
+        (12, "Collect Gem #12", 9005012),
+        (13, "Collect Gem #13", 9005013),
+        (14, "Collect Gem #14", 9005014),
+        (15, "Collect Gem #15", 9005015),
+        (16, "Collect Gem #16", 9005016),
+        (17, "Collect Gem #17", 9005017),
+        (18, "Collect Gem #18", 9005018),
+        (19, "Collect Gem #19", 9005019),
+        (20, "Collect Gem #20", 9005020),
+        (21, "Collect Gem #21", 9005021),
+        (22, "Collect Gem #22", 9005022),
+        (23, "Collect Gem #23", 9005023),
+        (24, "Collect Gem #24", 9005024),
+        (25, "Collect Gem #25", 9005025),
+        (26, "Collect Gem #26", 9005026),
+        (27, "Collect Gem #27", 9005027),
+        (28, "Collect Gem #28", 9005028),
+        (29, "Collect Gem #29", 9005029),
+        (30, "Collect Gem #30", 9005030),
+        (31, "Collect Gem #31", 9005031),
+        (32, "Collect Gem #32", 9005032),
+        (33, "Collect Gem #33", 9005033),
+        (34, "Collect Gem #34", 9005034),
+        (35, "Collect Gem #35", 9005035),
+        (36, "Collect Gem #36", 9005036),
+        (37, "Collect Gem #37", 9005037),
+        (38, "Collect Gem #38", 9005038),
+        (39, "Collect Gem #39", 9005039),
+        (40, "Collect Gem #40", 9005040),
+        (41, "Collect Gem #41", 9005041),
+        (42, "Collect Gem #42", 9005042),
+        (43, "Collect Gem #43", 9005043),
+        (44, "Collect Gem #44", 9005044),
+        (45, "Collect Gem #45", 9005045),
+        (46, "Collect Gem #46", 9005046),
+        (47, "Collect Gem #47", 9005047),
+        (48, "Collect Gem #48", 9005048),
+        (49, "Collect Gem #49", 9005049),
+        (50, "Collect Gem #50", 9005050),
+        (51, "Collect Gem #51", 9005051),
+        (52, "Collect Gem #52", 9005052),
+        (53, "Collect Gem #53", 9005053),
+        (54, "Collect Gem #54", 9005054),
+        (55, "Collect Gem #55", 9005055),
+        (56, "Collect Gem #56", 9005056),
+        (57, "Collect Gem #57", 9005057),
+        (58, "Collect Gem #58", 9005058),
+        (59, "Collect Gem #59", 9005059),
+        (60, "Collect Gem #60", 9005060),
+        (61, "Collect Gem #61", 9005061),
+        (62, "Collect Gem #62", 9005062),
+        (63, "Collect Gem #63", 9005063),
+        (64, "Collect Gem #64", 9005064),
+        (65, "Collect Gem #65", 9005065),
+        (66, "Collect Gem #66", 9005066),
+        (67, "Collect Gem #67", 9005067),
+        (68, "Collect Gem #68", 9005068),
+        (69, "Collect Gem #69", 9005069),
+        (70, "Collect Gem #70", 9005070),
+        (71, "Collect Gem #71", 9005071),
+        (72, "Collect Gem #72", 9005072),
+        (73, "Collect Gem #73", 9005073),
+        (74, "Collect Gem #74", 9005074),
+        (75, "Collect Gem #75", 9005075),
+        (76, "Collect Gem #76", 9005076),
+        (77, "Collect Gem #77", 9005077),
+        (78, "Collect Gem #78", 9005078),
+        (79, "Collect Gem #79", 9005079),
+        (80, "Collect Gem #80", 9005080),
+        (81, "Collect Gem #81", 9005081),
+        (82, "Collect Gem #82", 9005082),
+        (83, "Collect Gem #83", 9005083),
+        (84, "Collect Gem #84", 9005084),
+        (85, "Collect Gem #85", 9005085),
+        (86, "Collect Gem #86", 9005086),
+        (87, "Collect Gem #87", 9005087),
+        (88, "Collect Gem #88", 9005088),
+        (89, "Collect Gem #89", 9005089),
+        (90, "Collect Gem #90", 9005090),
+        (91, "Collect Gem #91", 9005091),
+        (92, "Collect Gem #92", 9005092),
+        (93, "Collect Gem #93", 9005093),
+        (94, "Collect Gem #94", 9005094),
+        (95, "Collect Gem #95", 9005095),
+        (96, "Collect Gem #96", 9005096),
+        (97, "Collect Gem #97", 9005097),
+        (98, "Collect Gem #98", 9005098),
+        (99, "Collect Gem #99", 9005099),
+        (100, "Collect Gem #100", 9005100),
+    ),
+})
+
+LOCATION_NAME_TO_ID = MappingProxyType({
+    name: code for rows in MILESTONES.values() for _, name, code in rows
+})
@@ -0,0 +1,98 @@
+"""
+Blockupelago Difficulty
+
+The milestone difficulty table: for every unlock state, how many of the
+score, line, box and piece milestones a strong player reasonably reaches in
+one game. Built offline by apworld/build_difficulty.py (build_apworld.py
+will not package a missing or stale table) and shipped as difficulty.bin
+next to this module. It is read with pkgutil.get_data, so it loads the same
+from a folder or from inside the .apworld, on first use, once for every
+player.
+
+File layout (little-endian):
+
+    header  magic, format version, milestone hash, the four dimensions
+    counts  uint8[extra shapes][hand sizes][permanents][categories]: how
+            many of the category's milestones (in Locations.milestone_index
+            order) are in logic for that unlock state; N extra shapes are
+            measured with the N hardest pieces
+
+The table is monotone along every axis. Milestones a player never gets to,
+even with every unlock, wait for every counted item (see
+Rules.milestone_gate).
+"""
+
+import struct
+from typing import Optional, Sequence, Tuple
+from .Data import MILESTONES, PERMANENT_ITEMS, PIECE_ITEMS, SLOT_ITEMS, STARTER_PIECES
+from .Options import StartingPieceSlots
+
+# Bump when the layout or how the counts are derived changes
+TABLE_VERSION = 4
+MAGIC = b"BKDIFF"
+RESOURCE = "difficulty.bin"
+
+# Gem milestones depend on where gems spawn, not on unlocks, and are never gated
+CATEGORIES = ("score", "line_clear", "box_clear", "piece")
+SHAPE_COUNTS = len(PIECE_ITEMS) - len(STARTER_PIECES) + 1
+HAND_SIZES = tuple(range(StartingPieceSlots.range_start, StartingPieceSlots.range_end + len(SLOT_ITEMS) + 1))
+PERMANENT_COUNTS = len(PERMANENT_ITEMS) + 1
+
+HEADER = struct.Struct("<6sH16sBBBB")
+
+
+def milestone_hash() -> bytes:
+    """Identifies the milestones and dimensions a table was built for."""
+    import hashlib
+
+    source = repr((TABLE_VERSION, CATEGORIES, SHAPE_COUNTS, HAND_SIZES, PERMANENT_COUNTS,
+                   [[threshold for threshold, _, _ in MILESTONES[category]] for category in CATEGORIES]))
+    return hashlib.sha256(source.encode("utf-8")).digest()[:16]
+
+
+def pack_table(counts: Sequence[int]) -> bytes:
+    """Serialize counts laid out as described in the module docstring."""
+    header = HEADER.pack(MAGIC, TABLE_VERSION, milestone_hash(), SHAPE_COUNTS, len(HAND_SIZES), PERMANENT_COUNTS,
+                         len(CATEGORIES))
+    return header + bytes(counts)
+
+
+class DifficultyTable:
+    """Read-only view of a packed difficulty table."""
+
+    def __init__(self, data: bytes):
+        magic, version, digest, shapes, hands, permanents, categories = HEADER.unpack_from(data)
+        if (magic != MAGIC or version != TABLE_VERSION or digest != milestone_hash()
+                or (shapes, hands, permanents, categories) != (SHAPE_COUNTS, len(HAND_SIZES), PERMANENT_COUNTS,
+                                                               len(CATEGORIES))
+                or len(data) != HEADER.size + shapes * hands * permanents * categories):
+            raise ValueError(f"{RESOURCE} is stale or not a difficulty table; rebuild it with build_difficulty.py")
+        self.counts = data[HEADER.size:]
+
+    def offset(self, shapes: int, hand_size: int, permanents: int) -> int:
+        """Index of an unlock state's first category count; out-of-range values are clamped."""
+        shapes = min(max(shapes, 0), SHAPE_COUNTS - 1)
+        hand = min(max(hand_size, HAND_SIZES[0]), HAND_SIZES[-1]) - HAND_SIZES[0]
+        permanents = min(max(permanents, 0), PERMANENT_COUNTS - 1)
+        return ((shapes * len(HAND_SIZES) + hand) * PERMANENT_COUNTS + permanents) * len(CATEGORIES)
+
+    def reachable(self, shapes: int, hand_size: int, permanents: int) -> Tuple[int, ...]:
+        """Milestones in logic per category, in CATEGORIES order."""
+        start = self.offset(shapes, hand_size, permanents)
+        return tuple(self.counts[start:start + len(CATEGORIES)])
+
+
+_table: Optional[DifficultyTable] = None
+
+
+def get_table() -> DifficultyTable:
+    """The shipped table, loaded on first use."""
+    global _table
+    if _table is None:
+        import pkgutil
+
+        data = pkgutil.get_data(__package__, RESOURCE)
+        if data is None:
+            raise FileNotFoundError(f"{RESOURCE} is missing; build it with build_difficulty.py")
+        _table = DifficultyTable(data)
+    return _table
@@ -0,0 +1,179 @@
+"""
+Blockupelago Instrumentation
+
+Opt-in profiling of generation. Set BLOCKUPELAGO_PROFILE to a directory and
+every BlockudokuWorld stage (and the import of Data, Items and Locations) is
+timed per player, and each batched stage_* hook once per generation. While a
+world's batched_stages is on, the per-player create_regions, create_items
+and set_rules do nothing and are not recorded, and the stage_* record counts
+the players it covered; while it is off, the stage_* hooks are skipped. Each
+record holds wall time, the net number of memory blocks allocated
+(sys.getallocatedblocks, a cheap proxy for objects created) and the
+tracemalloc peak. Records go to one JSON-lines file per generation in that
+directory; summarize them with apworld/summarize_profile.py.
+
+The tracemalloc peak is a separate opt-in: also set
+BLOCKUPELAGO_PROFILE_TRACEMALLOC=1. Tracing is then started around each
+measured stage or import and stopped afterwards, so the rest of generation
+(other worlds included) runs untraced; the measured code itself slows down
+noticeably, so its wall times read high.
+
+When BLOCKUPELAGO_PROFILE is unset nothing is wrapped: instrument() returns
+the class untouched and timed_import() is a shared no-op context manager.
+The modules only a profile needs (json, weakref, tracemalloc) are not even
+imported then.
+"""
+
+import os
+import sys
+import time
+from functools import wraps
+from itertools import count
+from typing import Any, Dict, List, Optional
+
+PROFILE_DIR = os.environ.get("BLOCKUPELAGO_PROFILE") or None
+TRACE_MEMORY = bool(PROFILE_DIR) and os.environ.get("BLOCKUPELAGO_PROFILE_TRACEMALLOC") == "1"
+
+STAGES = ("create_regions", "create_items", "set_rules", "fill_slot_data")
+BATCH_STAGES = ("stage_create_regions", "stage_create_items", "stage_set_rules")
+
+# Import records are written into the first generation's file
+_pending_imports: List[Dict[str, Any]] = []
+# Open profile per multiworld; a file is closed when its multiworld is collected
+_files: Dict[Any, Any] = {}
+_file_numbers = count()
+
+if PROFILE_DIR:
+    import json
+    from weakref import WeakKeyDictionary
+
+    _files = WeakKeyDictionary()
+if TRACE_MEMORY:
+    import tracemalloc
+
+
+class _NoOp:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+_NO_OP = _NoOp()
+
+
+class _measure:
+    """Context manager filling record with the wall time, blocks and (when traced) peak of its body."""
+
+    def __init__(self, record: Dict[str, Any]):
+        self.record = record
+
+    def __enter__(self) -> None:
+        # Only trace while measuring; a caller that is already tracing keeps its session
+        self.started = TRACE_MEMORY and not tracemalloc.is_tracing()
+        if self.started:
+            tracemalloc.start()
+        if TRACE_MEMORY:
+            tracemalloc.reset_peak()
+            self.traced_before, _ = tracemalloc.get_traced_memory()
+        self.blocks_before = sys.getallocatedblocks()
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> bool:
+        record = self.record
+        record["wall_ms"] = round((time.perf_counter() - self.start) * 1e3, 4)
+        record["blocks"] = sys.getallocatedblocks() - self.blocks_before
+        if TRACE_MEMORY:
+            _, peak = tracemalloc.get_traced_memory()
+            record["peak_kib"] = round((peak - self.traced_before) / 1024, 1)
+        if self.started:
+            tracemalloc.stop()
+        return False
+
+
+def timed_import(module: str):
+    """Context manager around a module import; a no-op unless profiling is on."""
+    if not PROFILE_DIR:
+        return _NO_OP
+    record = {"event": "import", "module": module}
+    _pending_imports.append(record)
+    return _measure(record)
+
+
+def _output(multiworld: Any) -> Any:
+    output = _files.get(multiworld)
+    if output is None:
+        seed = getattr(multiworld, "seed", None)
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = os.path.join(PROFILE_DIR, f"blockupelago-{seed if seed is not None else 'unseeded'}-{os.getpid()}"
+                                         f"-{next(_file_numbers)}.jsonl")
+        output = _files[multiworld] = open(path, "w", encoding="utf-8", buffering=1)
+        players = getattr(multiworld, "player_ids", ())
+        game_players = [player for player in players if multiworld.worlds[player].game == "Blockupelago"]
+        _write(output, {"event": "generation", "seed": seed, "players": len(players),
+                        "blockupelago_players": len(game_players), "tracemalloc": TRACE_MEMORY,
+                        "python": sys.version.split()[0]})
+        for record in _pending_imports:
+            _write(output, record)
+        _pending_imports.clear()
+    return output
+
+
+def _write(output: Any, record: Dict[str, Any]) -> None:
+    output.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def _wrap_stage(stage: str, method):
+    batched = f"stage_{stage}" in BATCH_STAGES
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if batched and getattr(self, "batched_stages", False):
+            return method(self, *args, **kwargs)
+        record: Dict[str, Any] = {"event": "stage", "stage": stage, "player": self.player}
+        with _measure(record):
+            result = method(self, *args, **kwargs)
+        _write(_output(self.multiworld), record)
+        return result
+
+    return wrapper
+
+
+def _wrap_batch_stage(stage: str, method):
+    @wraps(method)
+    def wrapper(cls, multiworld, *args, **kwargs):
+        if not getattr(cls, "batched_stages", True):
+            return method(cls, multiworld, *args, **kwargs)
+        record: Dict[str, Any] = {"event": "stage", "stage": stage,
+                                  "players": len(multiworld.get_game_players(cls.game))}
+        with _measure(record):
+            result = method(cls, multiworld, *args, **kwargs)
+        _write(_output(multiworld), record)
+        return result
+
+    return classmethod(wrapper)
+
+
+def instrument(world_type: type) -> type:
+    """Class decorator: wrap the generation stages of a world when profiling is on."""
+    if not PROFILE_DIR:
+        return world_type
+    for stage in STAGES:
+        setattr(world_type, stage, _wrap_stage(stage, getattr(world_type, stage)))
+    for stage in BATCH_STAGES:
+        hook = vars(world_type).get(stage)
+        if isinstance(hook, classmethod):
+            setattr(world_type, stage, _wrap_batch_stage(stage, hook.__func__))
+    return world_type
+
+
+def close(multiworld: Optional[Any] = None) -> None:
+    """Flush and close the profile of one generation, or of all of them."""
+    keys = [multiworld] if multiworld is not None else list(_files.keys())
+    for key in keys:
+        output = _files.pop(key, None)
+        if output is not None:
+            output.close()
@@ -5,8 +5,13 @@ Defines all items that can be received from Archipelago.
 Item IDs must match the client's AP_ITEMS constants.
 """
 
-from typing import Dict, NamedTuple, Optional, Set
+import sys
+from functools import lru_cache
+from typing import Dict, FrozenSet, NamedTuple, Optional, Set, Tuple
 from BaseClasses import Item, ItemClassification
+from .Data import (
+    ABILITY_ITEMS, ITEM_GROUPS, ITEMS, PERMANENT_ITEMS, PIECE_ITEMS, SLOT_ITEMS, STARTER_PIECES,
+)
 
 
 class BlockudokuItemData(NamedTuple):
@@ -16,84 +21,136 @@ class BlockudokuItemData(NamedTuple):
 
 
 class BlockudokuItem(Item):
-    """Custom item class for Blockupelago."""
-    game: str = "Blockupelago"
+    """Custom item class for Blockupelago.
 
+    Item already declares its fields as slots; the empty __slots__ keeps
+    subclass instances from growing a per-instance __dict__.
+    """
+    game: str = "Blockupelago"
+    __slots__ = ()
 
-# Item ID ranges (must match client's useArchipelagoItems.ts):
-# Piece Types:     8000001-8000019 (19 different polyomino pieces)
-# Piece Slots:     8002001-8002002 (4th and 5th piece slots)
-# Abilities:       8003001-8003006 (Rotate, Undo, Remove Block, Hold, Mirror, Shrink)
-# Score Boosts:    8004001-8004003 (multipliers)
-# Event:           None (Victory)
 
-# Starter pieces that player begins with (EXCLUDED from item pool)
-STARTER_PIECES = {"Tromino L", "Tetromino T", "Tetromino L"}
+# Item IDs are generated into Data.py by apworld/generate_data.py, which also
+# writes the matching AP_ITEMS constants in the client's useArchipelagoItems.ts.
+# NOTE: Tromino L, Tetromino T, and Tetromino L are starter pieces (STARTER_PIECES)
+# and should NOT be added to the item pool
 
+# Names are interned so every item, pool plan and lookup shares one string per name
 item_table: Dict[str, BlockudokuItemData] = {
-
-    # === Piece Types (Progression - unlock different shapes) ===
-    # NOTE: Tromino L, Tetromino T, and Tetromino L are starter pieces
-    # and should NOT be added to the item pool
-    "Single Block": BlockudokuItemData(code=8000001, classification=ItemClassification.progression),
-    "Domino I": BlockudokuItemData(code=8000002, classification=ItemClassification.progression),
-    "Tromino I": BlockudokuItemData(code=8000003, classification=ItemClassification.progression),
-    "Tromino L": BlockudokuItemData(code=8000004, classification=ItemClassification.progression),
-    "Tetromino I": BlockudokuItemData(code=8000005, classification=ItemClassification.progression),
-    "Tetromino O": BlockudokuItemData(code=8000006, classification=ItemClassification.progression),
-    "Tetromino T": BlockudokuItemData(code=8000007, classification=ItemClassification.progression),
-    "Tetromino L": BlockudokuItemData(code=8000008, classification=ItemClassification.progression),
-    "Tetromino S": BlockudokuItemData(code=8000009, classification=ItemClassification.progression),
-    "Pentomino I": BlockudokuItemData(code=8000010, classification=ItemClassification.progression),
-    "Pentomino L": BlockudokuItemData(code=8000011, classification=ItemClassification.progression),
-    "Pentomino P": BlockudokuItemData(code=8000012, classification=ItemClassification.progression),
-    "Pentomino U": BlockudokuItemData(code=8000013, classification=ItemClassification.progression),
-    "Pentomino W": BlockudokuItemData(code=8000014, classification=ItemClassification.progression),
-    "Pentomino Plus": BlockudokuItemData(code=8000015, classification=ItemClassification.progression),
-    "3x3 Corner": BlockudokuItemData(code=8000016, classification=ItemClassification.progression),
-    "3x3 T-Shape": BlockudokuItemData(code=8000017, classification=ItemClassification.progression),
-    "3x3 Cross": BlockudokuItemData(code=8000018, classification=ItemClassification.progression),
-
-    # === Piece Slots (Rare Permanent) ===
-    "4th Piece Slot": BlockudokuItemData(code=8002001, classification=ItemClassification.progression),
-    "5th Piece Slot": BlockudokuItemData(code=8002002, classification=ItemClassification.progression),
-
-    # === Abilities (Useful) ===
-    "Rotate Ability": BlockudokuItemData(code=8003001, classification=ItemClassification.useful),
-    "Undo Ability": BlockudokuItemData(code=8003002, classification=ItemClassification.useful),
-    "Remove Block": BlockudokuItemData(code=8003003, classification=ItemClassification.useful),
-    "Hold Ability": BlockudokuItemData(code=8003004, classification=ItemClassification.useful),
-    "Mirror Ability": BlockudokuItemData(code=8003005, classification=ItemClassification.useful),
-    "Shrink Ability": BlockudokuItemData(code=8003006, classification=ItemClassification.useful),
-
-    # === Permanent Abilities (Rare Permanent) ===
-    "Permanent Free Rotate": BlockudokuItemData(code=8003101, classification=ItemClassification.progression),
-    "Permanent Free Mirror": BlockudokuItemData(code=8003102, classification=ItemClassification.progression),
-    "Permanent Free Hold": BlockudokuItemData(code=8003103, classification=ItemClassification.progression),
-
-    # === Score Multipliers (Filler/Useful) ===
-    "Score Multiplier +10%": BlockudokuItemData(code=8004001, classification=ItemClassification.filler),
-    "Score Multiplier +25%": BlockudokuItemData(code=8004002, classification=ItemClassification.useful),
-    "Score Multiplier +50%": BlockudokuItemData(code=8004003, classification=ItemClassification.useful),
-
-    # === Event Items (no code, used for logic) ===
-    "Victory": BlockudokuItemData(code=None, classification=ItemClassification.progression),
+    sys.intern(name): BlockudokuItemData(code=code, classification=classification)
+    for name, code, classification, _ in ITEMS
 }
 
+# === Event Items (no code, used for logic) ===
+item_table["Victory"] = BlockudokuItemData(code=None, classification=ItemClassification.progression)
+
+
+def item_data_lookup(name: str) -> Tuple[str, BlockudokuItemData]:
+    """Return the canonical (interned) name and the shared data entry for an item."""
+    data = item_table[name]
+    return sys.intern(name), data
+
+
+# Items generate_data.py marks as progression; which of them really are depends on
+# the rules (see classify)
+PROGRESSION_CANDIDATES = frozenset(name for name, _, classification, _ in ITEMS
+                                   if classification & ItemClassification.progression)
+
+
+@lru_cache(maxsize=None)
+def classify(name: str, logic_items: Optional[FrozenSet[str]],
+             gates_locations: bool = False) -> Tuple[str, BlockudokuItemData]:
+    """
+    item_data_lookup, with the classification fitted to the world's rules.
+
+    A progression candidate no access rule counts (not in logic_items) can
+    never unlock anything, so it is only useful; with valid options that is
+    just the starter pieces, which the pool leaves out but create_item can
+    still make (start inventory, plando). If the counted ones only
+    gate this world's Goal, pulling them into earlier spheres opens no one's
+    locations and they skip progression balancing. With gates_locations
+    (milestone_logic on) they also gate milestone locations, which can hold
+    anyone's progression, so they stay plain progression. logic_items None
+    keeps the generated classification.
+    """
+    name, data = item_data_lookup(name)
+    if logic_items is None or name not in PROGRESSION_CANDIDATES:
+        return name, data
+    if name not in logic_items:
+        classification = ItemClassification.useful
+    elif gates_locations:
+        classification = ItemClassification.progression
+    else:
+        classification = ItemClassification.progression_skip_balancing
+    return name, data._replace(classification=classification)
+
 
 # Item groups for hint system
-item_groups: Dict[str, Set[str]] = {
-    "Progression": {
-        "Single Block", "Domino I", "Tromino I", "Tromino L",
-        "Tetromino I", "Tetromino O", "Tetromino T", "Tetromino L", "Tetromino S",
-        "Pentomino I", "Pentomino L", "Pentomino P", "Pentomino U", "Pentomino W", "Pentomino Plus",
-        "3x3 Corner", "3x3 T-Shape", "3x3 Cross",
-    },
-    "Abilities": {
-        "Rotate Ability", "Undo Ability", "Remove Block", "Hold Ability", "Mirror Ability", "Shrink Ability",
-        "4th Piece Slot", "5th Piece Slot",
-    },
-    "Score Boosts": {
-        "Score Multiplier +10%", "Score Multiplier +25%", "Score Multiplier +50%",
-    },
-}
+item_groups: Dict[str, Set[str]] = {group: set(names) for group, names in ITEM_GROUPS.items()}
+
+# The one filler item; excluded locations only take filler, so the pool reserves
+# one per excluded location
+filler_item = next(name for name, _, classification, _ in ITEMS if classification == ItemClassification.filler)
+
+# Items added once each, in pool order
+piece_type_items = PIECE_ITEMS
+rare_items = SLOT_ITEMS + PERMANENT_ITEMS
+ability_items = ABILITY_ITEMS
+
+
+class PoolEntry(NamedTuple):
+    """One item of a pool plan: the interned item name and its shared item_table entry."""
+    name: str
+    data: BlockudokuItemData
+
+
+@lru_cache(maxsize=None)
+def build_pool_plan(location_count: int, logic_items: Optional[FrozenSet[str]] = None,
+                    excluded_count: int = 0, gates_locations: bool = False) -> Tuple[PoolEntry, ...]:
+    """
+    Compute the ordered item pool for a world with location_count filled locations,
+    excluded_count of them excluded, classified against logic_items and
+    gates_locations (see classify).
+
+    Cached per key, so every player sharing the same resolved options reuses
+    one plan and only has to construct the items.
+    """
+    names = []
+
+    # --- 1. Add all rare/progression items (once each) ---
+    shape_pool = [p for p in piece_type_items if p not in STARTER_PIECES]
+    names.extend(shape_pool)
+    names.extend(rare_items)
+
+    # --- 2. One filler item per excluded location, since Fill puts nothing else there ---
+    reserved = min(excluded_count, location_count - len(names))
+    names.extend([filler_item] * reserved)
+
+    # --- 3. Fill remaining locations with ability uses and multipliers (proportional) ---
+    filler_count = location_count - len(names)
+    # 2:1 ratio (2/3 ability uses, 1/3 multipliers)
+    n_abilities = (filler_count * 2) // 3
+    n_mults = filler_count - n_abilities
+
+    for i in range(n_abilities):
+        names.append(ability_items[i % len(ability_items)])
+
+    for i in range(n_mults):
+        # Use a distribution: 50% +10%, 30% +25%, 20% +50%
+        if i % 10 < 5:
+            names.append("Score Multiplier +10%")
+        elif i % 10 < 8:
+            names.append("Score Multiplier +25%")
+        else:
+            names.append("Score Multiplier +50%")
+
+    return tuple(PoolEntry(*classify(name, logic_items, gates_locations)) for name in names)
+
+
+@lru_cache(maxsize=None)
+def pool_columns(location_count: int, logic_items: Optional[FrozenSet[str]] = None,
+                 excluded_count: int = 0, gates_locations: bool = False) -> Tuple[tuple, tuple, tuple]:
+    """build_pool_plan split into names, classifications and codes, for building items with map()."""
+    plan = build_pool_plan(location_count, logic_items, excluded_count, gates_locations)
+    return (tuple(name for name, _ in plan), tuple(data.classification for _, data in plan),
+            tuple(data.code for _, data in plan))
@@ -5,8 +5,17 @@ Defines all locations (checks) that can be sent to Archipelago.
 Location IDs must match the client's AP_LOCATIONS constants.
 """
 
-from typing import Dict, NamedTuple, Optional
+import sys
+from bisect import bisect_left
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, NamedTuple, Optional, Tuple
 from BaseClasses import Location
+from .Data import LOCATION_NAME_TO_ID, MILESTONES
+from .Options import MilestonePruning
+
+if TYPE_CHECKING:
+    from .Options import BlockudokuOptions
 
 
 class BlockudokuLocationData(NamedTuple):
@@ -16,73 +25,137 @@ class BlockudokuLocationData(NamedTuple):
 
 
 class BlockudokuLocation(Location):
-    """Custom location class for Blockupelago."""
+    """Custom location class for Blockupelago.
+
+    Unlike Item, Location has no __slots__, so every instance keeps a __dict__
+    regardless of what is declared here; adding slots on top only makes each
+    object larger (see benchmarks/bench_object_memory.py).
+    """
     game: str = "Blockupelago"
 
 
-# Location ID ranges (must match client's useArchipelagoItems.ts):
-# Score Milestones: 9000001-9000020 (20 milestones)
-# Line Clears: 9001001-9001030 (30 milestones)
-# Box Clears: 9002001-9002020 (20 milestones)
-# Pieces Placed: 9004001-9004025 (25 milestones)
-# Individual Gems: 9005001-9005100 (100 individual gem checks)
-
-location_table: Dict[str, BlockudokuLocationData] = {}
-
-# Generate Score Milestone locations (every 500 points up to 10000)
-score_milestones = [500, 1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000, 9000,
-                    10000, 12500, 15000, 17500, 20000, 25000, 30000, 35000, 40000, 50000]
-for i, score in enumerate(score_milestones, start=1):
-    location_table[f"Reach {score} Points"] = BlockudokuLocationData(
-        code=9000000 + i,
-        region="Game Area"
-    )
-
-# Generate Line Clear locations (rows/columns cleared)
-line_clear_milestones = [1, 3, 5, 10, 15, 20, 25, 30, 40, 50, 60, 75, 90, 100,
-                        125, 150, 175, 200, 250, 300, 350, 400, 450, 500, 600, 700, 800, 900, 1000, 1250]
-for i, clears in enumerate(line_clear_milestones, start=1):
-    location_table[f"Clear {clears} Line{'s' if clears > 1 else ''}"] = BlockudokuLocationData(
-        code=9001000 + i,
-        region="Game Area"
-    )
-
-# Generate Box Clear locations (3x3 boxes cleared)
-box_clear_milestones = [1, 3, 5, 10, 15, 20, 25, 30, 40, 50, 60, 75, 90, 100, 125, 150, 175, 200, 250, 300]
-for i, clears in enumerate(box_clear_milestones, start=1):
-    location_table[f"Clear {clears} Box{'es' if clears > 1 else ''}"] = BlockudokuLocationData(
-        code=9002000 + i,
-        region="Game Area"
-    )
-
-# Generate Pieces Placed locations
-piece_milestones = [10, 25, 50, 75, 100, 150, 200, 250, 300, 400, 500, 600, 700, 800, 900,
-                   1000, 1250, 1500, 1750, 2000, 2500, 3000, 3500, 4000, 5000]
-for i, pieces in enumerate(piece_milestones, start=1):
-    location_table[f"Place {pieces} Piece{'s' if pieces > 1 else ''}"] = BlockudokuLocationData(
-        code=9004000 + i,
-        region="Game Area"
-    )
-
-# Generate Individual Gem Collection locations (each gem is a check, up to 100)
-for i in range(1, 101):
-    location_table[f"Collect Gem #{i}"] = BlockudokuLocationData(
-        code=9005000 + i,
-        region="Game Area"
-    )
+# Location IDs are generated into Data.py by apworld/generate_data.py, which also
+# writes the matching AP_LOCATIONS constants in the client's useArchipelagoItems.ts.
+
+
+class Milestone(NamedTuple):
+    """A single milestone check: the counter value that triggers it, its name and ID."""
+    threshold: int
+    name: str
+    code: int
+
+
+# Milestones per category, in ascending threshold order
+milestone_index: Mapping[str, Tuple[Milestone, ...]] = MappingProxyType({
+    category: tuple(map(Milestone._make, rows)) for category, rows in MILESTONES.items()
+})
+
+_milestone_thresholds: Dict[str, Tuple[int, ...]] = {
+    category: tuple(milestone.threshold for milestone in milestones)
+    for category, milestones in milestone_index.items()
+}
+
+score_milestones = _milestone_thresholds["score"]
+line_clear_milestones = _milestone_thresholds["line_clear"]
+box_clear_milestones = _milestone_thresholds["box_clear"]
+piece_milestones = _milestone_thresholds["piece"]
+gem_milestones = _milestone_thresholds["gem"]
+
+# Every location shares one interned region name
+GAME_AREA = sys.intern("Game Area")
+
+location_table: Dict[str, BlockudokuLocationData] = {
+    sys.intern(name): BlockudokuLocationData(code=code, region=GAME_AREA)
+    for name, code in LOCATION_NAME_TO_ID.items()
+}
 
 # Add Victory event (no code)
 location_table["Goal"] = BlockudokuLocationData(
     code=None,
-    region="Game Area"
+    region=GAME_AREA
 )
 
 
-def get_locations_by_region() -> Dict[str, list]:
+def first_milestone_at_least(category: str, value: int) -> Optional[Milestone]:
+    """Find the lowest milestone in a category whose threshold is >= value."""
+    thresholds = _milestone_thresholds[category]
+    index = bisect_left(thresholds, value)
+    if index == len(thresholds):
+        return None
+    return milestone_index[category][index]
+
+
+@lru_cache(maxsize=None)
+def get_locations_by_region() -> Mapping[str, Tuple[str, ...]]:
     """Group locations by their region."""
-    regions: Dict[str, list] = {}
+    regions: Dict[str, List[str]] = {}
     for name, data in location_table.items():
-        if data.region not in regions:
-            regions[data.region] = []
-        regions[data.region].append(name)
-    return regions
+        regions.setdefault(data.region, []).append(name)
+    return MappingProxyType({region: tuple(names) for region, names in regions.items()})
+
+
+# Counts a game reliably reaches per 1000 points scored, used to place the goal cutoff.
+# Measured with check_goal_feasibility.py's beam-search player at its defaults (8 games
+# per starting slot count, beam 8): the rate all but the slowest tenth of games beat,
+# the lower of the starter-pieces run and the --all-pieces run (lines 8 and 9, boxes
+# 11 and 17, pieces 49 and 62). Long games score more per clear, so they set the rates.
+PER_1000_POINTS: Mapping[str, int] = MappingProxyType({"line_clear": 8, "box_clear": 11, "piece": 49})
+
+
+class PlannedLocation(NamedTuple):
+    """A location to create for a player, and whether it is past the goal cutoff."""
+    name: str
+    code: int
+    past_goal: bool
+
+
+def milestone_cutoffs(goal_score: int, gem_count: int) -> Mapping[str, int]:
+    """Highest threshold per category that is still in reach of the goal."""
+    goal_milestone = first_milestone_at_least("score", goal_score)
+    cutoffs = {
+        "score": goal_milestone.threshold if goal_milestone else score_milestones[-1],
+        "gem": gem_count,
+    }
+    for category, rate in PER_1000_POINTS.items():
+        # Always keep the first milestone of a category
+        cutoffs[category] = max(goal_score * rate // 1000, _milestone_thresholds[category][0])
+    return MappingProxyType(cutoffs)
+
+
+@lru_cache(maxsize=None)
+def plan_locations(pruning: int, goal_score: int, gem_count: int) -> Tuple[PlannedLocation, ...]:
+    """
+    The located checks a player gets, in location_table order.
+
+    Cached per option combination, so every slot with the same options shares
+    one plan.
+    """
+    if pruning == MilestonePruning.option_off:
+        return tuple(PlannedLocation(milestone.name, milestone.code, False)
+                     for milestones in milestone_index.values() for milestone in milestones)
+    cutoffs = milestone_cutoffs(goal_score, gem_count)
+    plan = []
+    for category, milestones in milestone_index.items():
+        for milestone in milestones:
+            past_goal = milestone.threshold > cutoffs[category]
+            if past_goal and pruning == MilestonePruning.option_prune:
+                break
+            plan.append(PlannedLocation(milestone.name, milestone.code, past_goal))
+    return tuple(plan)
+
+
+def plan_for_options(options: "BlockudokuOptions") -> Tuple[PlannedLocation, ...]:
+    """plan_locations for a player's resolved options."""
+    return plan_locations(options.milestone_pruning.value, options.goal_score.value, options.gem_checks.value)
+
+
+@lru_cache(maxsize=None)
+def plan_sizes(pruning: int, goal_score: int, gem_count: int) -> Tuple[int, int]:
+    """(located checks, how many of them are excluded) of plan_locations."""
+    plan = plan_locations(pruning, goal_score, gem_count)
+    return len(plan), sum(row.past_goal for row in plan)
+
+
+def plan_sizes_for_options(options: "BlockudokuOptions") -> Tuple[int, int]:
+    """plan_sizes for a player's resolved options."""
+    return plan_sizes(options.milestone_pruning.value, options.goal_score.value, options.gem_checks.value)
@@ -87,13 +87,44 @@ class ScoreMultipliersInPool(Range):
 
 
 class GoalScore(Range):
-    """Total score required to complete the goal."""
+    """Total score required to complete the goal.
+    The goal is in logic once your unlocks make this score reasonable to reach in one game."""
     display_name = "Goal Score"
     range_start = 10000
     range_end = 100000
     default = 30000
 
 
+class MilestonePruning(Choice):
+    """Trim the milestones a game with this goal will not get to.
+    Off: every milestone is a location.
+    Prune: milestones past the goal are not created, and the item pool shrinks to match.
+    Exclude: milestones past the goal are kept but excluded, so they only hold filler;
+    the item pool gets a Score Multiplier +10% for each of them.
+    The goal is the Goal Score plus the line, box and piece counts a game usually reaches on the way there."""
+    display_name = "Milestone Pruning"
+    option_off = 0
+    option_prune = 1
+    option_exclude = 2
+    default = 0
+
+
+class GemChecks(Range):
+    """Number of Collect Gem milestones kept when Milestone Pruning is on.
+    The rest are pruned or excluded with the other milestones past the goal."""
+    display_name = "Gem Checks"
+    range_start = 0
+    range_end = 100
+    default = 100
+
+
+class MilestoneLogic(Toggle):
+    """Put score, line, box and piece milestones in logic only once your unlocks
+    (extra pieces, piece slots, permanent abilities) make them reasonable to reach in one game.
+    Gem milestones are always in logic."""
+    display_name = "Milestone Logic"
+
+
 class DeathLink(Toggle):
     """When you game over, everyone with DeathLink enabled also game overs.
     When you receive a DeathLink, your current game ends."""
@@ -117,4 +148,7 @@ class BlockudokuOptions(PerGameCommonOptions):
     shrink_uses_in_pool: ShrinkUsesInPool
     score_multipliers_in_pool: ScoreMultipliersInPool
     goal_score: GoalScore
+    milestone_pruning: MilestonePruning
+    gem_checks: GemChecks
+    milestone_logic: MilestoneLogic
     death_link: DeathLink
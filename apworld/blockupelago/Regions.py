@@ -5,9 +5,11 @@ Defines the region structure for the world.
 Blockupelago is simple - just one main region with all locations.
 """
 
-from typing import TYPE_CHECKING
-from BaseClasses import Region
-from .Locations import BlockudokuLocation, location_table
+from itertools import repeat
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+from BaseClasses import LocationProgressType, Region
+from .Locations import BlockudokuLocation, PlannedLocation, plan_for_options
+from .Rules import milestone_rules
 
 if TYPE_CHECKING:
     from . import BlockudokuWorld
@@ -30,16 +32,23 @@ def create_regions(world: "BlockudokuWorld") -> None:
     # Connect Menu to Game Area (no requirements)
     menu_region.connect(game_region)
 
-    # Add all locations to the game region
-    for location_name, location_data in location_table.items():
-        if location_data.code is not None:  # Skip event locations for now
-            location = BlockudokuLocation(
-                player,
-                location_name,
-                location_data.code,
-                game_region
-            )
-            game_region.locations.append(location)
+    # With milestone_logic on, milestones wait for the unlocks the difficulty table asks for
+    rules = milestone_rules(player, world.options.starting_piece_slots.value) if world.options.milestone_logic else {}
+
+    # Add the milestone locations; with milestone_pruning on, the ones past the goal
+    # are either left out or excluded (see Locations.plan_locations)
+    for location_name, code, past_goal in plan_for_options(world.options):
+        location = BlockudokuLocation(
+            player,
+            location_name,
+            code,
+            game_region
+        )
+        if past_goal:
+            location.progress_type = LocationProgressType.EXCLUDED
+        if code in rules:
+            location.access_rule = rules[code]
+        game_region.locations.append(location)
 
     # Add victory event location
     victory_location = BlockudokuLocation(
@@ -51,29 +60,57 @@ def create_regions(world: "BlockudokuWorld") -> None:
     victory_location.place_locked_item(world.create_item("Victory"))
     game_region.locations.append(victory_location)
 
-    # Set victory condition based on goal_score option
-    goal_score = world.options.goal_score.value
-
-    # Victory requires reaching the goal score
-    goal_location_name = f"Reach {goal_score} Points"
-    
-    # If the exact goal doesn't exist in locations, find the closest higher milestone
-    if goal_location_name not in location_table:
-        # Find the closest milestone that's >= goal_score
-        score_locations = [name for name in location_table.keys() if "Reach" in name and "Points" in name]
-        for loc_name in sorted(score_locations):
-            # Extract score from "Reach X Points"
-            try:
-                loc_score = int(loc_name.split(" ")[1])
-                if loc_score >= goal_score:
-                    goal_location_name = loc_name
-                    break
-            except (ValueError, IndexError):
-                continue
-    
-    # Set the access rule for victory
-    if goal_location_name in location_table:
-        victory_location.access_rule = lambda state, loc=goal_location_name: state.can_reach(
-            loc, "Location", player
-        )
+    # The goal's access rule is set in Rules.set_rules from the goal_score option
+
+
+def _plan_columns(plan: Tuple[PlannedLocation, ...]) -> Tuple[Tuple[str, ...], Tuple[int, ...], Tuple[int, ...]]:
+    """A plan split into names, codes and the positions of excluded locations."""
+    names = tuple(row.name for row in plan)
+    codes = tuple(row.code for row in plan)
+    excluded = tuple(index for index, row in enumerate(plan) if row.past_goal)
+    return names, codes, excluded
+
+
+def create_regions_batched(worlds: Sequence["BlockudokuWorld"]) -> None:
+    """
+    create_regions for every player at once.
+
+    Each distinct location plan is split into columns once, and every
+    player's locations are built from them with map() instead of a Python
+    loop per location. The result is identical to calling create_regions for
+    each world in turn.
+    """
+    if not worlds:
+        return
+    multiworld = worlds[0].multiworld
+    columns: Dict[int, tuple] = {}
+    new_regions: List[Region] = []
+    excluded_type = LocationProgressType.EXCLUDED
+
+    for world in worlds:
+        player = world.player
+        menu_region = Region("Menu", player, multiworld)
+        game_region = Region("Game Area", player, multiworld)
+        new_regions += (menu_region, game_region)
+        menu_region.connect(game_region)
+
+        plan = plan_for_options(world.options)
+        plan_columns = columns.get(id(plan))
+        if plan_columns is None:
+            plan_columns = columns[id(plan)] = _plan_columns(plan)
+        names, codes, excluded = plan_columns
+        locations = list(map(BlockudokuLocation, repeat(player), names, codes, repeat(game_region)))
+        for index in excluded:
+            locations[index].progress_type = excluded_type
+        if world.options.milestone_logic:
+            rules = milestone_rules(player, world.options.starting_piece_slots.value)
+            for location, code in zip(locations, codes):
+                if code in rules:
+                    location.access_rule = rules[code]
+
+        victory_location = BlockudokuLocation(player, "Goal", None, game_region)
+        victory_location.place_locked_item(world.create_item("Victory"))
+        locations.append(victory_location)
+        game_region.locations += locations
 
+    multiworld.regions.extend(new_regions)
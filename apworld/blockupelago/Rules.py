@@ -0,0 +1,163 @@
+"""
+Blockupelago Rules
+
+Access rules built on per-player counters instead of reachability chains.
+BlockudokuWorld.collect/remove keep three counters in state.prog_items up
+to date (shapes unlocked beyond the starters, extra piece slots, permanent
+abilities), so every rule is a few Counter lookups.
+"""
+
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, Mapping, Optional, Sequence, Tuple
+from .Data import PERMANENT_ITEMS, PIECE_ITEMS, SLOT_ITEMS, STARTER_PIECES
+from .Difficulty import CATEGORIES, HAND_SIZES, PERMANENT_COUNTS, SHAPE_COUNTS, DifficultyTable, get_table
+from .Locations import first_milestone_at_least, milestone_index
+
+if TYPE_CHECKING:
+    from BaseClasses import CollectionState
+    from . import BlockudokuWorld
+    from .Options import BlockudokuOptions
+
+
+# Counter names in state.prog_items; chosen so they can never clash with an item name
+SHAPES = "Blockupelago Shapes Unlocked"
+PIECE_SLOTS = "Blockupelago Extra Piece Slots"
+PERMANENTS = "Blockupelago Permanent Abilities"
+
+COUNTER_FOR_ITEM: Mapping[str, str] = MappingProxyType({
+    **{name: SHAPES for name in PIECE_ITEMS if name not in STARTER_PIECES},
+    **{name: PIECE_SLOTS for name in SLOT_ITEMS},
+    **{name: PERMANENTS for name in PERMANENT_ITEMS},
+})
+
+SCORE_COLUMN = CATEGORIES.index("score")
+
+
+@lru_cache(maxsize=None)
+def logic_items(goal_score: int, starting_slots: int, milestone_logic: bool = False) -> FrozenSet[str]:
+    """
+    Items some access rule depends on: every counted item when the Goal needs
+    any unlocks or milestone logic is on (the difficulty table looks up all
+    three counters), none otherwise. With the shipped table every valid
+    goal_score and starting_slots needs unlocks.
+    """
+    goal = milestone_gate(get_table(), SCORE_COLUMN, goal_milestone(goal_score), starting_slots)
+    return frozenset(COUNTER_FOR_ITEM) if milestone_logic or goal is not None else frozenset()
+
+
+def logic_items_for_options(options: "BlockudokuOptions") -> FrozenSet[str]:
+    return logic_items(options.goal_score.value, options.starting_piece_slots.value,
+                       bool(options.milestone_logic.value))
+
+
+@lru_cache(maxsize=None)
+def goal_milestone(goal_score: int) -> int:
+    """
+    Index of the score milestone standing for the goal: the lowest at or
+    above goal_score, or the highest one for goals past every milestone.
+    """
+    milestone = first_milestone_at_least("score", goal_score)
+    milestones = milestone_index["score"]
+    return milestones.index(milestone) if milestone is not None else len(milestones) - 1
+
+
+@lru_cache(maxsize=None)
+def milestone_gate(table: DifficultyTable, column: int, index: int,
+                   starting_slots: int) -> Optional[Callable[[int, "CollectionState"], bool]]:
+    """
+    An O(1) check, taking the player and the state, for the index-th
+    milestone of CATEGORIES[column]: one difficulty table lookup for the
+    player's counters. None if the milestone is in logic from the start. A
+    milestone no unlock state the player can reach gets to waits for every
+    counted item in the pool, the best state there is.
+
+    The table offsets and bounds only depend on the starting piece slots, so
+    one gate is shared by every player with the same starting_slots.
+    """
+    counts = table.counts
+    base = table.offset(0, starting_slots, 0) + column
+    best = table.offset(SHAPE_COUNTS - 1, starting_slots + len(SLOT_ITEMS), PERMANENT_COUNTS - 1) + column
+    if counts[base] > index:
+        return None
+    max_shapes, max_permanents = SHAPE_COUNTS - 1, PERMANENT_COUNTS - 1
+    max_slots = HAND_SIZES[-1] - starting_slots
+
+    if counts[best] <= index:
+        all_slots = min(len(SLOT_ITEMS), max_slots)
+
+        def gate(player: int, state: "CollectionState") -> bool:
+            counters = state.prog_items[player]
+            return (counters[SHAPES] >= max_shapes and counters[PIECE_SLOTS] >= all_slots
+                    and counters[PERMANENTS] >= max_permanents)
+
+        return gate
+
+    # Strides of table.offset; counters past the table (extra copies from start_inventory) are clamped
+    width = len(CATEGORIES)
+    permanent_stride, slot_stride = width, PERMANENT_COUNTS * width
+    shape_stride = len(HAND_SIZES) * slot_stride
+
+    def gate(player: int, state: "CollectionState") -> bool:
+        counters = state.prog_items[player]
+        shapes, slots, permanents = counters[SHAPES], counters[PIECE_SLOTS], counters[PERMANENTS]
+        return counts[base + (shapes if shapes < max_shapes else max_shapes) * shape_stride
+                      + (slots if slots < max_slots else max_slots) * slot_stride
+                      + (permanents if permanents < max_permanents else max_permanents) * permanent_stride] > index
+
+    return gate
+
+
+def make_milestone_rule(table: DifficultyTable, column: int, index: int, player: int,
+                        starting_slots: int) -> Optional[Callable[["CollectionState"], bool]]:
+    """milestone_gate bound to a player: the milestone's access rule, or None if it is always met."""
+    gate = milestone_gate(table, column, index, starting_slots)
+    return partial(gate, player) if gate is not None else None
+
+
+@lru_cache(maxsize=None)
+def milestone_gates(starting_slots: int) -> Tuple[Tuple[int, Callable[[int, "CollectionState"], bool]], ...]:
+    """(location id, milestone_gate) for every gated milestone, from the shared difficulty table."""
+    table = get_table()
+    gates = []
+    for column, category in enumerate(CATEGORIES):
+        for index, milestone in enumerate(milestone_index[category]):
+            gate = milestone_gate(table, column, index, starting_slots)
+            if gate is not None:
+                gates.append((milestone.code, gate))
+    return tuple(gates)
+
+
+def milestone_rules(player: int, starting_slots: int) -> Dict[int, Callable[["CollectionState"], bool]]:
+    """Location id -> access rule for every gated milestone; only binding the player is per call."""
+    return {code: partial(gate, player) for code, gate in milestone_gates(starting_slots)}
+
+
+def make_goal_rule(goal_score: int, player: int,
+                   starting_slots: int) -> Optional[Callable[["CollectionState"], bool]]:
+    """The Goal's access rule: the same table lookup as its score milestone, with or without milestone logic."""
+    return make_milestone_rule(get_table(), SCORE_COLUMN, goal_milestone(goal_score), player, starting_slots)
+
+
+def set_rules(world: "BlockudokuWorld") -> None:
+    multiworld = world.multiworld
+    player = world.player
+
+    # The goal waits for the unlocks that make goal_score reachable; milestones are
+    # only gated with milestone_logic on (see Regions.create_regions)
+    goal_rule = make_goal_rule(world.options.goal_score.value, player, world.options.starting_piece_slots.value)
+    if goal_rule is not None:
+        multiworld.get_location("Goal", player).access_rule = goal_rule
+
+    # Goal is to reach the target score
+    multiworld.completion_condition[player] = lambda state: state.has("Victory", player)
+
+
+def set_rules_batched(worlds: Sequence["BlockudokuWorld"]) -> None:
+    """
+    set_rules for every player at once. There is no shared structure to
+    build beyond what milestone_gate already caches per goal milestone and
+    starting slots, so this is set_rules for each world in turn.
+    """
+    for world in worlds:
+        set_rules(world)
@@ -0,0 +1,110 @@
+"""
+Blockupelago Slot Data
+
+Compact, versioned tables sent to the client in slot_data["tables"], so it
+can use this slot's milestone thresholds and location/item IDs instead of
+rebuilding them from its own constants:
+
+    v           SLOT_DATA_VERSION
+    hash        content hash; the client caches decoded tables under it
+    milestones  per category, threshold deltas run-length encoded as a flat
+                [delta, repeat, delta, repeat, ...] list
+    locations   active location IDs as flat [first, count, ...] runs
+    items       item IDs as flat [first, count, ...] runs
+
+decodeSlotTables in the client's useArchipelagoItems.ts is the reader;
+decode_tables below mirrors it.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping
+from .Data import ITEM_NAME_TO_ID
+from .Locations import milestone_index, plan_locations
+
+if TYPE_CHECKING:
+    from .Options import BlockudokuOptions
+
+SLOT_DATA_VERSION = 1
+
+
+def encode_runs(ids: Iterable[int]) -> List[int]:
+    """Sorted IDs as [first, count, ...] runs of consecutive values."""
+    runs: List[int] = []
+    for value in sorted(ids):
+        if runs and runs[-2] + runs[-1] == value:
+            runs[-1] += 1
+        else:
+            runs += [value, 1]
+    return runs
+
+
+def encode_deltas(thresholds: Iterable[int]) -> List[int]:
+    """Ascending thresholds as run-length encoded deltas from 0."""
+    encoded: List[int] = []
+    previous = 0
+    for threshold in thresholds:
+        delta, previous = threshold - previous, threshold
+        if encoded and encoded[-2] == delta:
+            encoded[-1] += 1
+        else:
+            encoded += [delta, 1]
+    return encoded
+
+
+def decode_runs(runs: List[int]) -> List[int]:
+    return [first + offset for first, count in zip(runs[::2], runs[1::2]) for offset in range(count)]
+
+
+def decode_deltas(encoded: List[int]) -> List[int]:
+    thresholds = []
+    value = 0
+    for delta, repeat in zip(encoded[::2], encoded[1::2]):
+        for _ in range(repeat):
+            value += delta
+            thresholds.append(value)
+    return thresholds
+
+
+def content_hash(tables: Mapping[str, Any]) -> str:
+    """Short sha256 over the canonical JSON of everything but the hash itself."""
+    import hashlib
+    import json
+
+    canonical = json.dumps({key: value for key, value in tables.items() if key != "hash"},
+                           sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def slot_tables(pruning: int, goal_score: int, gem_count: int) -> Mapping[str, Any]:
+    """
+    Encoded tables for one option combination.
+
+    Cached, so slots with the same options return the same object and the
+    multidata pickle stores it once; callers must not mutate it.
+    """
+    tables: Dict[str, Any] = {
+        "v": SLOT_DATA_VERSION,
+        "milestones": {category: encode_deltas(milestone.threshold for milestone in milestones)
+                       for category, milestones in milestone_index.items()},
+        "locations": encode_runs(location.code for location in plan_locations(pruning, goal_score, gem_count)),
+        "items": encode_runs(ITEM_NAME_TO_ID.values()),
+    }
+    tables["hash"] = content_hash(tables)
+    return tables
+
+
+def tables_for_options(options: "BlockudokuOptions") -> Mapping[str, Any]:
+    """slot_tables for a player's resolved options."""
+    return slot_tables(options.milestone_pruning.value, options.goal_score.value, options.gem_checks.value)
+
+
+def decode_tables(tables: Mapping[str, Any]) -> Dict[str, Any]:
+    """Expand encoded tables: thresholds per category, location and item ID lists."""
+    if tables.get("v") != SLOT_DATA_VERSION:
+        raise ValueError(f"unsupported slot data tables version {tables.get('v')!r}")
+    return {
+        "milestones": {category: decode_deltas(encoded) for category, encoded in tables["milestones"].items()},
+        "locations": decode_runs(tables["locations"]),
+        "items": decode_runs(tables["items"]),
+    }
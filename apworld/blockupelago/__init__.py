@@ -4,13 +4,25 @@ Blockupelago Archipelago World
 A Blockudoku puzzle game for Archipelago multiworld randomizer.
 """
 
-from typing import Dict, Any, ClassVar
-from BaseClasses import Item, Location, Region, Tutorial
+from itertools import repeat
+from typing import TYPE_CHECKING, Dict, Any, ClassVar, List
+from BaseClasses import Item, Location, MultiWorld, Tutorial
 from worlds.AutoWorld import World, WebWorld
-from .Items import BlockudokuItem, item_table, item_groups
-from .Locations import BlockudokuLocation, location_table
+from .Instrumentation import instrument, timed_import
+
+with timed_import("Data"):
+    from .Data import ITEM_NAME_TO_ID, LOCATION_NAME_TO_ID
+with timed_import("Items"):
+    from .Items import BlockudokuItem, build_pool_plan, classify, item_groups, pool_columns
+with timed_import("Locations"):
+    from .Locations import plan_sizes_for_options
 from .Options import BlockudokuOptions
-from .Regions import create_regions
+from .Regions import create_regions, create_regions_batched
+from .Rules import COUNTER_FOR_ITEM, logic_items_for_options, set_rules, set_rules_batched
+from .SlotData import tables_for_options
+
+if TYPE_CHECKING:
+    from BaseClasses import CollectionState
 
 
 class BlockudokuWebWorld(WebWorld):
@@ -30,6 +42,7 @@ class BlockudokuWebWorld(WebWorld):
     ]
 
 
+@instrument
 class BlockudokuWorld(World):
     """
     Blockupelago is a Blockudoku puzzle game where you place polyomino pieces
@@ -45,78 +58,95 @@ class BlockudokuWorld(World):
     options: BlockudokuOptions
 
     # Item and location ID ranges
-    item_name_to_id: ClassVar[Dict[str, int]] = {
-        name: data.code for name, data in item_table.items() if data.code is not None
-    }
-    location_name_to_id: ClassVar[Dict[str, int]] = {
-        name: data.code for name, data in location_table.items() if data.code is not None
-    }
+    # Plain dict copies of the generated tables (Archipelago serializes these to JSON)
+    item_name_to_id: ClassVar[Dict[str, int]] = dict(ITEM_NAME_TO_ID)
+    location_name_to_id: ClassVar[Dict[str, int]] = dict(LOCATION_NAME_TO_ID)
 
     item_name_groups = item_groups
 
     def create_item(self, name: str) -> BlockudokuItem:
-        """Create an item for this world."""
-        item_data = item_table[name]
+        """Create an item for this world, classified against the items its rules use."""
+        name, item_data = classify(name, logic_items_for_options(self.options), bool(self.options.milestone_logic))
         return BlockudokuItem(name, item_data.classification, item_data.code, self.player)
 
+    # Build regions, items and rules for every Blockupelago player in one pass from
+    # the stage_* hooks; the per-player methods then do nothing. Set to False to
+    # generate player by player (benchmarks/bench_batched_stages.py compares both).
+    # The gain comes from players sharing options: 1.2-1.9x from 50 players on default
+    # options, 1.0-1.4x with mixed options, and 0.8-1.1x for a single player, where
+    # either path takes under a millisecond.
+    batched_stages: ClassVar[bool] = True
+
+    @classmethod
+    def _game_worlds(cls, multiworld: MultiWorld) -> List["BlockudokuWorld"]:
+        return [multiworld.worlds[player] for player in multiworld.get_game_players(cls.game)]
+
     def create_regions(self) -> None:
         """Create and connect all regions for this world."""
-        create_regions(self)
+        if not self.batched_stages:
+            create_regions(self)
+
+    @classmethod
+    def stage_create_regions(cls, multiworld: MultiWorld) -> None:
+        if cls.batched_stages:
+            create_regions_batched(cls._game_worlds(multiworld))
 
     def create_items(self) -> None:
         """Create all items for the item pool with custom distribution."""
-        from .Items import STARTER_PIECES
-
-        # Calculate how many locations we have (excluding Victory event)
-        location_count = len([loc for loc in location_table.values() if loc.code is not None])
-
-        # --- 1. Add all rare/progression items (once each) ---
-        piece_type_items = [
-            "Single Block", "Domino I", "Tromino I", "Tromino L",
-            "Tetromino I", "Tetromino O", "Tetromino T", "Tetromino L", "Tetromino S",
-            "Pentomino I", "Pentomino L", "Pentomino P", "Pentomino U", "Pentomino W", "Pentomino Plus",
-            "3x3 Corner", "3x3 T-Shape", "3x3 Cross"
-        ]
-        shape_pool = [p for p in piece_type_items if p not in STARTER_PIECES]
-        for item_name in shape_pool:
-            self.multiworld.itempool.append(self.create_item(item_name))
-        self.multiworld.itempool.append(self.create_item("4th Piece Slot"))
-        self.multiworld.itempool.append(self.create_item("5th Piece Slot"))
-        self.multiworld.itempool.append(self.create_item("Permanent Free Rotate"))
-        self.multiworld.itempool.append(self.create_item("Permanent Free Mirror"))
-        self.multiworld.itempool.append(self.create_item("Permanent Free Hold"))
-
-        # --- 2. Fill remaining locations with ability uses and multipliers (proportional) ---
-        rare_count = len(shape_pool) + 5  # 5 = 2 slots + 3 permanent abilities
-        filler_count = location_count - rare_count
-        # 2:1 ratio (2/3 ability uses, 1/3 multipliers)
-        n_abilities = (filler_count * 2) // 3
-        n_mults = filler_count - n_abilities
-
-        ability_items = [
-            "Rotate Ability", "Undo Ability", "Remove Block", "Hold Ability", "Mirror Ability", "Shrink Ability"
-        ]
-        for i in range(n_abilities):
-            item_name = ability_items[i % len(ability_items)]
-            self.multiworld.itempool.append(self.create_item(item_name))
-
-        multiplier_items = ["Score Multiplier +10%", "Score Multiplier +25%", "Score Multiplier +50%"]
-        for i in range(n_mults):
-            # Use a distribution: 50% +10%, 30% +25%, 20% +50%
-            if i % 10 < 5:
-                item_name = "Score Multiplier +10%"
-            elif i % 10 < 8:
-                item_name = "Score Multiplier +25%"
-            else:
-                item_name = "Score Multiplier +50%"
-            self.multiworld.itempool.append(self.create_item(item_name))
+        if self.batched_stages:
+            return
+        # One item per milestone location created in create_regions (excluding Victory event)
+        location_count, excluded_count = plan_sizes_for_options(self.options)
+
+        player = self.player
+        self.multiworld.itempool.extend([
+            BlockudokuItem(name, data.classification, data.code, player)
+            for name, data in build_pool_plan(location_count, logic_items_for_options(self.options), excluded_count,
+                                              bool(self.options.milestone_logic))
+        ])
+
+    @classmethod
+    def stage_create_items(cls, multiworld: MultiWorld) -> None:
+        """create_items for every player at once, building each pool from cached columns."""
+        if not cls.batched_stages:
+            return
+        items: List[BlockudokuItem] = []
+        for world in cls._game_worlds(multiworld):
+            location_count, excluded_count = plan_sizes_for_options(world.options)
+            names, classifications, codes = pool_columns(location_count, logic_items_for_options(world.options),
+                                                         excluded_count, bool(world.options.milestone_logic))
+            items += map(BlockudokuItem, names, classifications, codes, repeat(world.player))
+        multiworld.itempool.extend(items)
 
     def set_rules(self) -> None:
         """Set access rules for locations."""
-        # Goal is to reach the target score
-        self.multiworld.completion_condition[self.player] = lambda state: (
-            state.has("Victory", self.player)
-        )
+        if not self.batched_stages:
+            set_rules(self)
+
+    @classmethod
+    def stage_set_rules(cls, multiworld: MultiWorld) -> None:
+        if cls.batched_stages:
+            set_rules_batched(cls._game_worlds(multiworld))
+
+    def collect(self, state: "CollectionState", item: Item) -> bool:
+        """Collect an item, keeping the rule counters in Rules.py up to date."""
+        change = super().collect(state, item)
+        if change:
+            counter = COUNTER_FOR_ITEM.get(item.name)
+            if counter:
+                state.prog_items[self.player][counter] += 1
+        return change
+
+    def remove(self, state: "CollectionState", item: Item) -> bool:
+        change = super().remove(state, item)
+        if change:
+            counter = COUNTER_FOR_ITEM.get(item.name)
+            if counter:
+                counters = state.prog_items[self.player]
+                counters[counter] -= 1
+                if counters[counter] < 1:
+                    del counters[counter]
+        return change
 
     def fill_slot_data(self) -> Dict[str, Any]:
         """Return slot data to be sent to the client."""
@@ -124,5 +154,7 @@ class BlockudokuWorld(World):
             "starting_piece_slots": self.options.starting_piece_slots.value,
             "starting_abilities": self.options.starting_abilities.value,
             "goal_score": self.options.goal_score.value,
+            "death_link": self.options.death_link.value,
+            "tables": tables_for_options(self.options),
         }
 
@@ -3,53 +3,205 @@
 Package the Blockupelago APWorld for distribution.
 
 Usage:
-    python build_apworld.py
+    python build_apworld.py              # rebuild only if sources changed
+    python build_apworld.py --bytecode   # also ship precompiled .pyc files
+    python build_apworld.py --force      # rebuild even if up to date
+    python build_apworld.py --difficulty # also rebuild the milestone difficulty table
 
 This creates a blockupelago.apworld file that can be installed in Archipelago.
+The archive is byte-reproducible: entries are sorted, timestamps and
+permissions are fixed, and a hash of the packaged content is stored in the
+zip comment so unchanged sources skip the rebuild entirely.
+
+The milestone difficulty table (blockupelago/difficulty.bin) is packaged
+like any other file. Building it takes a while, so packaging only checks
+that it is there and that its header and size agree, and stops if not;
+rebuild it with build_difficulty.py, or pass --difficulty to run that first
+with its defaults. build_difficulty.py --check also confirms the table
+matches the current milestones; the check reads them from the world package,
+which needs an Archipelago core, so packaging does not run it.
 """
 
+import argparse
+import hashlib
+import importlib.util
+import marshal
+import math
 import os
+import struct
 import zipfile
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Bump when the archive layout changes so old archives are rebuilt
+PACKAGE_FORMAT = 1
+
+# Fixed entry metadata (zip timestamps cannot predate 1980)
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+FILE_MODE = 0o644
+
+# Entries zipimport reads as-is are stored; everything else is deflated
+STORED_SUFFIXES = {".pyc"}
+
+# PEP 552 pyc flags: hash-based, checked against the source
+CHECKED_HASH_FLAGS = 0b11
+
+# The milestone difficulty table's file name and header, as in blockupelago/Difficulty.py
+DIFFICULTY_RESOURCE = "difficulty.bin"
+DIFFICULTY_MAGIC = b"BKDIFF"
+DIFFICULTY_HEADER = struct.Struct("<6sH16sBBBB")
+
+
+def collect_sources(world_dir: Path) -> List[Tuple[str, bytes]]:
+    """Return (archive name, content) for every packaged file, sorted by name."""
+    sources = []
+    for root, dirs, files in os.walk(world_dir):
+        # Skip __pycache__ directories and hidden folders
+        dirs[:] = [d for d in dirs if d != '__pycache__' and not d.startswith('.')]
+
+        for file in files:
+            # Skip .pyc files and other unwanted files
+            if file.endswith('.pyc') or file.startswith('.'):
+                continue
+
+            file_path = Path(root) / file
+            # Archive name is relative to the apworld directory, with blockupelago/ prefix
+            arcname = ("blockupelago" / file_path.relative_to(world_dir)).as_posix()
+            sources.append((arcname, file_path.read_bytes()))
+    return sorted(sources)
+
+
+def compile_bytecode(arcname: str, source: bytes) -> bytes:
+    """
+    Compile a module into a checked hash-based .pyc.
+
+    zipimport looks for ``module.pyc`` next to ``module.py`` inside the
+    archive. Checked hash-based pycs are validated against the packaged
+    source rather than timestamps, so they stay reproducible; a pyc from a
+    different Python version is ignored and the source is compiled instead.
+    """
+    code = compile(source, arcname, "exec", dont_inherit=True)
+    # Header as laid out by PEP 552: magic, flags, source hash, then the marshalled code
+    return (importlib.util.MAGIC_NUMBER + CHECKED_HASH_FLAGS.to_bytes(4, "little")
+            + importlib.util.source_hash(source) + marshal.dumps(code))
+
+
+def plan_entries(sources: List[Tuple[str, bytes]], bytecode: bool) -> List[Tuple[str, bytes]]:
+    entries = list(sources)
+    if bytecode:
+        entries += [(arcname[:-3] + ".pyc", compile_bytecode(arcname, content))
+                    for arcname, content in sources if arcname.endswith(".py")]
+    return sorted(entries)
+
 
-def build_apworld():
+def build_stamp(entries: List[Tuple[str, bytes]], bytecode: bool) -> bytes:
+    """Zip comment identifying exactly what an archive was built from."""
+    digest = hashlib.sha256()
+    for arcname, content in entries:
+        digest.update(arcname.encode("utf-8") + b"\0" + hashlib.sha256(content).digest())
+    tag = importlib.util.MAGIC_NUMBER.hex() if bytecode else "none"
+    return f"blockupelago format={PACKAGE_FORMAT} bytecode={tag} sha256={digest.hexdigest()}".encode("ascii")
+
+
+def read_existing(output_file: Path) -> Tuple[Optional[bytes], Dict[str, int]]:
+    """Return the build stamp and the name -> CRC32 map of an existing archive."""
+    if not output_file.exists():
+        return None, {}
+    try:
+        with zipfile.ZipFile(output_file) as zipf:
+            return zipf.comment, {info.filename: info.CRC for info in zipf.infolist()}
+    except zipfile.BadZipFile:
+        return None, {}
+
+
+def report_changes(old: Dict[str, int], entries: List[Tuple[str, bytes]]) -> None:
+    new = {arcname: zipfile.crc32(content) for arcname, content in entries}
+    for arcname in sorted(new.keys() | old.keys()):
+        if arcname not in old:
+            print(f"  Added: {arcname}")
+        elif arcname not in new:
+            print(f"  Removed: {arcname}")
+        elif old[arcname] != new[arcname]:
+            print(f"  Changed: {arcname}")
+
+
+def write_archive(path: Path, entries: List[Tuple[str, bytes]], stamp: bytes) -> None:
+    with zipfile.ZipFile(path, 'w') as zipf:
+        for arcname, content in entries:
+            info = zipfile.ZipInfo(arcname, date_time=FIXED_DATE_TIME)
+            info.create_system = 3  # Unix, so external_attr means the same everywhere
+            info.external_attr = FILE_MODE << 16
+            if Path(arcname).suffix in STORED_SUFFIXES:
+                zipf.writestr(info, content, compress_type=zipfile.ZIP_STORED)
+            else:
+                zipf.writestr(info, content, compress_type=zipfile.ZIP_DEFLATED, compresslevel=9)
+        zipf.comment = stamp
+
+
+def difficulty_table_error(world_dir: Path) -> Optional[str]:
+    """Why blockupelago/difficulty.bin cannot be packaged, or None if it is a well-formed table."""
+    path = world_dir / DIFFICULTY_RESOURCE
+    if not path.is_file():
+        return f"{path} is missing"
+    data = path.read_bytes()
+    if len(data) < DIFFICULTY_HEADER.size:
+        return f"{path} is too short to be a difficulty table"
+    magic, _, _, *dimensions = DIFFICULTY_HEADER.unpack_from(data)
+    if magic != DIFFICULTY_MAGIC:
+        return f"{path} is not a difficulty table"
+    expected = DIFFICULTY_HEADER.size + math.prod(dimensions)
+    if len(data) != expected:
+        return f"{path} is {len(data)} bytes, but its header describes {expected}"
+    return None
+
+
+def build_apworld(bytecode: bool = False, force: bool = False, output_file: Optional[Path] = None,
+                  difficulty: bool = False):
     # Get the directory where this script is located
     script_dir = Path(__file__).parent
     world_dir = script_dir / "blockupelago"
-    output_file = script_dir / "blockupelago.apworld"
+    output_file = output_file or script_dir / "blockupelago.apworld"
 
     # Check that the world directory exists
     if not world_dir.exists():
         print(f"Error: World directory not found: {world_dir}")
         return False
 
-    # Remove existing apworld if present
-    if output_file.exists():
-        try:
-            output_file.unlink()
-            print(f"Removed existing: {output_file}")
-        except PermissionError:
-            print(f"\n⚠️  Error: Cannot delete {output_file}")
-            print("The file is being used by another process (likely Archipelago).")
-            print("Please close Archipelago and try again.\n")
+    if difficulty:
+        # Imported here: the builder pulls in the simulator
+        import build_difficulty
+
+        print("Building milestone difficulty table (this takes a while)...")
+        if build_difficulty.main([]) != 0:
             return False
 
-    # Create the apworld (which is just a zip file)
-    with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(world_dir):
-            # Skip __pycache__ directories
-            dirs[:] = [d for d in dirs if d != '__pycache__']
+    error = difficulty_table_error(world_dir)
+    if error:
+        print(f"Error: {error}")
+        print("Rebuild it with build_difficulty.py (or build_apworld.py --difficulty).")
+        return False
+
+    entries = plan_entries(collect_sources(world_dir), bytecode)
+    stamp = build_stamp(entries, bytecode)
+    existing_stamp, existing_entries = read_existing(output_file)
+
+    if existing_stamp == stamp and not force:
+        print(f"Up to date: {output_file}")
+        return True
 
-            for file in files:
-                # Skip .pyc files and other unwanted files
-                if file.endswith('.pyc') or file.startswith('.'):
-                    continue
+    report_changes(existing_entries, entries)
 
-                file_path = Path(root) / file
-                # Calculate the archive name (relative to apworld directory, with blockupelago/ prefix)
-                arcname = "blockupelago" / file_path.relative_to(world_dir)
-                zipf.write(file_path, arcname)
-                print(f"  Added: {arcname}")
+    # Write next to the target, then swap it in
+    temp_file = output_file.with_name(output_file.name + ".tmp")
+    write_archive(temp_file, entries, stamp)
+    try:
+        os.replace(temp_file, output_file)
+    except PermissionError:
+        temp_file.unlink()
+        print(f"\n⚠️  Error: Cannot replace {output_file}")
+        print("The file is being used by another process (likely Archipelago).")
+        print("Please close Archipelago and try again.\n")
+        return False
 
     print(f"\nSuccessfully created: {output_file}")
     print(f"File size: {output_file.stat().st_size} bytes")
@@ -57,9 +209,16 @@ def build_apworld():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Package the Blockupelago APWorld.")
+    parser.add_argument("--bytecode", action="store_true",
+                        help="include .pyc files compiled by this Python for faster loading")
+    parser.add_argument("--force", action="store_true", help="rebuild even if sources are unchanged")
+    parser.add_argument("--difficulty", action="store_true", help="rebuild the milestone difficulty table first")
+    args = parser.parse_args()
+
     print("Building blockupelago APWorld...")
     print("-" * 40)
-    success = build_apworld()
+    success = build_apworld(bytecode=args.bytecode, force=args.force, difficulty=args.difficulty)
     print("-" * 40)
     if success:
         print("\nTo install:")
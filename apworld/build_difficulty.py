@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Build the milestone difficulty table shipped in the apworld.
+
+Usage:
+    python build_difficulty.py                      # rebuild blockupelago/difficulty.bin
+    python build_difficulty.py --games 192 --beam 4 --workers 8
+    python build_difficulty.py --check              # exit 1 if missing or stale
+
+Plays games with the beam-search player (blockudoku_sim.search) for every
+unlock state: the starter pieces plus 0-15 more pieces, every hand size a
+player can have, and every combination of permanent abilities. The rules
+only count shapes, so the extra pieces are added hardest first (ranked by
+the mean score of games with the starters plus that one piece) and any N
+shapes are assumed no better than the N hardest. Games run to game over, or
+until they pass the last milestone of every category, since nothing further
+changes the table. A milestone counts as reachable when at least --reach of
+the games get to it. A state one unlock past a state that reaches every
+milestone is not played, as the monotone pass below would fill it in anyway.
+States with the same number of permanents keep the weakest combination,
+since the rules only count them too; then the table is made monotone along
+each axis (an unlock never takes a milestone out of logic). Milestones no
+state a player can reach gets to wait for every counted item (see
+Rules.milestone_gate). build_apworld.py refuses to package a missing or
+stale table; build_apworld.py --difficulty runs this with the defaults
+first. The result does not depend on --workers.
+"""
+
+import argparse
+import math
+import sys
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import combinations, product
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from benchmarks.harness import install_stand_in
+
+# The world package only needs the core's base types, which the stand-in provides
+install_stand_in()
+from blockudoku_sim.pieces import ALL_PIECES, STARTER_PIECE_NAMES  # noqa: E402
+from blockudoku_sim.search import SearchConfig, play_games  # noqa: E402
+from blockudoku_sim.unlocks import FREE_HOLD, FREE_MIRROR, FREE_ROTATE, UnlockSet  # noqa: E402
+from blockupelago.Data import MILESTONES  # noqa: E402
+from blockupelago.Difficulty import (  # noqa: E402
+    CATEGORIES, HAND_SIZES, PERMANENT_COUNTS, RESOURCE, SHAPE_COUNTS, DifficultyTable, pack_table,
+)
+
+TABLE_PATH = Path(__file__).parent / "blockupelago" / RESOURCE
+PERMANENTS = (FREE_ROTATE, FREE_MIRROR, FREE_HOLD)
+# GameResult field behind each category
+RESULT_FIELDS = {"score": "score", "line_clear": "lines", "box_clear": "boxes", "piece": "pieces"}
+
+State = Tuple[int, int, Tuple[str, ...]]  # extra shapes, hand size, permanents
+EXTRA_PIECES = tuple(piece.name for piece in ALL_PIECES if piece.name not in STARTER_PIECE_NAMES)
+# A game stops once it has passed every category's last milestone: (score, lines, boxes, pieces)
+TARGETS = tuple(MILESTONES[category][-1][0] for category in CATEGORIES)
+EVERY_MILESTONE = tuple(len(MILESTONES[category]) for category in CATEGORIES)
+
+
+def table_is_current(path: Path = TABLE_PATH) -> bool:
+    try:
+        DifficultyTable(path.read_bytes())
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def unlock_states() -> List[State]:
+    combos = [combo for count in range(len(PERMANENTS) + 1) for combo in combinations(PERMANENTS, count)]
+    return list(product(range(SHAPE_COUNTS), HAND_SIZES, combos))
+
+
+def unlock_set(state: State, order: Sequence[str] = EXTRA_PIECES) -> UnlockSet:
+    shapes, hand_size, permanents = state
+    return UnlockSet(frozenset(STARTER_PIECE_NAMES) | frozenset(order[:shapes]), hand_size, frozenset(permanents))
+
+
+def weaker_states(state: State) -> List[State]:
+    """The states one unlock short of state."""
+    shapes, hand_size, permanents = state
+    weaker = [(shapes - 1, hand_size, permanents)] if shapes else []
+    if hand_size > HAND_SIZES[0]:
+        weaker.append((shapes, hand_size - 1, permanents))
+    weaker.extend((shapes, hand_size, tuple(p for p in permanents if p != dropped)) for dropped in permanents)
+    return weaker
+
+
+def mean_score(name: str, seeds: Sequence[int], beam: int) -> float:
+    """Mean score of games with the starters plus one extra piece, the smallest hand and no permanents."""
+    unlocks = UnlockSet(frozenset(STARTER_PIECE_NAMES) | {name}, HAND_SIZES[0], frozenset())
+    results = play_games(unlocks, seeds, SearchConfig(beam), targets=TARGETS)
+    return sum(result.score for result in results) / len(results)
+
+
+def reachable_counts(state: State, order: Sequence[str], seeds: Sequence[int], beam: int,
+                     reach: float) -> Tuple[int, ...]:
+    """Milestones per category that at least a reach fraction of the games get to."""
+    results = play_games(unlock_set(state, order), seeds, SearchConfig(beam), targets=TARGETS)
+    rank = max(1, math.ceil(reach * len(results)))
+    counts = []
+    for category in CATEGORIES:
+        # The rank-th best game's value; every threshold up to it is reached by rank games
+        value = sorted((getattr(result, RESULT_FIELDS[category]) for result in results), reverse=True)[rank - 1]
+        counts.append(bisect_right([threshold for threshold, _, _ in MILESTONES[category]], value))
+    return tuple(counts)
+
+
+def _mean_score(args: tuple) -> float:
+    return mean_score(*args)
+
+
+def _reachable_counts(args: tuple) -> Tuple[int, ...]:
+    return reachable_counts(*args)
+
+
+def reduce_table(measured: Dict[State, Tuple[int, ...]]) -> List[int]:
+    """Counts in file order: weakest permanent combination per count, then monotone."""
+    table: Dict[Tuple[int, int, int], List[int]] = {}
+    for (shapes, hand_size, permanents), counts in measured.items():
+        key = (shapes, hand_size, len(permanents))
+        table[key] = [min(a, b) for a, b in zip(table[key], counts)] if key in table else list(counts)
+
+    keys = list(product(range(SHAPE_COUNTS), HAND_SIZES, range(PERMANENT_COUNTS)))
+    # keys are in file order, so every smaller state on each axis is already final
+    for shapes, hand_size, permanents in keys:
+        counts = table[shapes, hand_size, permanents]
+        for smaller in ((shapes - 1, hand_size, permanents), (shapes, hand_size - 1, permanents),
+                        (shapes, hand_size, permanents - 1)):
+            if smaller in table:
+                counts[:] = [max(a, b) for a, b in zip(counts, table[smaller])]
+    return [count for key in keys for count in table[key]]
+
+
+def build(games: int, beam: int, reach: float, workers: int, seed: int = 0) -> bytes:
+    seeds = list(range(seed, seed + games))
+    # Waves of states with the same number of unlocks, so every weaker state is measured first
+    waves: Dict[int, List[State]] = {}
+    for state in unlock_states():
+        waves.setdefault(state[0] + state[1] - HAND_SIZES[0] + len(state[2]), []).append(state)
+    measured: Dict[State, Tuple[int, ...]] = {}
+    with ProcessPoolExecutor(workers, initializer=install_stand_in) if workers > 1 else nullcontext() as pool:
+        run = pool.map if pool is not None else map
+        scores = dict(zip(EXTRA_PIECES, run(_mean_score, [(name, seeds, beam) for name in EXTRA_PIECES])))
+        # Hardest first; sorted is stable, so ties keep item order
+        order = tuple(sorted(EXTRA_PIECES, key=scores.__getitem__))
+        print("Extra pieces, hardest first: " + ", ".join(order), flush=True)
+        for rank in sorted(waves):
+            played = []
+            for state in waves[rank]:
+                if any(measured[weaker] == EVERY_MILESTONE for weaker in weaker_states(state)):
+                    measured[state] = EVERY_MILESTONE
+                else:
+                    played.append(state)
+            jobs = [(state, order, seeds, beam, reach) for state in played]
+            measured.update(zip(played, run(_reachable_counts, jobs)))
+            print(f"{rank} unlocks: played {len(played)} of {len(waves[rank])} states", flush=True)
+    return pack_table(reduce_table(measured))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--games", type=int, default=96, help="games per unlock state")
+    parser.add_argument("--beam", type=int, default=2, help="beam width")
+    parser.add_argument("--reach", type=float, default=0.5, help="fraction of games that must reach a milestone")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=TABLE_PATH)
+    parser.add_argument("--check", action="store_true", help="only check the table is present and current")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        current = table_is_current(args.out)
+        print(f"{args.out}: {'up to date' if current else 'missing or stale'}")
+        return 0 if current else 1
+
+    start = time.perf_counter()
+    data = build(args.games, args.beam, args.reach, args.workers, args.seed)
+    args.out.write_bytes(data)
+    print(f"Wrote {args.out} ({len(data)} bytes) from {len(unlock_states())} unlock states "
+          f"in {time.perf_counter() - start:.0f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Check which GoalScore values a strong player can reach from each start.
+
+Usage:
+    python check_goal_feasibility.py
+    python check_goal_feasibility.py --games 20 --beam 16 --workers 4
+    python check_goal_feasibility.py --hand-budget 0.05 --all-pieces
+
+Plays games with the beam-search player (blockudoku_sim.search) for every
+StartingPieceSlots value, using only the starter pieces (or every piece with
+--all-pieces), and reports the fraction of games that reach each score in
+the GoalScore range along with the mean clears. Consumable abilities
+(StartingAbilities) are not used by the player, so the estimate is
+conservative for them.
+
+Also reports the line clears, box clears and pieces a game gets per 1000
+points, as the rate all but the slowest tenth of games beat, and those
+rates over every game played, the way Locations.PER_1000_POINTS uses them
+to place the milestone_pruning cutoff.
+"""
+
+import argparse
+import math
+import sys
+import time
+
+from blockudoku_sim import ALL_PIECES, STARTER_PIECE_NAMES
+from blockudoku_sim.search import SearchConfig, play_games
+from blockudoku_sim.unlocks import UnlockSet
+
+# GoalScore option range, in steps
+GOAL_SCORES = tuple(range(10000, 100001, 10000))
+STARTING_PIECE_SLOTS = (2, 3)
+# Locations.PER_1000_POINTS category -> GameResult field
+RATE_FIELDS = {"line_clear": "lines", "box_clear": "boxes", "piece": "pieces"}
+# Rates are the ones all but this share of games beat
+RATE_QUANTILE = 0.1
+
+
+def low_rate(results, field: str) -> int:
+    """Per-1000-point rate of field that all but RATE_QUANTILE of the scoring games beat, rounded down."""
+    rates = sorted(getattr(result, field) * 1000 / result.score for result in results if result.score)
+    return math.floor(rates[int(RATE_QUANTILE * (len(rates) - 1))]) if rates else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--games", type=int, default=8, help="games per starting configuration")
+    parser.add_argument("--beam", type=int, default=8, help="beam width")
+    parser.add_argument("--hand-budget", type=float, help="seconds per hand; widens the beam while time remains")
+    parser.add_argument("--max-pieces", type=int, default=20000, help="stop a game after this many pieces")
+    parser.add_argument("--all-pieces", action="store_true", help="start with every piece unlocked")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    pieces = frozenset(piece.name for piece in ALL_PIECES) if args.all_pieces else frozenset(STARTER_PIECE_NAMES)
+    config = SearchConfig(args.beam, args.hand_budget)
+    seeds = list(range(args.seed, args.seed + args.games))
+
+    print(f"{'slots':>5} " + "".join(f"{goal // 1000:>5}k" for goal in GOAL_SCORES)
+          + f" {'lines':>7} {'boxes':>7} {'per 1000 points: lines/boxes/pieces':>36} {'games/s':>8}")
+    played = []
+    for slots in STARTING_PIECE_SLOTS:
+        start = time.perf_counter()
+        results = play_games(UnlockSet(pieces, slots), seeds, config, goal_score=max(GOAL_SCORES),
+                             max_pieces=args.max_pieces, workers=args.workers)
+        elapsed = time.perf_counter() - start
+        reach = "".join(f"{sum(r.score >= goal for r in results) / len(results):>6.0%}" for goal in GOAL_SCORES)
+        lines = sum(r.lines for r in results) / len(results)
+        boxes = sum(r.boxes for r in results) / len(results)
+        rates = "/".join(str(low_rate(results, field)) for field in RATE_FIELDS.values())
+        print(f"{slots:>5} {reach} {lines:>7.0f} {boxes:>7.0f} {rates:>36} {len(results) / elapsed:>8.2f}")
+        played += results
+
+    rates = {category: low_rate(played, field) for category, field in RATE_FIELDS.items()}
+    print(f"\nPER_1000_POINTS over all {len(played)} games (p{RATE_QUANTILE * 100:.0f}): {rates}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
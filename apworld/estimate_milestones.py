@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Estimate which milestones are reachable with a given set of unlocks.
+
+Usage:
+    python estimate_milestones.py                      # ladder of unlock sets
+    python estimate_milestones.py --games 2000 --workers 8 --out table.json
+    python estimate_milestones.py --permanents all
+
+Runs batched self-play (blockudoku_sim.playout) for every unlock set on the
+ladder: the starter pieces plus 0..15 more pieces in item order, for each
+hand size. The output table gives, per unlock set, the mean score, lines,
+boxes, pieces and gems of a game and the fraction of games that reached
+each milestone location. Requires numpy.
+
+The table is advisory, for tuning milestones and goal scores by hand: the
+milestone logic in the apworld reads blockupelago/difficulty.bin, which
+build_difficulty.py builds with the stronger beam-search player.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from blockudoku_sim.playout import FREE_HOLD, FREE_MIRROR, FREE_ROTATE, milestone_table, run_playouts, unlock_ladder
+from generate_data import MILESTONES, milestone_name
+
+PERMANENT_SETS = {
+    "none": (frozenset(),),
+    "all": (frozenset({FREE_ROTATE, FREE_MIRROR, FREE_HOLD}),),
+    "each": (frozenset(), frozenset({FREE_ROTATE}), frozenset({FREE_MIRROR}), frozenset({FREE_HOLD}),
+             frozenset({FREE_ROTATE, FREE_MIRROR, FREE_HOLD})),
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--games", type=int, default=512, help="games per unlock set")
+    parser.add_argument("--batch", type=int, default=256, help="games advanced in lockstep per task")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: one per CPU)")
+    parser.add_argument("--slots", type=int, nargs="+", default=[3, 4, 5])
+    parser.add_argument("--permanents", choices=sorted(PERMANENT_SETS), default="none")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, help="write the table here instead of stdout")
+    args = parser.parse_args(argv)
+
+    unlock_sets = unlock_ladder(args.slots, PERMANENT_SETS[args.permanents])
+    start = time.perf_counter()
+    stats = run_playouts(unlock_sets, args.games, args.seed, args.batch, args.workers)
+    elapsed = time.perf_counter() - start
+
+    milestones = {spec.category: [(threshold, milestone_name(spec, threshold)) for threshold in spec.thresholds]
+                  for spec in MILESTONES}
+    table = milestone_table(unlock_sets, stats, milestones)
+    table["seed"] = args.seed
+    text = json.dumps(table, indent=1) + "\n"
+    if args.out:
+        args.out.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+
+    games = len(unlock_sets) * args.games
+    print(f"{games} games over {len(unlock_sets)} unlock sets in {elapsed:.1f}s ({games / elapsed:.0f} games/s)",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
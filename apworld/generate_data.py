@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Generate the Blockupelago item and location ID tables.
+
+Usage:
+    python generate_data.py          # rewrite both outputs
+    python generate_data.py --check  # exit non-zero if either output is stale
+
+This is the single source of truth for item/location names and IDs. It
+writes blockupelago/Data.py (frozen tuples and MappingProxyType tables the
+apworld imports) and the generated blocks of the client's
+app/composables/useArchipelagoItems.ts, so the two sides cannot drift.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DATA_MODULE = SCRIPT_DIR / "blockupelago" / "Data.py"
+CLIENT_MODULE = SCRIPT_DIR.parent / "app" / "composables" / "useArchipelagoItems.ts"
+
+TS_WIDTH = 140
+
+
+class ItemSpec(NamedTuple):
+    name: str
+    code: int
+    classification: str
+    category: str
+    ts_key: str
+
+
+class MilestoneSpec(NamedTuple):
+    category: str
+    base_code: int
+    singular: str
+    plural: str
+    thresholds: Tuple[int, ...]
+    ts_base_key: str
+    ts_array: str
+
+
+# Item ID ranges:
+# Piece Types:     8000001-8000018 (18 different polyomino pieces)
+# Piece Slots:     8002001-8002002 (4th and 5th piece slots)
+# Abilities:       8003001-8003006 (Rotate, Undo, Remove Block, Hold, Mirror, Shrink)
+# Permanents:      8003101-8003103 (free Rotate, Mirror, Hold)
+# Score Boosts:    8004001-8004003 (multipliers)
+ITEMS = (
+    ItemSpec("Single Block", 8000001, "progression", "piece", "SINGLE_BLOCK"),
+    ItemSpec("Domino I", 8000002, "progression", "piece", "DOMINO_I"),
+    ItemSpec("Tromino I", 8000003, "progression", "piece", "TROMINO_I"),
+    ItemSpec("Tromino L", 8000004, "progression", "piece", "TROMINO_L"),
+    ItemSpec("Tetromino I", 8000005, "progression", "piece", "TETROMINO_I"),
+    ItemSpec("Tetromino O", 8000006, "progression", "piece", "TETROMINO_O"),
+    ItemSpec("Tetromino T", 8000007, "progression", "piece", "TETROMINO_T"),
+    ItemSpec("Tetromino L", 8000008, "progression", "piece", "TETROMINO_L"),
+    ItemSpec("Tetromino S", 8000009, "progression", "piece", "TETROMINO_S"),
+    ItemSpec("Pentomino I", 8000010, "progression", "piece", "PENTOMINO_I"),
+    ItemSpec("Pentomino L", 8000011, "progression", "piece", "PENTOMINO_L"),
+    ItemSpec("Pentomino P", 8000012, "progression", "piece", "PENTOMINO_P"),
+    ItemSpec("Pentomino U", 8000013, "progression", "piece", "PENTOMINO_U"),
+    ItemSpec("Pentomino W", 8000014, "progression", "piece", "PENTOMINO_W"),
+    ItemSpec("Pentomino Plus", 8000015, "progression", "piece", "PENTOMINO_PLUS"),
+    ItemSpec("3x3 Corner", 8000016, "progression", "piece", "CORNER_3X3"),
+    ItemSpec("3x3 T-Shape", 8000017, "progression", "piece", "T_SHAPE_3X3"),
+    ItemSpec("3x3 Cross", 8000018, "progression", "piece", "CROSS_3X3"),
+    ItemSpec("4th Piece Slot", 8002001, "progression", "slot", "PIECE_SLOT_4"),
+    ItemSpec("5th Piece Slot", 8002002, "progression", "slot", "PIECE_SLOT_5"),
+    ItemSpec("Rotate Ability", 8003001, "useful", "ability", "ROTATE_ABILITY"),
+    ItemSpec("Undo Ability", 8003002, "useful", "ability", "UNDO_ABILITY"),
+    ItemSpec("Remove Block", 8003003, "useful", "ability", "REMOVE_BLOCK"),
+    ItemSpec("Hold Ability", 8003004, "useful", "ability", "HOLD_ABILITY"),
+    ItemSpec("Mirror Ability", 8003005, "useful", "ability", "MIRROR_ABILITY"),
+    ItemSpec("Shrink Ability", 8003006, "useful", "ability", "SHRINK_ABILITY"),
+    ItemSpec("Permanent Free Rotate", 8003101, "progression", "permanent", "PERMANENT_FREE_ROTATE"),
+    ItemSpec("Permanent Free Mirror", 8003102, "progression", "permanent", "PERMANENT_FREE_MIRROR"),
+    ItemSpec("Permanent Free Hold", 8003103, "progression", "permanent", "PERMANENT_FREE_HOLD"),
+    ItemSpec("Score Multiplier +10%", 8004001, "filler", "multiplier", "SCORE_MULT_10"),
+    ItemSpec("Score Multiplier +25%", 8004002, "useful", "multiplier", "SCORE_MULT_25"),
+    ItemSpec("Score Multiplier +50%", 8004003, "useful", "multiplier", "SCORE_MULT_50"),
+)
+
+# Starter pieces that player begins with (EXCLUDED from item pool)
+STARTER_PIECES = ("Tromino L", "Tetromino T", "Tetromino L")
+
+# Item groups for hint system, by item category
+ITEM_GROUPS = (
+    ("Progression", ("piece",)),
+    ("Abilities", ("ability", "slot")),
+    ("Score Boosts", ("multiplier",)),
+)
+
+# Location ID ranges:
+# Score Milestones: 9000001-9000020 (20 milestones)
+# Line Clears: 9001001-9001030 (30 milestones)
+# Box Clears: 9002001-9002020 (20 milestones)
+# Pieces Placed: 9004001-9004025 (25 milestones)
+# Individual Gems: 9005001-9005100 (100 individual gem checks)
+MILESTONES = (
+    MilestoneSpec("score", 9000000, "Reach {} Points", "Reach {} Points",
+                  (500, 1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000, 9000,
+                   10000, 12500, 15000, 17500, 20000, 25000, 30000, 35000, 40000, 50000),
+                  "SCORE_BASE", "SCORE_MILESTONES"),
+    MilestoneSpec("line_clear", 9001000, "Clear {} Line", "Clear {} Lines",
+                  (1, 3, 5, 10, 15, 20, 25, 30, 40, 50, 60, 75, 90, 100,
+                   125, 150, 175, 200, 250, 300, 350, 400, 450, 500, 600, 700, 800, 900, 1000, 1250),
+                  "LINE_CLEAR_BASE", "LINE_CLEAR_MILESTONES"),
+    MilestoneSpec("box_clear", 9002000, "Clear {} Box", "Clear {} Boxes",
+                  (1, 3, 5, 10, 15, 20, 25, 30, 40, 50, 60, 75, 90, 100, 125, 150, 175, 200, 250, 300),
+                  "BOX_CLEAR_BASE", "BOX_CLEAR_MILESTONES"),
+    MilestoneSpec("piece", 9004000, "Place {} Piece", "Place {} Pieces",
+                  (10, 25, 50, 75, 100, 150, 200, 250, 300, 400, 500, 600, 700, 800, 900,
+                   1000, 1250, 1500, 1750, 2000, 2500, 3000, 3500, 4000, 5000),
+                  "PIECES_BASE", "PIECE_MILESTONES"),
+    MilestoneSpec("gem", 9005000, "Collect Gem #{}", "Collect Gem #{}",
+                  tuple(range(1, 101)), "GEM_BASE", ""),
+)
+
+
+def _py_string(value: str) -> str:
+    return json.dumps(value)
+
+
+def milestone_name(spec: MilestoneSpec, threshold: int) -> str:
+    return (spec.plural if threshold > 1 else spec.singular).format(threshold)
+
+
+# ============================================
+# Python output
+# ============================================
+
+def render_python() -> str:
+    lines = [
+        '"""',
+        "Blockupelago Data",
+        "",
+        "Frozen item and location ID tables.",
+        "Generated by apworld/generate_data.py - do not edit by hand.",
+        '"""',
+        "",
+        "from types import MappingProxyType",
+        "from BaseClasses import ItemClassification",
+        "",
+        "# (name, code, classification, category), in item_table order",
+        "ITEMS = (",
+    ]
+    for item in ITEMS:
+        lines.append(f"    ({_py_string(item.name)}, {item.code}, ItemClassification.{item.classification}, "
+                     f"{_py_string(item.category)}),")
+    lines += [")", ""]
+
+    lines.append("ITEM_NAME_TO_ID = MappingProxyType({name: code for name, code, _, _ in ITEMS})")
+    lines.append("")
+
+    lines.append(f"STARTER_PIECES = frozenset({{{', '.join(_py_string(name) for name in STARTER_PIECES)}}})")
+    lines.append("")
+
+    for category, constant in (("piece", "PIECE_ITEMS"), ("slot", "SLOT_ITEMS"),
+                               ("ability", "ABILITY_ITEMS"), ("permanent", "PERMANENT_ITEMS"),
+                               ("multiplier", "MULTIPLIER_ITEMS")):
+        names = [item.name for item in ITEMS if item.category == category]
+        lines.append(f"{constant} = (")
+        lines += [f"    {_py_string(name)}," for name in names]
+        lines += [")", ""]
+
+    lines.append("ITEM_GROUPS = MappingProxyType({")
+    for group, categories in ITEM_GROUPS:
+        names = [item.name for item in ITEMS if item.category in categories]
+        lines.append(f"    {_py_string(group)}: frozenset({{")
+        lines += [f"        {_py_string(name)}," for name in names]
+        lines.append("    }),")
+    lines += ["})", ""]
+
+    lines.append("# category -> ((threshold, name, code), ...), ascending thresholds")
+    lines.append("MILESTONES = MappingProxyType({")
+    for spec in MILESTONES:
+        lines.append(f"    {_py_string(spec.category)}: (")
+        for index, threshold in enumerate(spec.thresholds, start=1):
+            lines.append(f"        ({threshold}, {_py_string(milestone_name(spec, threshold))}, {spec.base_code + index}),")
+        lines.append("    ),")
+    lines += ["})", ""]
+
+    lines.append("LOCATION_NAME_TO_ID = MappingProxyType({")
+    lines.append("    name: code for rows in MILESTONES.values() for _, name, code in rows")
+    lines += ["})", ""]
+    return "\n".join(lines)
+
+
+# ============================================
+# TypeScript output
+# ============================================
+
+def _ts_string(value: str) -> str:
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _ts_number_array(declaration: str, values: Tuple[int, ...]) -> List[str]:
+    """Lay out a number array the way prettier does for this file."""
+    single = f"{declaration} = [{', '.join(map(str, values))}];"
+    if len(single) <= TS_WIDTH:
+        return [single]
+    lines = [f"{declaration} = ["]
+    current = " "
+    for value in values:
+        token = f" {value},"
+        if len(current) + len(token) > TS_WIDTH:
+            lines.append(current)
+            current = " "
+        current += token
+    lines.append(current)
+    lines.append("];")
+    return lines
+
+
+def render_ts_items() -> List[str]:
+    lines = ["export const AP_ITEMS = {"]
+    section = None
+    headers = {
+        "piece": "// Piece Types (8000xxx)",
+        "slot": "// Piece Slots (8002xxx)",
+        "ability": "// Abilities (8003xxx)",
+        "permanent": "// Permanent Abilities (80031xx)",
+        "multiplier": "// Score Multipliers (8004xxx)",
+    }
+    for item in ITEMS:
+        if item.category != section:
+            if section is not None:
+                lines.append("")
+            lines.append(f"  {headers[item.category]}")
+            section = item.category
+        lines.append(f"  {item.ts_key}: {item.code},")
+    lines += ["} as const;", ""]
+
+    lines.append("// Starter pieces that are always unlocked (should not be sent from AP)")
+    lines.append(f"export const STARTER_PIECES = [{', '.join(_ts_string(name) for name in STARTER_PIECES)}];")
+    lines.append("")
+
+    lines.append("// Map item names to item IDs")
+    lines.append("export const ITEM_NAME_TO_ID: Record<string, number> = {")
+    for item in ITEMS:
+        lines.append(f"  {_ts_string(item.name)}: AP_ITEMS.{item.ts_key},")
+    lines.append("};")
+    return lines
+
+
+def render_ts_locations() -> List[str]:
+    lines = ["export const AP_LOCATIONS = {"]
+    for spec in MILESTONES:
+        lines.append(f"  {spec.ts_base_key}: {spec.base_code}, // +1-{len(spec.thresholds)}")
+    lines += ["} as const;", "", "// Milestone arrays"]
+    for spec in MILESTONES:
+        if not spec.ts_array:
+            continue
+        lines += _ts_number_array(f"export const {spec.ts_array}", spec.thresholds)
+        lines.append("")
+    gems = next(spec for spec in MILESTONES if spec.category == "gem")
+    lines.append("// Max individual gem checks (each gem collected = 1 check)")
+    lines.append(f"export const MAX_GEM_CHECKS = {len(gems.thresholds)};")
+    return lines
+
+
+def _replace_block(source: str, block: str, body: List[str]) -> str:
+    begin = f"// @generated {block} begin - edit apworld/generate_data.py, then run it\n"
+    end = f"// @generated {block} end\n"
+    start = source.index(begin) + len(begin)
+    stop = source.index(end, start)
+    return source[:start] + "\n".join(body) + "\n" + source[stop:]
+
+
+def render_client(source: str) -> str:
+    source = _replace_block(source, "items", render_ts_items())
+    return _replace_block(source, "locations", render_ts_locations())
+
+
+# ============================================
+# Entry point
+# ============================================
+
+def generate(check: bool) -> bool:
+    """Write (or, with check, compare) every generated output. Returns True if up to date."""
+    client_source = CLIENT_MODULE.read_text(encoding="utf-8")
+    outputs: Dict[Path, str] = {
+        DATA_MODULE: render_python(),
+        CLIENT_MODULE: render_client(client_source),
+    }
+    current = {
+        DATA_MODULE: DATA_MODULE.read_text(encoding="utf-8") if DATA_MODULE.exists() else None,
+        CLIENT_MODULE: client_source,
+    }
+
+    up_to_date = True
+    for path, content in outputs.items():
+        if current[path] == content:
+            print(f"  Up to date: {path.name}")
+            continue
+        up_to_date = False
+        if check:
+            print(f"  Stale: {path.name}")
+        else:
+            path.write_text(content, encoding="utf-8", newline="\n")
+            print(f"  Wrote: {path.name}")
+    return up_to_date
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--check", action="store_true", help="only verify the outputs are current")
+    args = parser.parse_args()
+    if not generate(args.check) and args.check:
+        print("\nGenerated tables are stale; run: python generate_data.py")
+        sys.exit(1)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Headless Blockupelago bots for load testing a MultiServer.
+
+Usage:
+    python load_bots.py --local --bots 200 --duration 60
+    python load_bots.py --server ws://localhost:38281 --bots 100 --rate 2
+    python load_bots.py --local --bots 200 --death-link
+    python load_bots.py --local --bots 500 --out load_report.json
+
+Each bot connects as one Blockupelago slot (named --name with {n} replaced
+by 1..--bots, matching the slot names in the room), sends checks for its
+missing locations from location_table at --rate checks per second and
+receives items. A check's round-trip latency is the time from sending
+LocationChecks to the item from that location arriving at whichever bot
+owns it, so only items sent between bots in this process are timed. Bots
+whose slot has the death_link option on (read from slot_data) also join
+DeathLink, send a bounce every --death-interval seconds on average and time
+its arrival at the other DeathLink bots.
+
+--local generates a room of --bots slots with the offline stand-in
+(benchmarks/stand_in) and hosts it in-process, so no Archipelago install or
+external server is needed; --death-link turns death_link on for all of its
+slots. Without --local a real Archipelago core is used when one is
+importable. All bots share one asyncio loop. Requires websockets.
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import random
+import statistics
+import sys
+import time
+import uuid
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import websockets
+
+from benchmarks.harness import install_stand_in, install_stand_in_if_missing
+
+GAME = "Blockupelago"
+VERSION = {"major": 0, "minor": 6, "build": 0, "class": "Version"}
+ITEMS_HANDLING_ALL = 0b111
+CLIENT_GOAL = 30
+DEATH_LINK = "DeathLink"
+# Upper edges of the latency histogram buckets, in ms
+HISTOGRAM_EDGES = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class Stats:
+    """Shared by every bot: pending checks, latencies and counters."""
+
+    def __init__(self):
+        # (sending slot, location id) -> perf_counter time the check was sent
+        self.pending: Dict[Tuple[int, int], float] = {}
+        self.check_latency: List[float] = []
+        self.death_latency: List[float] = []
+        self.connect_time: List[float] = []
+        self.checks_sent = 0
+        self.items_received = 0
+        self.deaths_sent = 0
+        self.death_link_bots = 0
+        self.errors: List[str] = []
+        # Span of sending checks, for throughput
+        self.first_send = float("inf")
+        self.last_send = 0.0
+
+
+class Bot:
+    def __init__(self, name: str, args: argparse.Namespace, stats: Stats, rng: random.Random,
+                 location_ids: FrozenSet[int]):
+        self.name = name
+        self.args = args
+        self.stats = stats
+        self.rng = rng
+        self.location_ids = location_ids
+        self.slot = 0
+        self.missing: List[int] = []
+
+    async def run(self, stop_at: float) -> None:
+        try:
+            await self._run(stop_at)
+        except (OSError, websockets.WebSocketException, ValueError) as error:
+            self.stats.errors.append(f"{self.name}: {type(error).__name__}: {error}")
+
+    async def _run(self, stop_at: float) -> None:
+        start = time.perf_counter()
+        async with websockets.connect(self.args.server, max_size=None, ping_interval=None) as socket:
+            await self._expect(socket, "RoomInfo")
+            await self._send(socket, {"cmd": "Connect", "password": self.args.password, "game": GAME,
+                                      "name": self.name, "uuid": uuid.uuid4().hex, "version": VERSION,
+                                      "items_handling": ITEMS_HANDLING_ALL, "tags": [], "slot_data": True})
+            connected = await self._expect(socket, "Connected")
+            self.stats.connect_time.append(time.perf_counter() - start)
+            self.slot = connected["slot"]
+            self.missing = [location for location in connected["missing_locations"]
+                            if location in self.location_ids]
+            tasks = [asyncio.create_task(self._send_checks(socket, stop_at))]
+            # Like the client, only join DeathLink when the slot's option asks for it
+            if connected.get("slot_data", {}).get("death_link"):
+                await self._send(socket, {"cmd": "ConnectUpdate", "tags": [DEATH_LINK]})
+                self.stats.death_link_bots += 1
+                tasks.append(asyncio.create_task(self._send_deaths(socket, stop_at)))
+            receiver = asyncio.create_task(self._receive(socket))
+            try:
+                await asyncio.gather(*tasks)
+                # Give the last items time to arrive before disconnecting
+                await asyncio.wait([receiver], timeout=self.args.drain)
+            finally:
+                for task in (receiver, *tasks):
+                    task.cancel()
+                # Retrieve every outcome so a failed receiver fails the bot instead of going unnoticed
+                outcomes = await asyncio.gather(receiver, *tasks, return_exceptions=True)
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    raise outcome
+
+    async def _send(self, socket: Any, *packets: Dict[str, Any]) -> None:
+        await socket.send(json.dumps(list(packets), separators=(",", ":")))
+
+    async def _expect(self, socket: Any, command: str) -> Dict[str, Any]:
+        while True:
+            for packet in json.loads(await socket.recv()):
+                if packet["cmd"] == command:
+                    return packet
+                if packet["cmd"] == "ConnectionRefused":
+                    raise ValueError(f"connection refused: {packet.get('errors')}")
+
+    async def _send_checks(self, socket: Any, stop_at: float) -> None:
+        interval = 1 / self.args.rate
+        # Spread bots over the first interval so they don't send in lockstep
+        await asyncio.sleep(self.rng.random() * interval)
+        while self.missing and time.perf_counter() < stop_at:
+            batch, self.missing = self.missing[:self.args.batch], self.missing[self.args.batch:]
+            stats = self.stats
+            now = time.perf_counter()
+            for location in batch:
+                stats.pending[self.slot, location] = now
+            await self._send(socket, {"cmd": "LocationChecks", "locations": batch})
+            stats.checks_sent += len(batch)
+            stats.first_send = min(stats.first_send, now)
+            stats.last_send = now
+            await asyncio.sleep(interval * len(batch))
+        if not self.missing:
+            await self._send(socket, {"cmd": "StatusUpdate", "status": CLIENT_GOAL})
+
+    async def _send_deaths(self, socket: Any, stop_at: float) -> None:
+        while True:
+            wait = self.rng.expovariate(1 / self.args.death_interval)
+            if time.perf_counter() + wait >= stop_at:
+                return
+            await asyncio.sleep(wait)
+            await self._send(socket, {"cmd": "Bounce", "tags": [DEATH_LINK],
+                                      "data": {"time": time.time(), "source": self.name,
+                                               "cause": f"{self.name} ran out of moves"}})
+            self.stats.deaths_sent += 1
+
+    async def _receive(self, socket: Any) -> None:
+        stats = self.stats
+        async for message in socket:
+            now = time.perf_counter()
+            for packet in json.loads(message):
+                if packet["cmd"] == "ReceivedItems":
+                    for item in packet["items"]:
+                        stats.items_received += 1
+                        sent = stats.pending.pop((item["player"], item["location"]), None)
+                        if sent is not None:
+                            stats.check_latency.append(now - sent)
+                elif packet["cmd"] == "Bounced" and DEATH_LINK in packet.get("tags", ()):
+                    data = packet.get("data", {})
+                    if data.get("source") != self.name:
+                        stats.death_latency.append(time.time() - data.get("time", time.time()))
+
+
+def location_ids() -> FrozenSet[int]:
+    """Every Blockupelago location id, from the world package."""
+    from blockupelago.Locations import location_table
+
+    return frozenset(data.code for data in location_table.values() if data.code is not None)
+
+
+def histogram(latencies: List[float]) -> List[Tuple[str, int]]:
+    counts = [0] * (len(HISTOGRAM_EDGES) + 1)
+    for latency in latencies:
+        counts[bisect.bisect_left(HISTOGRAM_EDGES, latency * 1e3)] += 1
+    labels = [f"<= {edge} ms" for edge in HISTOGRAM_EDGES] + [f"> {HISTOGRAM_EDGES[-1]} ms"]
+    return list(zip(labels, counts))
+
+
+def summarize(latencies: List[float]) -> Dict[str, Any]:
+    if not latencies:
+        return {"count": 0}
+    ordered = sorted(latencies)
+
+    def percentile(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1e3, 3)
+
+    return {"count": len(ordered), "mean_ms": round(statistics.mean(ordered) * 1e3, 3),
+            "p50_ms": percentile(0.5), "p90_ms": percentile(0.9), "p99_ms": percentile(0.99),
+            "max_ms": round(ordered[-1] * 1e3, 3), "histogram": histogram(ordered)}
+
+
+def print_summary(label: str, summary: Dict[str, Any]) -> None:
+    if not summary["count"]:
+        print(f"\n{label}: no samples")
+        return
+    print(f"\n{label}: n={summary['count']} mean {summary['mean_ms']:.2f} ms, p50 {summary['p50_ms']:.2f}, "
+          f"p90 {summary['p90_ms']:.2f}, p99 {summary['p99_ms']:.2f}, max {summary['max_ms']:.2f}")
+    peak = max(count for _, count in summary["histogram"])
+    for bucket, count in summary["histogram"]:
+        if count:
+            print(f"  {bucket:>12} {count:>8} {'#' * max(1, round(40 * count / peak))}")
+
+
+async def start_local_room(bots: int, port: int, seed: int, death_link: bool) -> Any:
+    """Generate a room of Blockupelago slots with the stand-in and host it."""
+    from benchmarks.harness import STAGES, build_multiworld, run_stage
+    from Fill import distribute_items_restrictive
+    from MultiServer import Context, serve
+
+    multiworld = build_multiworld(bots, seed, options={"death_link": int(death_link)})
+    for stage in STAGES[:-1]:
+        run_stage(multiworld, stage)
+    distribute_items_restrictive(multiworld)
+    slot_data = {player: multiworld.worlds[player].fill_slot_data() for player in multiworld.player_ids}
+    return await serve(Context(multiworld, slot_data), "localhost", port)
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    server: Optional[Any] = None
+    if args.local:
+        server = await start_local_room(args.bots, args.port, args.seed, args.death_link)
+        args.server = f"ws://localhost:{args.port}"
+    stats = Stats()
+    rng = random.Random(args.seed)
+    ids = location_ids()
+    bots = [Bot(args.name.format(n=n), args, stats, random.Random(rng.getrandbits(64)), ids)
+            for n in range(1, args.bots + 1)]
+    start = time.perf_counter()
+    stop_at = start + args.duration
+    tasks = []
+    for bot in bots:
+        tasks.append(asyncio.create_task(bot.run(stop_at)))
+        if args.connect_stagger:
+            await asyncio.sleep(args.connect_stagger)
+    for bot, outcome in zip(bots, await asyncio.gather(*tasks, return_exceptions=True)):
+        # Bot.run records the expected failures; anything else is reported rather than ending the run
+        if isinstance(outcome, Exception):
+            stats.errors.append(f"{bot.name}: {type(outcome).__name__}: {outcome}")
+    elapsed = time.perf_counter() - start
+    window = max(stats.last_send - stats.first_send, 1e-9)
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+    return {
+        "bots": args.bots, "seconds": round(elapsed, 3), "errors": stats.errors,
+        "checks_sent": stats.checks_sent, "items_received": stats.items_received,
+        "checks_per_second": round(stats.checks_sent / window, 1),
+        "items_per_second": round(stats.items_received / window, 1),
+        "unanswered_checks": len(stats.pending), "death_link_bots": stats.death_link_bots,
+        "deaths_sent": stats.deaths_sent,
+        "connect": summarize(stats.connect_time), "check_to_item": summarize(stats.check_latency),
+        "death_link": summarize(stats.death_latency),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--server", default="ws://localhost:38281")
+    parser.add_argument("--local", action="store_true", help="host a stand-in room in-process")
+    parser.add_argument("--port", type=int, default=38281, help="port for --local")
+    parser.add_argument("--bots", type=int, default=50)
+    parser.add_argument("--name", default="Blockupelago{n}", help="slot name pattern, {n} is the bot number")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--rate", type=float, default=1.0, help="checks per second per bot")
+    parser.add_argument("--batch", type=int, default=1, help="locations per LocationChecks packet")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to keep sending checks")
+    parser.add_argument("--drain", type=float, default=2.0, help="seconds to wait for items after sending")
+    parser.add_argument("--connect-stagger", type=float, default=0.0, help="seconds between bot connects")
+    parser.add_argument("--death-link", action="store_true", help="turn death_link on for every --local slot")
+    parser.add_argument("--death-interval", type=float, default=30.0,
+                        help="mean seconds between deaths per DeathLink bot")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    # The --local room runs on the stand-in's generator and server; against a real
+    # server only location ids are needed, so a real core is kept if there is one
+    if args.local:
+        install_stand_in()
+    else:
+        install_stand_in_if_missing()
+    report = asyncio.run(run(args))
+    print(f"{report['bots']} bots for {report['seconds']:.1f} s: {report['checks_sent']} checks "
+          f"({report['checks_per_second']}/s), {report['items_received']} items ({report['items_per_second']}/s), "
+          f"{report['unanswered_checks']} checks without an item, {len(report['errors'])} errors")
+    for error in report["errors"][:10]:
+        print(f"  {error}")
+    print_summary("connect", report["connect"])
+    print_summary("check -> item", report["check_to_item"])
+    if report["death_link_bots"]:
+        print_summary(f"DeathLink bounce ({report['death_link_bots']} bots)", report["death_link"])
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+        print(f"\nWrote {args.out}")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
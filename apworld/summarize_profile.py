@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Summarize Blockupelago generation profiles.
+
+Usage:
+    BLOCKUPELAGO_PROFILE=profiles python Generate.py     # in Archipelago
+    python summarize_profile.py profiles/                 # every .jsonl in a folder
+    python summarize_profile.py profiles/blockupelago-1234-5678-0.jsonl
+
+Reads the JSON-lines files written by blockupelago/Instrumentation.py and
+prints, per stage, p50/p95/max wall time across players with the median
+allocated blocks and tracemalloc peak (when traced), plus the module import costs.
+Batched stage_* hooks have one record per generation, covering every
+Blockupelago player; their rows split each record's wall time and blocks
+evenly over those players, so n counts players and percentiles are per
+player, while total ms and the tracemalloc peak are of the whole calls.
+"""
+
+import argparse
+import json
+import math
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+STAGE_ORDER = ("create_regions", "stage_create_regions", "create_items", "stage_create_items",
+               "set_rules", "stage_set_rules", "fill_slot_data")
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def load(paths: List[Path]) -> List[dict]:
+    records = []
+    for path in paths:
+        files = sorted(path.glob("*.jsonl")) if path.is_dir() else [path]
+        for file in files:
+            with open(file, encoding="utf-8") as handle:
+                records += [json.loads(line) for line in handle if line.strip()]
+    return records
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("paths", type=Path, nargs="+")
+    args = parser.parse_args(argv)
+
+    records = load(args.paths)
+    generations = [record for record in records if record["event"] == "generation"]
+    stages: Dict[str, List[dict]] = defaultdict(list)
+    for record in records:
+        if record["event"] != "stage":
+            continue
+        players = record.get("players")
+        if players:
+            # One batched call: split its cost evenly over the players it covered
+            share = {"wall_ms": record["wall_ms"] / players, "blocks": record["blocks"] // players}
+            if "peak_kib" in record:
+                share["peak_kib"] = record["peak_kib"]
+            stages[record["stage"]] += [share] * players
+        else:
+            stages[record["stage"]].append(record)
+    if not stages:
+        print("No stage records found.")
+        return 1
+
+    print(f"{len(generations)} generation(s), "
+          f"{sum(generation['blockupelago_players'] for generation in generations)} Blockupelago player(s)\n")
+    print(f"{'stage':<21} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'total ms':>10} "
+          f"{'p50 blocks':>11} {'p50 peak KiB':>13}")
+    ordered = sorted(stages, key=lambda stage: (STAGE_ORDER + (stage,)).index(stage))
+    for stage in ordered:
+        entries = stages[stage]
+        wall = [entry["wall_ms"] for entry in entries]
+        peaks = [entry["peak_kib"] for entry in entries if "peak_kib" in entry]
+        peak = f"{percentile(peaks, 0.5):>13.1f}" if peaks else f"{'-':>13}"
+        print(f"{stage:<21} {len(entries):>6} {percentile(wall, 0.5):>9.3f} {percentile(wall, 0.95):>9.3f} "
+              f"{max(wall):>9.3f} {sum(wall):>10.1f} {percentile([e['blocks'] for e in entries], 0.5):>11} {peak}")
+
+    imports = [record for record in records if record["event"] == "import"]
+    if imports:
+        print("\nimports")
+        for record in imports:
+            peak = f", peak {record['peak_kib']:.1f} KiB" if "peak_kib" in record else ""
+            print(f"  {record['module']:<12} {record['wall_ms']:>8.3f} ms, {record['blocks']} blocks{peak}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+"""
+Tests run the Blockupelago world against the offline Archipelago stand-in
+in benchmarks/stand_in, like the benchmarks do.
+"""
+
+from benchmarks.harness import install_stand_in
+
+install_stand_in()
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from analyze_saves import LOCATION_MILESTONES, Settings, analyze_chunk
+
+SETTINGS = Settings(idle_minutes=10, stall_minutes=2, unblock_minutes=2)
+CODE = next(iter(LOCATION_MILESTONES))
+
+
+def save(**state) -> bytes:
+    return json.dumps({"format": "blockupelago-save", "state": {"ap_mode": True, **state}}).encode()
+
+
+def test_well_formed_save_is_counted():
+    aggregate = analyze_chunk([save(ap_checks=[CODE], ap_check_log=[[CODE, 0], [CODE, 60000]],
+                                    ap_item_log=[[1, 30000]])], SETTINGS)
+    assert (aggregate.saves, aggregate.archipelago, aggregate.unreadable, aggregate.timed) == (1, 1, 0, 1)
+    assert aggregate.checked[CODE] == 1
+
+
+@pytest.mark.parametrize("state", [
+    {"ap_checks": [[1, 2]]},
+    {"ap_checks": 5},
+    {"ap_check_log": [[1]]},
+    {"ap_check_log": [[CODE, 0], [CODE, "later"]]},
+    {"ap_item_log": [[[1], 0]]},
+    {"ap_item_log": 7},
+])
+def test_malformed_save_is_unreadable(state):
+    aggregate = analyze_chunk([save(total_score=100, **state), save()], SETTINGS)
+    # The bad save is skipped whole; the good one after it still counts
+    assert (aggregate.saves, aggregate.archipelago, aggregate.unreadable) == (1, 1, 1)
+    assert sum(aggregate.reached_in_game.values()) == 0
+
+
+def test_non_object_state_is_unreadable():
+    raw = json.dumps({"format": "blockupelago-save", "state": [1, 2]}).encode()
+    assert analyze_chunk([raw, b"not json"], SETTINGS).unreadable == 2
@@ -0,0 +1,13 @@
+"""Batched stage_* generation must match per-player generation."""
+
+import pytest
+
+from benchmarks.bench_batched_stages import build, signature
+
+
+@pytest.mark.parametrize("mixed", [False, True], ids=["default", "mixed"])
+@pytest.mark.parametrize("players", [1, 2, 30])
+def test_batched_matches_per_player(players: int, mixed: bool) -> None:
+    per_player, _ = build(players, batched=False, mixed=mixed)
+    batched, _ = build(players, batched=True, mixed=mixed)
+    assert signature(batched) == signature(per_player)
@@ -0,0 +1,53 @@
+"""The shipped milestone difficulty table and the rules built on it."""
+
+from collections import Counter
+from types import SimpleNamespace
+
+from benchmarks.bench_difficulty import check_coverage, check_table
+from blockupelago.Data import PERMANENT_ITEMS, SLOT_ITEMS
+from blockupelago.Difficulty import (
+    CATEGORIES, HAND_SIZES, HEADER, MAGIC, PERMANENT_COUNTS, RESOURCE, SHAPE_COUNTS, DifficultyTable, pack_table,
+)
+from blockupelago.Rules import PERMANENTS, PIECE_SLOTS, SHAPES, make_milestone_rule, milestone_rules
+from build_apworld import DIFFICULTY_HEADER, DIFFICULTY_MAGIC, DIFFICULTY_RESOURCE, difficulty_table_error
+
+
+def test_table_is_current_and_monotone() -> None:
+    check_table()
+
+
+def test_rules_agree_with_table_for_every_item_combination() -> None:
+    assert check_coverage() > 0
+
+
+def test_unreachable_milestone_waits_for_every_counted_item() -> None:
+    # A table where no unlock state reaches any milestone
+    table = DifficultyTable(pack_table([0] * (SHAPE_COUNTS * len(HAND_SIZES) * PERMANENT_COUNTS * len(CATEGORIES))))
+    for starting_slots in (HAND_SIZES[0], HAND_SIZES[0] + 1):
+        rule = make_milestone_rule(table, 0, 0, 1, starting_slots)
+        assert rule is not None
+        everything = {SHAPES: SHAPE_COUNTS - 1, PIECE_SLOTS: len(SLOT_ITEMS), PERMANENTS: len(PERMANENT_ITEMS)}
+        assert rule(SimpleNamespace(prog_items={1: Counter(everything)}))
+        for counter, count in everything.items():
+            assert not rule(SimpleNamespace(prog_items={1: Counter({**everything, counter: count - 1})}))
+
+
+def test_players_share_milestone_gates() -> None:
+    first, second = milestone_rules(1, 3), milestone_rules(2, 3)
+    assert first.keys() == second.keys()
+    for code, rule in first.items():
+        assert rule.func is second[code].func and (rule.args, second[code].args) == ((1,), (2,))
+
+
+def test_packaging_reads_the_same_header() -> None:
+    assert (DIFFICULTY_RESOURCE, DIFFICULTY_MAGIC, DIFFICULTY_HEADER.format) == (RESOURCE, MAGIC, HEADER.format)
+
+
+def test_packaging_rejects_a_truncated_table(tmp_path) -> None:
+    from blockupelago.Difficulty import get_table
+
+    data = pack_table(get_table().counts)
+    assert difficulty_table_error(tmp_path) is not None
+    for length, ok in ((len(data), True), (len(data) - 1, False), (HEADER.size - 1, False)):
+        (tmp_path / RESOURCE).write_bytes(data[:length])
+        assert (difficulty_table_error(tmp_path) is None) == ok
@@ -0,0 +1,64 @@
+"""The bitboard engine against a literal port of app/utils/blockudoku.ts."""
+
+import random
+from typing import List, Tuple
+
+import pytest
+
+from benchmarks.bench_engine import (
+    Grid, all_orientations, random_grid, ts_calculate_score, ts_can_place_any_piece, ts_can_place_piece,
+    ts_clear_completed, ts_place_piece,
+)
+from blockudoku_sim import (
+    board_from_grid, calculate_score, can_place, can_place_any, clear_completed, grid_from_board,
+    legal_placements, place,
+)
+
+BOARDS = 300
+
+
+@pytest.fixture(scope="module")
+def grids() -> List[Tuple[Grid, random.Random]]:
+    """Random boards with gems and forced complete units, each with its own seeded rng."""
+    rng = random.Random(0)
+    return [(random_grid(rng), random.Random(index)) for index in range(BOARDS)]
+
+
+def test_grid_round_trip(grids) -> None:
+    for grid, _ in grids:
+        # Gems (2) are filled cells on the bitboard, and come back as plain filled cells
+        assert grid_from_board(board_from_grid(grid)) == [[int(cell == 1) for cell in row] for row in grid]
+
+
+def test_clear_completed(grids) -> None:
+    for grid, _ in grids:
+        new_grid, rows, cols, boxes = ts_clear_completed(grid)
+        result = clear_completed(board_from_grid(grid))
+        assert (result.cleared_rows, result.cleared_cols, result.cleared_boxes) == (tuple(rows), tuple(cols),
+                                                                                    tuple(boxes)), grid
+        assert result.board == board_from_grid(new_grid), grid
+
+
+@pytest.mark.parametrize("combo", [1, 1.02, 2 * 1.1, 3 * 1.5])
+def test_calculate_score(combo: float) -> None:
+    for rows in range(4):
+        for cols in range(4):
+            for boxes in range(4):
+                assert calculate_score(rows, cols, boxes, combo) == ts_calculate_score(rows, cols, boxes, combo)
+
+
+def test_placements(grids) -> None:
+    shapes = all_orientations()
+    for grid, rng in grids:
+        board = board_from_grid(grid)
+        hand = rng.sample(shapes, 3)
+        assert can_place_any(board, hand) == ts_can_place_any_piece(grid, hand), (grid, hand)
+        for shape in hand:
+            legal = {(p.row, p.col) for p in legal_placements(board, shape)}
+            for r in range(-1, 10):
+                for c in range(-1, 10):
+                    expected = r >= 0 and c >= 0 and ts_can_place_piece(grid, shape, r, c)
+                    assert can_place(board, shape, r, c) == expected, (grid, shape, r, c)
+                    assert ((r, c) in legal) == expected
+                    if expected:
+                        assert place(board, shape, r, c) == board_from_grid(ts_place_piece(grid, shape, r, c))
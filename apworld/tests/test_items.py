@@ -0,0 +1,42 @@
+"""Item classification fitted to the rules."""
+
+import pytest
+
+from benchmarks.harness import build_multiworld, run_stage
+from blockupelago.Data import STARTER_PIECES
+from blockupelago.Items import PROGRESSION_CANDIDATES, classify
+from blockupelago.Options import GoalScore, StartingPieceSlots
+from blockupelago.Rules import COUNTER_FOR_ITEM, logic_items
+
+
+def test_every_valid_goal_counts_every_unlock() -> None:
+    for goal_score in range(GoalScore.range_start, GoalScore.range_end + 1, 1000):
+        for starting_slots in range(StartingPieceSlots.range_start, StartingPieceSlots.range_end + 1):
+            assert logic_items(goal_score, starting_slots) == frozenset(COUNTER_FOR_ITEM)
+
+
+def test_uncounted_candidates_are_useful() -> None:
+    from BaseClasses import ItemClassification
+
+    uncounted = PROGRESSION_CANDIDATES - logic_items(GoalScore.default, StartingPieceSlots.default)
+    assert uncounted == STARTER_PIECES
+    for name in uncounted:
+        assert classify(name, logic_items(GoalScore.default, StartingPieceSlots.default))[1].classification \
+            == ItemClassification.useful
+
+
+@pytest.mark.parametrize("milestone_logic", [0, 1])
+def test_counted_items_gate_by_milestone_logic(milestone_logic: int) -> None:
+    from BaseClasses import ItemClassification
+
+    expected = ItemClassification.progression if milestone_logic else ItemClassification.progression_skip_balancing
+    multiworld = build_multiworld(2, options={"milestone_logic": milestone_logic})
+    for stage in ("create_regions", "create_items"):
+        run_stage(multiworld, stage)
+    counted = [item for item in multiworld.itempool if item.name in COUNTER_FOR_ITEM]
+    assert len(counted) == 2 * len(COUNTER_FOR_ITEM)
+    assert all(item.classification == expected for item in counted)
+    assert not any(item.advancement for item in multiworld.itempool if item.name not in COUNTER_FOR_ITEM)
+    world = multiworld.worlds[1]
+    assert all(world.create_item(name).classification == expected for name in COUNTER_FOR_ITEM)
+    assert all(world.create_item(name).classification == ItemClassification.useful for name in STARTER_PIECES)
@@ -0,0 +1,43 @@
+"""Loading and rebuilding the memory-mapped placement mask table."""
+
+import mmap
+import os
+
+import pytest
+
+from blockudoku_sim.masks import HEADER, MaskTable, load_table, write_table
+
+
+def stale_table(path) -> None:
+    path.write_bytes(b"\0" * (HEADER.size + 64))
+
+
+def test_rejected_table_releases_its_mapping(tmp_path) -> None:
+    path = tmp_path / "masks.bin"
+    stale_table(path)
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    with pytest.raises(ValueError):
+        MaskTable(buffer)
+    assert buffer.closed
+
+
+def test_stale_table_is_rebuilt_in_place(tmp_path) -> None:
+    path = tmp_path / "masks.bin"
+    stale_table(path)
+    table = load_table(path)
+    try:
+        assert isinstance(table._buffer, mmap.mmap) and table.shapes
+    finally:
+        table.close()
+    assert [entry.name for entry in tmp_path.iterdir()] == ["masks.bin"]
+
+
+def test_failed_swap_removes_the_temp_file(tmp_path, monkeypatch) -> None:
+    def refuse(source, target):
+        raise PermissionError("target is in use")
+
+    monkeypatch.setattr(os, "replace", refuse)
+    with pytest.raises(PermissionError):
+        write_table(tmp_path / "masks.bin")
+    assert not list(tmp_path.iterdir())
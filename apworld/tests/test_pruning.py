@@ -0,0 +1,48 @@
+"""Location pruning and the item pool that matches it."""
+
+from collections import Counter
+
+import pytest
+
+from benchmarks.bench_pruning import MODES, make_options
+from benchmarks.harness import build_multiworld, run_stage
+from blockupelago.Items import filler_item
+
+PLAYERS = 3
+GEM_CHECKS = 20
+
+
+def generate(players: int, goal_score: int, mode: str):
+    multiworld = build_multiworld(players, options=make_options(goal_score, mode, GEM_CHECKS))
+    run_stage(multiworld, "create_regions")
+    run_stage(multiworld, "create_items")
+    return multiworld
+
+
+@pytest.mark.parametrize("goal_score", [10000, 30000, 100000])
+@pytest.mark.parametrize("mode", MODES)
+def test_pool_matches_pruned_locations(mode: str, goal_score: int) -> None:
+    from BaseClasses import ItemClassification, LocationProgressType
+    from Fill import distribute_items_restrictive
+
+    multiworld = generate(PLAYERS, goal_score, mode)
+    unpruned, pruned = (Counter(item.name for item in generate(1, goal_score, reference).itempool)
+                        for reference in ("off", "prune"))
+    assert sum(pruned.values()) < sum(unpruned.values())
+
+    for player in multiworld.player_ids:
+        locations = [location for location in multiworld.get_locations(player) if location.address is not None]
+        excluded = sum(location.progress_type == LocationProgressType.EXCLUDED for location in locations)
+        items = Counter(item.name for item in multiworld.itempool if item.player == player)
+        assert sum(items.values()) == len(locations)
+        if mode == "exclude":
+            # The kept milestones' pool, plus exactly one filler per excluded milestone
+            assert len(locations) == sum(unpruned.values())
+            assert items - pruned == Counter({filler_item: excluded}) and not pruned - items
+        else:
+            assert not excluded and items == (unpruned if mode == "off" else pruned)
+
+    distribute_items_restrictive(multiworld)
+    for location in multiworld.get_locations():
+        if location.progress_type == LocationProgressType.EXCLUDED:
+            assert location.item.classification == ItemClassification.filler
@@ -0,0 +1,31 @@
+"""The per-player rule counters and the Goal gate they drive."""
+
+import pytest
+
+from benchmarks.bench_rules import check_counters, generate
+from benchmarks.harness import build_multiworld, run_stage
+
+
+@pytest.mark.parametrize("milestone_logic", [0, 1])
+def test_counters_follow_collect_and_remove(milestone_logic: int) -> None:
+    from BaseClasses import CollectionState
+
+    multiworld = generate(5, milestone_logic, legacy=False)
+    state = CollectionState(multiworld)
+    state.sweep_for_advancements()
+    assert multiworld.can_beat_game(state)
+    check_counters(multiworld, state)
+
+
+def test_goal_is_gated_by_default() -> None:
+    from BaseClasses import CollectionState
+
+    multiworld = build_multiworld(1)
+    for stage in ("create_regions", "create_items", "set_rules"):
+        run_stage(multiworld, stage)
+    goal = multiworld.get_location("Goal", 1)
+    state = CollectionState(multiworld)
+    assert not goal.access_rule(state)
+    for item in multiworld.itempool:
+        state.collect(item)
+    assert goal.access_rule(state)
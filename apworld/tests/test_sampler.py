@@ -0,0 +1,85 @@
+"""The alias-table piece sampler against the client's weighted generator."""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from benchmarks.bench_sampler import ts_weighted_random_piece
+from blockudoku_sim.pieces import ALL_PIECES, STARTER_PIECE_NAMES
+from blockudoku_sim.sampler import SHAPE_ITEM_NAMES, PieceSampler, alias_table, precompute_tables
+from blockudoku_sim.unlocks import UnlockSet
+
+DRAWS = 200000
+REFERENCE_DRAWS = 10000
+STARTERS = frozenset(STARTER_PIECE_NAMES)
+UNLOCK_SETS = [STARTERS, STARTERS.union(SHAPE_ITEM_NAMES)] + [
+    STARTERS.union(random.Random(size).sample(SHAPE_ITEM_NAMES, size)) for size in (1, 4, 8, 12)]
+INDEX = {piece.name: position for position, piece in enumerate(ALL_PIECES)}
+# Standard normal quantile for p = 0.001, one-sided
+Z_999 = 3.0902
+
+
+def chi_square_limit(degrees: int) -> float:
+    """Wilson-Hilferty approximation of the chi-square critical value at p = 0.001."""
+    return degrees * (1 - 2 / (9 * degrees) + Z_999 * math.sqrt(2 / (9 * degrees))) ** 3
+
+
+def goodness_of_fit(counts: np.ndarray, expected: np.ndarray) -> float:
+    mask = expected > 0
+    return float((((counts - expected) ** 2)[mask] / expected[mask]).sum())
+
+
+def homogeneity(first: np.ndarray, second: np.ndarray) -> float:
+    mask = (first + second) > 0
+    first, second = first[mask], second[mask]
+    total = first + second
+    statistic = 0.0
+    for row in (first, second):
+        expected = total * row.sum() / total.sum()
+        statistic += float(((row - expected) ** 2 / expected).sum())
+    return statistic
+
+
+@pytest.mark.parametrize("size_ratio", [0.0, 0.25, 0.5, 0.8, 1.0])
+@pytest.mark.parametrize("pieces", UNLOCK_SETS, ids=lambda pieces: f"{len(pieces)}-pieces")
+def test_distribution_matches_client(pieces: frozenset, size_ratio: float) -> None:
+    """Chi-square against the client's weights and against draws from the port, failing at p < 0.001."""
+    available = [piece for piece in ALL_PIECES if piece.name in pieces]
+    degrees = len(available) - 1
+    limit = chi_square_limit(degrees) if degrees else 0.0
+    sampler = PieceSampler(seed=len(pieces) * 100 + int(size_ratio * 100), size_ratio=size_ratio)
+    counts = np.bincount(sampler.draw_indices(pieces, (DRAWS,)), minlength=len(ALL_PIECES))
+
+    weights = np.zeros(len(ALL_PIECES))
+    for piece in available:
+        size = sum(cell == 1 for row in piece.shape for cell in row)
+        weights[INDEX[piece.name]] = max(0.1, 1 - abs((size - 1) / 4 - size_ratio))
+    assert goodness_of_fit(counts, weights / weights.sum() * DRAWS) <= limit
+
+    rng = random.Random(7)
+    port = np.zeros(len(ALL_PIECES), dtype=np.int64)
+    for _ in range(REFERENCE_DRAWS):
+        port[INDEX[ts_weighted_random_piece(available, size_ratio, rng).name]] += 1
+    assert homogeneity(counts.astype(float), port.astype(float)) <= limit
+
+
+def test_seed_reproduces_hands() -> None:
+    unlocks = UnlockSet(slots=5)
+    assert np.array_equal(PieceSampler(seed=3).hands(unlocks, 1000), PieceSampler(seed=3).hands(unlocks, 1000))
+
+
+def test_precomputed_tables_match_cached_tables() -> None:
+    tables = precompute_tables(0.5)
+    assert len(tables.columns) == 1 << len(SHAPE_ITEM_NAMES)
+    for pieces in UNLOCK_SETS:
+        flat, cached = tables.table(pieces), alias_table(pieces, 0.5)
+        assert np.array_equal(flat.pieces, cached.pieces)
+        assert np.array_equal(flat.probability, cached.probability)
+        assert np.array_equal(flat.alias, cached.alias)
+    unlocks = UnlockSet(pieces=UNLOCK_SETS[3], slots=4)
+    assert np.array_equal(PieceSampler(seed=5, size_ratio=0.5, tables=tables).hands(unlocks, 100),
+                          PieceSampler(seed=5, size_ratio=0.5).hands(unlocks, 100))
+    with pytest.raises(ValueError):
+        tables.table(frozenset(SHAPE_ITEM_NAMES[:2]))
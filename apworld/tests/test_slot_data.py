@@ -0,0 +1,29 @@
+"""slot_data stays within its size budget and decodes to the slot's tables."""
+
+import json
+import pickle
+import zlib
+
+import pytest
+
+from benchmarks.bench_slot_data import ROOM_BUDGET, SLOT_BUDGET, build_room, check_round_trip
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["default", "mixed"])
+def room(request):
+    multiworld = build_room(200, request.param)
+    return multiworld, {player: multiworld.worlds[player].fill_slot_data() for player in multiworld.player_ids}
+
+
+def test_slot_json_within_budget(room) -> None:
+    _, slot_data = room
+    assert max(len(json.dumps(data, separators=(",", ":"))) for data in slot_data.values()) <= SLOT_BUDGET
+
+
+def test_room_within_budget(room) -> None:
+    _, slot_data = room
+    assert len(zlib.compress(pickle.dumps(slot_data), 9)) / len(slot_data) <= ROOM_BUDGET
+
+
+def test_tables_round_trip(room) -> None:
+    assert check_round_trip(*room) == []